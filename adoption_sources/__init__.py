@@ -1,6 +1,37 @@
 """Adoption pet sources implementing the PetSource interface."""
 
-from adoption_sources.manual import MANUAL_SOURCE_DATA, SourceManual
-from adoption_sources.rescue_groups import SourceRescueGroups
+from adoption_sources.rescue_groups import (
+    RescueGroupsQuery,
+    SourceRescueGroups,
+    SourceRescueGroupsFanOut,
+)
 
-__all__ = ["SourceRescueGroups", "SourceManual", "MANUAL_SOURCE_DATA"]
+# These are only imported when first used: the manual source loads its
+# dataset, and the local inventory isn't needed by a plain network run.
+_LAZY_EXPORTS = {
+    "SourceManual": "adoption_sources.manual",
+    "MANUAL_SOURCE_DATA": "adoption_sources.manual",
+    "load_manual_animals": "adoption_sources.manual",
+    "SourceSQLite": "adoption_sources.sqlite",
+    "RescueGroupsSync": "adoption_sources.sync",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "SourceRescueGroups",
+    "SourceRescueGroupsFanOut",
+    "RescueGroupsQuery",
+    "SourceManual",
+    "MANUAL_SOURCE_DATA",
+    "load_manual_animals",
+    "SourceSQLite",
+    "RescueGroupsSync",
+]
@@ -0,0 +1,90 @@
+"""
+Persistent on-disk cache for adoption API responses.
+
+Adoptable listings change slowly, so frequent scheduled runs can serve
+search results from a local SQLite file and only go to the network once an
+entry has expired.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from adoption_sources.decoding import get_decoder
+
+_loads = get_decoder().loads
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of decoded JSON response bodies.
+
+    Entries expire after `ttl_seconds`. When more than `max_entries` are
+    stored, the least recently used ones are evicted.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 3600, max_entries: int = 500):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " body TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a stable cache key from JSON-serializable query parts."""
+        encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached body for `key`, or None if missing or expired."""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND created_at > ?",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return _loads(row[0])
+
+    def set(self, key: str, body: dict) -> None:
+        """Store `body` under `key`, evicting expired and excess entries."""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, json.dumps(body), now, now),
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE created_at <= ?", (now - self.ttl_seconds,)
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE key NOT IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per call keeps the cache safe to share
+        # between the fan-out worker threads.
+        return sqlite3.connect(self.path, timeout=10)
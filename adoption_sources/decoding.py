@@ -0,0 +1,241 @@
+"""
+JSON decoding for adoption API payloads.
+
+Decoding is pluggable: msgspec is used when installed (decoding search
+responses straight into typed structs that only declare the attributes the
+sources read, so every other attribute is skipped without being built),
+then orjson, then the standard library. Whatever the backend, animals come
+back as the same trimmed ``{"id", "type", "attributes"}`` dicts, plus their
+``relationships`` to locations when the response includes them.
+
+Set CUTEPETSBOSTON_JSON_BACKEND to "msgspec", "orjson" or "json" to force a
+backend.
+"""
+
+import json
+import os
+from typing import Any, Callable
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional.
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional.
+    orjson = None
+
+# The animal attributes the sources actually read. Everything else in the
+# (large) RescueGroups animal schema is dropped at decode time.
+ANIMAL_ATTRIBUTES = (
+    "name",
+    "breedString",
+    "breedPrimary",
+    "descriptionText",
+    "slug",
+    "pictureThumbnailUrl",
+    "ageString",
+    "ageGroup",
+    "sex",
+    "sizeGroup",
+    "updatedDate",
+)
+
+# The attributes read from included ``locations`` resources.
+LOCATION_ATTRIBUTES = ("city", "state", "postalcode")
+
+
+class JsonDecoder:
+    """
+    Decodes generic JSON and RescueGroups animal search responses.
+
+    Every method also accepts buffers such as memoryviews of mapped files.
+    """
+
+    def __init__(self, backend: str, loads: Callable[[bytes | str], Any]):
+        self.backend = backend
+        self.loads = loads
+
+    def decode_animals_response(self, data: bytes | str) -> dict:
+        """Decode a search response, keeping only ANIMAL_ATTRIBUTES per animal."""
+        body = self.loads(data)
+        return {
+            "data": [_trim_animal(animal) for animal in body.get("data") or []],
+            "meta": body.get("meta") or {},
+            "included": [
+                _trim_location(record)
+                for record in body.get("included") or []
+                if record.get("type") == "locations"
+            ],
+        }
+
+    def decode_animals(self, data: bytes | str) -> list[dict]:
+        """Decode a JSON array of animal records (e.g. the manual dataset)."""
+        return [_trim_animal(animal) for animal in self.loads(data)]
+
+    def decode_animal(self, data: bytes | str) -> dict:
+        """Decode a single animal record, e.g. one line of a JSONL file."""
+        return _trim_animal(self.loads(data))
+
+
+if msgspec is not None:
+    _Field = Any | msgspec.UnsetType
+
+    class _Attributes(msgspec.Struct):
+        name: _Field = msgspec.UNSET
+        breedString: _Field = msgspec.UNSET
+        breedPrimary: _Field = msgspec.UNSET
+        descriptionText: _Field = msgspec.UNSET
+        slug: _Field = msgspec.UNSET
+        pictureThumbnailUrl: _Field = msgspec.UNSET
+        ageString: _Field = msgspec.UNSET
+        ageGroup: _Field = msgspec.UNSET
+        sex: _Field = msgspec.UNSET
+        sizeGroup: _Field = msgspec.UNSET
+        updatedDate: _Field = msgspec.UNSET
+
+    class _Ref(msgspec.Struct):
+        id: Any = ""
+
+    class _ToMany(msgspec.Struct):
+        data: list[_Ref] | None = None
+
+    class _Relationships(msgspec.Struct):
+        locations: _ToMany | None = None
+
+    class _Animal(msgspec.Struct):
+        id: Any = ""
+        type: str = "animals"
+        attributes: _Attributes = msgspec.field(default_factory=_Attributes)
+        relationships: _Relationships | None = None
+
+    class _LocationAttributes(msgspec.Struct):
+        city: _Field = msgspec.UNSET
+        state: _Field = msgspec.UNSET
+        postalcode: _Field = msgspec.UNSET
+
+    class _Included(msgspec.Struct):
+        id: Any = ""
+        type: str = ""
+        attributes: _LocationAttributes = msgspec.field(default_factory=_LocationAttributes)
+
+    class _SearchResponse(msgspec.Struct):
+        data: list[_Animal] | None = None
+        meta: dict | None = None
+        included: list[_Included] | None = None
+
+    class MsgspecDecoder(JsonDecoder):
+        """JsonDecoder that decodes animals directly into typed structs."""
+
+        def __init__(self):
+            super().__init__("msgspec", msgspec.json.decode)
+            self._response_decoder = msgspec.json.Decoder(_SearchResponse)
+            self._animals_decoder = msgspec.json.Decoder(list[_Animal])
+            self._animal_decoder = msgspec.json.Decoder(_Animal)
+
+        def decode_animals_response(self, data: bytes | str) -> dict:
+            body = self._response_decoder.decode(data)
+            return {
+                "data": [_struct_to_animal(animal) for animal in body.data or []],
+                "meta": body.meta or {},
+                "included": [
+                    _struct_to_location(record)
+                    for record in body.included or []
+                    if record.type == "locations"
+                ],
+            }
+
+        def decode_animals(self, data: bytes | str) -> list[dict]:
+            return [_struct_to_animal(animal) for animal in self._animals_decoder.decode(data)]
+
+        def decode_animal(self, data: bytes | str) -> dict:
+            return _struct_to_animal(self._animal_decoder.decode(data))
+
+    def _struct_to_animal(animal) -> dict:
+        attrs = animal.attributes
+        trimmed = {
+            "id": animal.id,
+            "type": animal.type,
+            "attributes": {
+                name: value
+                for name in ANIMAL_ATTRIBUTES
+                if (value := getattr(attrs, name)) is not msgspec.UNSET
+            },
+        }
+        locations = animal.relationships and animal.relationships.locations
+        if locations and locations.data:
+            trimmed["relationships"] = _location_refs(ref.id for ref in locations.data)
+        return trimmed
+
+    def _struct_to_location(record) -> dict:
+        attrs = record.attributes
+        return {
+            "id": record.id,
+            "type": "locations",
+            "attributes": {
+                name: value
+                for name in LOCATION_ATTRIBUTES
+                if (value := getattr(attrs, name)) is not msgspec.UNSET
+            },
+        }
+
+
+def _trim_animal(animal: dict) -> dict:
+    attrs = animal.get("attributes") or {}
+    trimmed = {
+        "id": animal.get("id", ""),
+        "type": animal.get("type", "animals"),
+        "attributes": {name: attrs[name] for name in ANIMAL_ATTRIBUTES if name in attrs},
+    }
+    locations = ((animal.get("relationships") or {}).get("locations") or {}).get("data")
+    if locations:
+        trimmed["relationships"] = _location_refs(ref.get("id", "") for ref in locations)
+    return trimmed
+
+
+def _trim_location(record: dict) -> dict:
+    attrs = record.get("attributes") or {}
+    return {
+        "id": record.get("id", ""),
+        "type": "locations",
+        "attributes": {name: attrs[name] for name in LOCATION_ATTRIBUTES if name in attrs},
+    }
+
+
+def _location_refs(ids) -> dict:
+    return {"locations": {"data": [{"type": "locations", "id": id} for id in ids]}}
+
+
+def _json_loads(data):
+    # json.loads only takes str/bytes; copy other buffers (memoryview, mmap).
+    if not isinstance(data, (str, bytes, bytearray)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def available_backends() -> list[str]:
+    backends = []
+    if msgspec is not None:
+        backends.append("msgspec")
+    if orjson is not None:
+        backends.append("orjson")
+    backends.append("json")
+    return backends
+
+
+def get_decoder(backend: str | None = None) -> JsonDecoder:
+    """
+    Return a decoder for `backend`, or the fastest one installed.
+
+    Raises:
+        ValueError: If the requested backend is unknown or not installed.
+    """
+    backend = backend or os.environ.get("CUTEPETSBOSTON_JSON_BACKEND") or available_backends()[0]
+    if backend not in available_backends():
+        raise ValueError(f"JSON backend {backend!r} is not available; choose from {available_backends()}")
+    if backend == "msgspec":
+        return MsgspecDecoder()
+    if backend == "orjson":
+        return JsonDecoder("orjson", orjson.loads)
+    return JsonDecoder("json", _json_loads)
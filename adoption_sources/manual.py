@@ -1,507 +1,67 @@
-"""Manual PetSource returning a fixed set of adoptable pets."""
+"""
+Manual PetSource returning a fixed set of adoptable pets.
+
+The animals live in a data file (``data/manual_animals.json`` by default, or
+CUTEPETSBOSTON_MANUAL_DATA) that is only read the first time it's needed,
+so importing this module costs nothing in production. Files may be a JSON
+array of RescueGroups-style animal records or JSONL with one record per
+line; either is memory-mapped and decoded straight from the mapping.
+
+The module attribute ``MANUAL_SOURCE_DATA`` holds the default dataset's full
+records and is also loaded on first access; SourceManual itself only
+decodes the attributes it reads.
+"""
 
 from __future__ import annotations
 
-import json
+import functools
+import mmap
+import os
 from typing import Iterable, Sequence
 
 from abstractions import AdoptablePet, PetSource
+from adoption_sources.decoding import JsonDecoder, get_decoder
+
+DEFAULT_MANUAL_DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "manual_animals.json")
+
+
+def load_manual_animals(
+    path: str | None = None, decoder: JsonDecoder | None = None, trim: bool = True
+) -> tuple[dict, ...]:
+    """
+    Read animal records from a JSON array or JSONL (``.jsonl``) file.
+
+    With `trim`, each record keeps only the attributes pets are built from
+    (see decoding.ANIMAL_ATTRIBUTES); otherwise records are returned whole.
+    """
+    path = path or os.environ.get("CUTEPETSBOSTON_MANUAL_DATA") or DEFAULT_MANUAL_DATA_PATH
+    decoder = decoder or get_decoder()
+    decode_animal = decoder.decode_animal if trim else decoder.loads
+    decode_animals = decoder.decode_animals if trim else decoder.loads
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if path.endswith(".jsonl"):
+                return tuple(
+                    decode_animal(line)
+                    for line in iter(data.readline, b"")
+                    if line.strip()
+                )
+            with memoryview(data) as view:
+                return tuple(decode_animals(view))
+
+
+@functools.cache
+def _default_animals(trim: bool = True) -> tuple[dict, ...]:
+    return load_manual_animals(trim=trim)
 
-_MANUAL_SOURCE_JSON = r"""
-[
-  {
-    "type": "animals",
-    "id": "10131543",
-    "attributes": {
-      "activityLevel": "Moderately Active",
-      "isAdoptionPending": false,
-      "adultSexesOk": "All",
-      "ageGroup": "Senior",
-      "ageString": "11 Years 7 Months",
-      "birthDate": "2014-06-28T00:00:00Z",
-      "isBirthDateExact": false,
-      "breedString": "Husky / Shepherd / Mixed",
-      "breedPrimary": "Husky",
-      "breedPrimaryId": 152,
-      "breedSecondary": "Shepherd",
-      "breedSecondaryId": 411,
-      "isBreedMixed": true,
-      "isCatsOk": false,
-      "isCourtesyListing": false,
-      "isCurrentVaccinations": true,
-      "descriptionHtml": "<p><span style=\"background-color: rgb(255, 255, 255); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px; caret-color: rgb(77, 71, 81);\">Hi hoomans, my name is Doli, and I&#39;m in the prime of my life at about 11-years-old.&nbsp; Everyone comments on my sky blue eyes and thick husky-type hair that is every shade of gold you can imagine. My tail is like a fox&#39;s - thick, long, and curly. At 50 lbs, I am a fit and healthy girl&nbsp;</span></p>\n\n<div style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">\n<p style=\"margin: 0px; font-stretch: normal; font-size: 14px; line-height: normal; font-family: Arial; color: rgb(60, 54, 64); background-color: rgb(255, 255, 255);\"><br style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px;\" />\n<span style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px; background-color: rgb(255, 255, 255);\">I am very chill and quiet. That doesn&#39;t mean I don&#39;t get excited because I do! When the \"hoomans\" come home, I do a fun little wiggle dance to welcome them! I would be a great fit for a shared wall situation (i.e., like an apartment of townhome) since I rarely bark. I LOVE being outside and like going on walks and car rides. When I am inside, I have the very \"bestest \"manners. I like the security of my crate, but I don&#39;t need to be locked in. I sleep in my crate, on the floor, or in the master walk-in closet that I think is my den. I wouldn&#39;t dream of chewing up anything. Well, maybe I would DREAM it but wouldn&#39;t DO it!</span><br style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px;\" />\n<br style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px;\" />\n<span style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px; background-color: rgb(255, 255, 255);\">I am shy around new people but warm up quickly and have adjusted fine in my foster home. I am not a fan of other animals, but if I see them out, I ignore them and hope they go away!&nbsp;</span></p>\n\n<p style=\"margin: 0px; font-stretch: normal; font-size: 14px; line-height: normal; font-family: Arial; color: rgb(60, 54, 64); background-color: rgb(255, 255, 255);\"><span style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px; background-color: rgb(255, 255, 255);\">More of my pictures can be found here:&nbsp;</span> https://flic.kr/s/aHBqjA21ay<br style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px;\" />\n<br style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px;\" />\n<span style=\"caret-color: rgb(77, 71, 81); color: rgb(77, 71, 81); font-family: &quot;Nexa Regular&quot;, helvetica, arial, sans-serif; font-size: 14px; background-color: rgb(255, 255, 255);\">Hope to meet you soon! Doli</span></p>\n\n<p style=\"margin: 0px; font-stretch: normal; font-size: 14px; line-height: normal; font-family: Arial; color: rgb(60, 54, 64); background-color: rgb(255, 255, 255);\">&nbsp;</p>\n\n<p style=\"margin: 0px; font-stretch: normal; font-size: 14px; line-height: normal; font-family: Arial; color: rgb(60, 54, 64); background-color: rgb(255, 255, 255);\"><span style=\"color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">For inquiries, email inquiry@angelsrescue.org</span></p>\n</div>\n\n<p>An Adoption Application for this dog can be found and submitted online: http://www.angelsrescue.org/adopt/adoption-forms</p>\n\n<p>Be sure to like our Facebook page https://www.facebook.com/angelsrescue.</p><img src=\"https://tracker.rescuegroups.org/pet?10131543\" width=\"0\" height=\"0\" alt=\"\" />",
-      "descriptionText": "Hi hoomans, my name is Doli, and I&#39;m in the prime of my life at about 11-years-old.&nbsp; Everyone comments on my sky blue eyes and thick husky-type hair that is every shade of gold you can imagine. My tail is like a fox&#39;s - thick, long, and curly. At 50 lbs, I am a fit and healthy girl&nbsp;\n\n\n\nI am very chill and quiet. That doesn&#39;t mean I don&#39;t get excited because I do! When the \"hoomans\" come home, I do a fun little wiggle dance to welcome them! I would be a great fit for a shared wall situation (i.e., like an apartment of townhome) since I rarely bark. I LOVE being outside and like going on walks and car rides. When I am inside, I have the very \"bestest \"manners. I like the security of my crate, but I don&#39;t need to be locked in. I sleep in my crate, on the floor, or in the master walk-in closet that I think is my den. I wouldn&#39;t dream of chewing up anything. Well, maybe I would DREAM it but wouldn&#39;t DO it!\n\nI am shy around new people but warm up quickly and have adjusted fine in my foster home. I am not a fan of other animals, but if I see them out, I ignore them and hope they go away!&nbsp;\n\nMore of my pictures can be found here:&nbsp; https://flic.kr/s/aHBqjA21ay\n\nHope to meet you soon! Doli\n\n&nbsp;\n\nFor inquiries, email inquiry@angelsrescue.org\n\n\nAn Adoption Application for this dog can be found and submitted online: http://www.angelsrescue.org/adopt/adoption-forms\n\nBe sure to like our Facebook page https://www.facebook.com/angelsrescue.",
-      "isDogsOk": false,
-      "energyLevel": "Moderate",
-      "isFound": false,
-      "priority": 10,
-      "isHousetrained": true,
-      "isKidsOk": false,
-      "killReason": "0",
-      "name": "Doli",
-      "newPeopleReaction": "Friendly",
-      "pictureCount": 19,
-      "pictureThumbnailUrl": "https://cdn.rescuegroups.org/8099/pictures/animals/10131/10131543/35520048.jpg?width=100",
-      "qualities": [
-        "apartment",
-        "cratetrained",
-        "doesWellInCar",
-        "leashtrained",
-        "olderKidsOnly",
-        "timid"
-      ],
-      "rescueId": "*",
-      "searchString": "Doli   Fawn Female Large *  Dogs Husky / Shepherd / Mixeds",
-      "sex": "Female",
-      "sizeGroup": "Large",
-      "sizeUOM": "Pounds",
-      "slug": "adopt-doli-husky-dog",
-      "specialNeedsDetails": "8/18/23 Returned after 1-month placed on 7-day hold.   3/23/22 - aggressive toward other dog in home;UTD on vaccines",
-      "isSponsorable": false,
-      "trackerimageUrl": "https://tracker.rescuegroups.org/pet?10131543",
-      "videoCount": 0,
-      "videoUrlCount": 0,
-      "vocalLevel": "Quiet",
-      "createdDate": "2016-06-12T16:03:25Z",
-      "updatedDate": "2026-01-28T18:08:16Z"
-    },
-    "relationships": {
-      "breeds": {
-        "data": [
-          {
-            "type": "breeds",
-            "id": "152"
-          },
-          {
-            "type": "breeds",
-            "id": "411"
-          }
-        ]
-      },
-      "colors": {
-        "data": [
-          {
-            "type": "colors",
-            "id": "35"
-          }
-        ]
-      },
-      "species": {
-        "data": [
-          {
-            "type": "species",
-            "id": "8"
-          }
-        ]
-      },
-      "statuses": {
-        "data": [
-          {
-            "type": "statuses",
-            "id": "1"
-          }
-        ]
-      },
-      "locations": {
-        "data": [
-          {
-            "type": "locations",
-            "id": "1000008099"
-          }
-        ]
-      },
-      "orgs": {
-        "data": [
-          {
-            "type": "orgs",
-            "id": "8099"
-          }
-        ]
-      },
-      "pictures": {
-        "data": [
-          {
-            "type": "pictures",
-            "id": "89452172"
-          },
-          {
-            "type": "pictures",
-            "id": "89452180"
-          },
-          {
-            "type": "pictures",
-            "id": "89452175"
-          },
-          {
-            "type": "pictures",
-            "id": "98244962"
-          },
-          {
-            "type": "pictures",
-            "id": "98245040"
-          },
-          {
-            "type": "pictures",
-            "id": "98245041"
-          },
-          {
-            "type": "pictures",
-            "id": "98245045"
-          },
-          {
-            "type": "pictures",
-            "id": "89452168"
-          },
-          {
-            "type": "pictures",
-            "id": "87154693"
-          },
-          {
-            "type": "pictures",
-            "id": "89452174"
-          },
-          {
-            "type": "pictures",
-            "id": "89452178"
-          },
-          {
-            "type": "pictures",
-            "id": "88911016"
-          },
-          {
-            "type": "pictures",
-            "id": "88910877"
-          },
-          {
-            "type": "pictures",
-            "id": "88910966"
-          },
-          {
-            "type": "pictures",
-            "id": "87154684"
-          },
-          {
-            "type": "pictures",
-            "id": "88910967"
-          },
-          {
-            "type": "pictures",
-            "id": "87154687"
-          },
-          {
-            "type": "pictures",
-            "id": "87154694"
-          },
-          {
-            "type": "pictures",
-            "id": "35520048"
-          }
-        ]
-      }
-    }
-  },
-  {
-    "type": "animals",
-    "id": "10133088",
-    "attributes": {
-      "isAdoptionPending": false,
-      "ageGroup": "Senior",
-      "isBirthDateExact": false,
-      "breedString": "Cocker Spaniel / Mixed",
-      "breedPrimary": "Cocker Spaniel",
-      "breedPrimaryId": 123,
-      "isBreedMixed": true,
-      "isCourtesyListing": false,
-      "isCurrentVaccinations": true,
-      "descriptionHtml": "<p>\n<span style=\"font-family: Helvetica; font-size: 14px;\">Meet Kathy: A Sweet,14-year-old, Cocker Spaniel Mix&nbsp;</span>\n</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal; min-height: 17px;\">At a perfect 22 pounds, this lovely senior is the picture of graceful aging - outgoing yet wonderfully calm, with a friendly wag and a bright sparkle in her eyes.</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal;\">&nbsp;</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal;\">Kathy is a true gem for easy, peaceful companionship. She&#39;s crate-trained, handles alone time beautifully (no barking, chewing, or worry), and is making great progress on her potty training. She also walks nicely on a leash - perfect for short leisurely strolls.</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal; min-height: 17px;\">&nbsp;</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal;\">She adores people of all ages, from men and women to young children and grandparents, and she gets along splendidly with small dogs. She&#39;s not one for constant cuddles, but her affectionate presence and happy demeanor bring warmth without demanding it.</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal; min-height: 17px;\">&nbsp;</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal;\">In her golden years, Kathy dreams of a single-level home with no stairs (or just a few) where she can wander about comfortably and enjoy the simple pleasures of life by your side.&nbsp;</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal; min-height: 17px;\">&nbsp;</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal;\">This resilient little lady has so much love left to give. Could your home be the forever haven she&#39;s been waiting for?</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal; min-height: 17px;\">&nbsp;</p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal;\">An Adoption Application for this dog can be found and submitted online.&nbsp;<a href=\"http://www.angelsrescue.org/adopt/adoption-forms\" target=\"_blank\">http://www.angelsrescue.org/adopt/adoption-forms</a>&nbsp;</p>\n\n<p>Please be sure to like our Facebook page:&nbsp;<a href=\"https://www.facebook.com/angelsrescue\" target=\"_blank\">https://www.facebook.com/angelsrescue</a>.&nbsp;</p>\n\n<p><strong>Email&nbsp;inquiry@angelsrescue.org&nbsp;</strong></p>\n\n<p><strong><em>Note:</em></strong><em>&nbsp;Some apartments and neighborhoods have breed restrictions. We verify rental policies and adhere to any regulations. Please ensure you understand those restrictions before choosing a dog.</em></p>\n\n<p style=\"margin: 0px; font-size: 14px; line-height: normal; font-family: Helvetica; font-size-adjust: none; font-kerning: auto; font-variant-alternates: normal; font-variant-ligatures: normal; font-variant-numeric: normal; font-variant-east-asian: normal; font-feature-settings: normal; min-height: 17px;\">&nbsp;</p>\n\n<p>&nbsp;</p><img src=\"https://tracker.rescuegroups.org/pet?10133088\" width=\"0\" height=\"0\" alt=\"\" />",
-      "descriptionText": "\nMeet Kathy: A Sweet,14-year-old, Cocker Spaniel Mix&nbsp;\n\n\nAt a perfect 22 pounds, this lovely senior is the picture of graceful aging - outgoing yet wonderfully calm, with a friendly wag and a bright sparkle in her eyes.\n\n&nbsp;\n\nKathy is a true gem for easy, peaceful companionship. She&#39;s crate-trained, handles alone time beautifully (no barking, chewing, or worry), and is making great progress on her potty training. She also walks nicely on a leash - perfect for short leisurely strolls.\n\n&nbsp;\n\nShe adores people of all ages, from men and women to young children and grandparents, and she gets along splendidly with small dogs. She&#39;s not one for constant cuddles, but her affectionate presence and happy demeanor bring warmth without demanding it.\n\n&nbsp;\n\nIn her golden years, Kathy dreams of a single-level home with no stairs (or just a few) where she can wander about comfortably and enjoy the simple pleasures of life by your side.&nbsp;\n\n&nbsp;\n\nThis resilient little lady has so much love left to give. Could your home be the forever haven she&#39;s been waiting for?\n\n&nbsp;\n\nAn Adoption Application for this dog can be found and submitted online.&nbsp;http://www.angelsrescue.org/adopt/adoption-forms&nbsp;\n\nPlease be sure to like our Facebook page:&nbsp;https://www.facebook.com/angelsrescue.&nbsp;\n\nEmail&nbsp;inquiry@angelsrescue.org&nbsp;\n\nNote:&nbsp;Some apartments and neighborhoods have breed restrictions. We verify rental policies and adhere to any regulations. Please ensure you understand those restrictions before choosing a dog.\n\n&nbsp;\n\n&nbsp;",
-      "isFound": false,
-      "priority": 10,
-      "isKidsOk": true,
-      "killReason": "0",
-      "name": "Kathy",
-      "newPeopleReaction": "Friendly",
-      "pictureCount": 6,
-      "pictureThumbnailUrl": "https://cdn.rescuegroups.org/8099/pictures/animals/10133/10133088/35524291.jpg?width=100",
-      "qualities": [
-        "affectionate",
-        "gentle",
-        "leashtrained",
-        "noLargeDogs"
-      ],
-      "rescueId": "*",
-      "searchString": "Kathy    Female Small *  Dogs Cocker Spaniel / Mixeds",
-      "sex": "Female",
-      "sizeGroup": "Small",
-      "sizeUOM": "Pounds",
-      "slug": "adopt-kathy-cocker-spaniel-dog",
-      "specialNeedsDetails": "Returned on 12/2/25 - Adopter sick;UTD vaccines",
-      "isSponsorable": false,
-      "trackerimageUrl": "https://tracker.rescuegroups.org/pet?10133088",
-      "videoCount": 0,
-      "videoUrlCount": 0,
-      "createdDate": "2016-06-12T17:17:19Z",
-      "updatedDate": "2025-12-24T10:28:16Z"
-    },
-    "relationships": {
-      "breeds": {
-        "data": [
-          {
-            "type": "breeds",
-            "id": "123"
-          }
-        ]
-      },
-      "species": {
-        "data": [
-          {
-            "type": "species",
-            "id": "8"
-          }
-        ]
-      },
-      "statuses": {
-        "data": [
-          {
-            "type": "statuses",
-            "id": "1"
-          }
-        ]
-      },
-      "locations": {
-        "data": [
-          {
-            "type": "locations",
-            "id": "1000008099"
-          }
-        ]
-      },
-      "orgs": {
-        "data": [
-          {
-            "type": "orgs",
-            "id": "8099"
-          }
-        ]
-      },
-      "pictures": {
-        "data": [
-          {
-            "type": "pictures",
-            "id": "102392996"
-          },
-          {
-            "type": "pictures",
-            "id": "102392997"
-          },
-          {
-            "type": "pictures",
-            "id": "102393006"
-          },
-          {
-            "type": "pictures",
-            "id": "35524289"
-          },
-          {
-            "type": "pictures",
-            "id": "35524290"
-          },
-          {
-            "type": "pictures",
-            "id": "35524291"
-          }
-        ]
-      }
-    }
-  },
-  {
-    "type": "animals",
-    "id": "10138270",
-    "attributes": {
-      "activityLevel": "Moderately Active",
-      "isAdoptionPending": false,
-      "adultSexesOk": "All",
-      "ageGroup": "Senior",
-      "ageString": "12 Years 1 Month",
-      "birthDate": "2013-12-04T00:00:00Z",
-      "isBirthDateExact": false,
-      "breedString": "Shar Pei / Boxer / Mixed (short coat)",
-      "breedPrimary": "Shar Pei",
-      "breedPrimaryId": 197,
-      "breedSecondary": "Boxer",
-      "breedSecondaryId": 104,
-      "isBreedMixed": true,
-      "isCatsOk": false,
-      "coatLength": "Short",
-      "isCourtesyListing": false,
-      "isCurrentVaccinations": true,
-      "descriptionHtml": "<p>\n<span style=\"background-color: rgb(255, 255, 255); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif; font-size: small; caret-color: rgb(34, 34, 34);\">Hi there, let me tell you a little about myself. I like nothing better than hanging with my people at home or going on walks. I walk nicely on a leash and love exploring and sniffing while out. I&#39;m a chill girl and very well-behaved in the home.&nbsp;</span>\n</p>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">\n<span style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif; font-size: small; background-color: rgb(255, 255, 255);\">I do all my pottying outside, and although I don&#39;t need to be crated, and I&nbsp;will even hang out in my crate if you need me to. I sleep in my crate in my foster home and love to lay alongside my people on the couch. I am a gentle girl and take my treats so nicely.</span>\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<span style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif; font-size: small; background-color: rgb(255, 255, 255);\">I&#39;m an 11-year-old Sharpei/Boxer mix who is very healthy and weighs around 60 lbs. I&#39;m unsure what it means, but my foster mom always tells me how gorgeous I am.</span>\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<span style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif; font-size: small; background-color: rgb(255, 255, 255);\">I sound just about perfect, don&#39;t I? I like other dogs well enough and don&#39;t mind passing them when we walk, but I would be better in a home without dogs, cats and small children. I can even play in the yard with some, but I&#39;m not particularly eager to share my space or my things with them, so I&#39;m looking for a forever home where I&#39;m the only dog. I should clarify that I don&#39;t mind sharing my things with people; it&#39;s just the other dogs I don&#39;t want to share with.</span>\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<span style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif; font-size: small; background-color: rgb(255, 255, 255);\">And cats? Well, my foster Mom says I&#39;m way too interested in cats to be able to share a home with any.</span>\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<span style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif; font-size: small; background-color: rgb(255, 255, 255);\">I don&#39;t have a lot of experience with young children, so&nbsp;my foster mom thinks I should stick to adults and teens because I may not do well with the energy of a younger child.</span>\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<br style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif;\">\n<span style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: &quot;trebuchet ms&quot;, sans-serif; font-size: small; background-color: rgb(255, 255, 255);\">Anyway, that&#39;s my story. I&#39;d love to meet and get to know you.</span>\n</div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">&nbsp;</div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">&nbsp;</div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">&nbsp;</div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">&nbsp;</div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">See more photos of Cylana by copy and pasting this link into your browser:</div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\"><a href=\"https://flic.kr/s/aHBqjAYW7j\" style=\"font-family: Helvetica; font-size: 12px;\">https://flic.kr/s/aHBqjAYW7j</a></div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">&nbsp;</div>\n\n<div dir=\"auto\" style=\"caret-color: rgb(34, 34, 34); color: rgb(34, 34, 34); font-family: Arial, Helvetica, sans-serif;\">Apply to adopt me at www. angelsrescue.org/adopt and search for me, Cylana!</div>\n\n<p>Make a donation in this dog&#39;s name at http://www.angelsrescue.org/donate. For inquiries, email inquiry@angelsrescue.org.</p>\n\n<p>An Adoption Application for this dog can be found at http://www.angelsrescue.org/pet-forms/dog-adoption-app.asp and can be submitted online.</p>\n\n<p>Be sure to like our Facebook page at https://www.facebook.com/angelsrescue.<br>\n&nbsp;</p>\n\n<p>&nbsp;</p><img src=\"https://tracker.rescuegroups.org/pet?10138270\" width=\"0\" height=\"0\" alt=\"\" />",
-      "descriptionText": "\nHi there, let me tell you a little about myself. I like nothing better than hanging with my people at home or going on walks. I walk nicely on a leash and love exploring and sniffing while out. I&#39;m a chill girl and very well-behaved in the home.&nbsp;\n\n\n\nI do all my pottying outside, and although I don&#39;t need to be crated, and I&nbsp;will even hang out in my crate if you need me to. I sleep in my crate in my foster home and love to lay alongside my people on the couch. I am a gentle girl and take my treats so nicely.\n\n\nI&#39;m an 11-year-old Sharpei/Boxer mix who is very healthy and weighs around 60 lbs. I&#39;m unsure what it means, but my foster mom always tells me how gorgeous I am.\n\n\nI sound just about perfect, don&#39;t I? I like other dogs well enough and don&#39;t mind passing them when we walk, but I would be better in a home without dogs, cats and small children. I can even play in the yard with some, but I&#39;m not particularly eager to share my space or my things with them, so I&#39;m looking for a forever home where I&#39;m the only dog. I should clarify that I don&#39;t mind sharing my things with people; it&#39;s just the other dogs I don&#39;t want to share with.\n\n\nAnd cats? Well, my foster Mom says I&#39;m way too interested in cats to be able to share a home with any.\n\n\nI don&#39;t have a lot of experience with young children, so&nbsp;my foster mom thinks I should stick to adults and teens because I may not do well with the energy of a younger child.\n\n\nAnyway, that&#39;s my story. I&#39;d love to meet and get to know you.\n\n\n&nbsp;\n\n&nbsp;\n\n&nbsp;\n\n&nbsp;\n\nSee more photos of Cylana by copy and pasting this link into your browser:\n\nhttps://flic.kr/s/aHBqjAYW7j\n\n&nbsp;\n\nApply to adopt me at www. angelsrescue.org/adopt and search for me, Cylana!\n\nMake a donation in this dog&#39;s name at http://www.angelsrescue.org/donate. For inquiries, email inquiry@angelsrescue.org.\n\nAn Adoption Application for this dog can be found at http://www.angelsrescue.org/pet-forms/dog-adoption-app.asp and can be submitted online.\n\nBe sure to like our Facebook page at https://www.facebook.com/angelsrescue.\n&nbsp;\n\n&nbsp;",
-      "energyLevel": "Low",
-      "exerciseNeeds": "Low",
-      "isFound": false,
-      "priority": 10,
-      "isHousetrained": true,
-      "killReason": "0",
-      "name": "Cylana",
-      "newPeopleReaction": "Friendly",
-      "pictureCount": 15,
-      "pictureThumbnailUrl": "https://cdn.rescuegroups.org/8099/pictures/animals/10138/10138270/35538798.jpg?width=100",
-      "qualities": [
-        "affectionate",
-        "cratetrained",
-        "intelligent",
-        "leashtrained",
-        "noSmallDogs",
-        "playsToys",
-        "timid"
-      ],
-      "rescueId": "*",
-      "searchString": "Cylana   Black with White Female Large *  Dogs Shar Pei / Boxer / Mixed (short coat)s",
-      "sex": "Female",
-      "sizeCurrent": 60,
-      "sizeGroup": "Large",
-      "sizeUOM": "Pounds",
-      "slug": "adopt-cylana-shar-pei-dog",
-      "specialNeedsDetails": "6/24/23 returned family situation. Fully vetted",
-      "isSponsorable": false,
-      "trackerimageUrl": "https://tracker.rescuegroups.org/pet?10138270",
-      "videoCount": 0,
-      "videoUrlCount": 1,
-      "createdDate": "2016-06-12T20:27:50Z",
-      "updatedDate": "2026-01-28T18:11:09Z"
-    },
-    "relationships": {
-      "breeds": {
-        "data": [
-          {
-            "type": "breeds",
-            "id": "197"
-          },
-          {
-            "type": "breeds",
-            "id": "104"
-          }
-        ]
-      },
-      "colors": {
-        "data": [
-          {
-            "type": "colors",
-            "id": "25"
-          }
-        ]
-      },
-      "species": {
-        "data": [
-          {
-            "type": "species",
-            "id": "8"
-          }
-        ]
-      },
-      "statuses": {
-        "data": [
-          {
-            "type": "statuses",
-            "id": "1"
-          }
-        ]
-      },
-      "locations": {
-        "data": [
-          {
-            "type": "locations",
-            "id": "1000008099"
-          }
-        ]
-      },
-      "orgs": {
-        "data": [
-          {
-            "type": "orgs",
-            "id": "8099"
-          }
-        ]
-      },
-      "pictures": {
-        "data": [
-          {
-            "type": "pictures",
-            "id": "100077476"
-          },
-          {
-            "type": "pictures",
-            "id": "96827212"
-          },
-          {
-            "type": "pictures",
-            "id": "97921793"
-          },
-          {
-            "type": "pictures",
-            "id": "97396761"
-          },
-          {
-            "type": "pictures",
-            "id": "100077475"
-          },
-          {
-            "type": "pictures",
-            "id": "97921794"
-          },
-          {
-            "type": "pictures",
-            "id": "96889290"
-          },
-          {
-            "type": "pictures",
-            "id": "96889291"
-          },
-          {
-            "type": "pictures",
-            "id": "94790546"
-          },
-          {
-            "type": "pictures",
-            "id": "96889289"
-          },
-          {
-            "type": "pictures",
-            "id": "96827111"
-          },
-          {
-            "type": "pictures",
-            "id": "95036173"
-          },
-          {
-            "type": "pictures",
-            "id": "94790547"
-          },
-          {
-            "type": "pictures",
-            "id": "35538797"
-          },
-          {
-            "type": "pictures",
-            "id": "35538798"
-          }
-        ]
-      },
-      "videourls": {
-        "data": [
-          {
-            "type": "videourls",
-            "id": "21246198"
-          }
-        ]
-      }
-    }
-  }
-]
-"""
 
-MANUAL_SOURCE_DATA: Sequence[dict] = tuple(json.loads(_MANUAL_SOURCE_JSON))
+def __getattr__(name: str):
+    # MANUAL_SOURCE_DATA is loaded on first access rather than at import.
+    if name == "MANUAL_SOURCE_DATA":
+        return _default_animals(trim=False)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SourceManual(PetSource):
@@ -512,8 +72,10 @@ class SourceManual(PetSource):
         animals: Sequence[dict] | None = None,
         location_label: str = "Boston, MA",
         species: str = "dog",
+        path: str | None = None,
     ) -> None:
-        self._animals: Sequence[dict] = animals if animals is not None else MANUAL_SOURCE_DATA
+        self._animals: Sequence[dict] | None = animals
+        self._path = path
         self.location_label = location_label
         self.species = species
 
@@ -522,6 +84,8 @@ class SourceManual(PetSource):
         return "Manual"
 
     def fetch_pets(self) -> Iterable[AdoptablePet]:
+        if self._animals is None:
+            self._animals = load_manual_animals(self._path) if self._path else _default_animals()
         for animal in self._animals:
             yield self._build_pet(animal)
 
@@ -535,6 +99,12 @@ class SourceManual(PetSource):
             description=(attrs.get("descriptionText") or "").strip(),
             adoption_url=self._adoption_url(attrs.get("slug")),
             image_url=attrs.get("pictureThumbnailUrl"),
+            age_string=attrs.get("ageString"),
+            sex=attrs.get("sex"),
+            size_group=attrs.get("sizeGroup"),
+            pet_id=animal.get("id"),
+            updated_at=attrs.get("updatedDate"),
+            age_group=attrs.get("ageGroup"),
         )
 
     @staticmethod
@@ -548,4 +118,6 @@ class SourceManual(PetSource):
         return None
 
 
-__all__ = ["SourceManual", "MANUAL_SOURCE_DATA"]
+# MANUAL_SOURCE_DATA is left out: it is provided by __getattr__ above, and
+# ``adoption_sources`` re-exports it.
+__all__ = ["SourceManual", "load_manual_animals"]
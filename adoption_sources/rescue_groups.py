@@ -8,12 +8,18 @@ import html
 import logging
 import os
 import re
-from typing import Iterator
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, Mapping, Sequence
 
 import requests
 
 from abstractions import AdoptablePet, PetSource
+from adoption_sources.cache import ResponseCache
+from adoption_sources.decoding import ANIMAL_ATTRIBUTES, LOCATION_ATTRIBUTES, JsonDecoder, get_decoder
+from http_client import get_session
+from retry import RetryPolicy, get_retry_policy
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,24 @@ class SourceRescueGroups(PetSource):
     Fetches adoptable pets from RescueGroups.org API.
 
     Requires CUTEPETSBOSTON_RESCUEGROUPS_API_KEY environment variable or api_key constructor arg.
+
+    Results are fetched one page (``limit`` animals) at a time and yielded as
+    each page arrives. By default only the first page is read; pass
+    ``max_pages=None`` to walk every page reported by the API, and
+    ``prefetch=True`` to request the next page in the background while the
+    current one is being consumed. When scanning many pages, use a stable
+    ``sort`` (e.g. ``"animals.id"``) so pages don't overlap.
+
+    Pass a ResponseCache to serve repeated queries from disk until they expire.
+
+    Only the attributes listed in ``fields`` are requested (a JSON:API sparse
+    fieldset; ``None`` asks for all of them), and only the related resources
+    named in ``include``: by default each animal's ``locations``, whose city
+    and state label the pet. ``age_groups``, ``size_groups``,
+    ``sexes`` and ``updated_since`` narrow the search on the server, e.g.
+    ``age_groups=("Senior",)`` or ``updated_since=datetime(2025, 1, 1)``.
+    ``updated_within`` is a rolling window instead, e.g. ``timedelta(days=7)``,
+    measured back from the time of each fetch.
     """
 
     BASE_URL = "https://api.rescuegroups.org/v5/public/animals/search"
@@ -34,7 +58,21 @@ class SourceRescueGroups(PetSource):
         radius_miles: int = 50,
         species: str = "dogs",  # "dogs" or "cats"
         limit: int = 25,
-        location_label: str = "Boston, MA",  # For display purposes
+        location_label: str | None = "Boston, MA",  # Used when an animal has no city
+        max_pages: int | None = 1,  # None walks every page
+        prefetch: bool = False,
+        sort: str = "random",
+        session: requests.Session | None = None,
+        cache: ResponseCache | None = None,
+        decoder: JsonDecoder | None = None,
+        fields: Sequence[str] | None = ANIMAL_ATTRIBUTES,
+        include: Sequence[str] = ("locations",),
+        age_groups: Sequence[str] = (),  # e.g. "Baby", "Young", "Adult", "Senior"
+        size_groups: Sequence[str] = (),  # e.g. "Small", "Medium", "Large", "X-Large"
+        sexes: Sequence[str] = (),  # "Male" or "Female"
+        updated_since: datetime | str | None = None,
+        updated_within: timedelta | None = None,
+        retry: RetryPolicy | None = None,
     ):
         self._api_key = api_key or os.environ.get("CUTEPETSBOSTON_RESCUEGROUPS_API_KEY")
         self.postal_code = postal_code
@@ -42,6 +80,20 @@ class SourceRescueGroups(PetSource):
         self.species = species
         self.limit = limit
         self.location_label = location_label
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self.sort = sort
+        self._session = session or get_session()
+        self._cache = cache
+        self._decoder = decoder or get_decoder()
+        self.fields = tuple(fields) if fields is not None else None
+        self.include = tuple(include)
+        self.age_groups = tuple(age_groups)
+        self.size_groups = tuple(size_groups)
+        self.sexes = tuple(sexes)
+        self.updated_since = updated_since
+        self.updated_within = updated_within
+        self._retry = retry or get_retry_policy()
 
     @property
     def source_name(self) -> str:
@@ -52,7 +104,7 @@ class SourceRescueGroups(PetSource):
         Fetch available pets from RescueGroups.org.
 
         Yields:
-            AdoptablePet objects for each available pet.
+            AdoptablePet objects for each available pet, as each page arrives.
 
         Raises:
             ValueError: If API key is not configured.
@@ -63,45 +115,145 @@ class SourceRescueGroups(PetSource):
                 "RescueGroups API key not configured. "
                 "Set CUTEPETSBOSTON_RESCUEGROUPS_API_KEY environment variable."
             )
-        
-        url = (
-            f"{self.BASE_URL}/available/{self.species}/haspic"
-            f"?include=breeds,locations"
-            f"&sort=random"
-            f"&limit={self.limit}"
+
+        logger.info(
+            f"Fetching {self.species} from RescueGroups within {self.radius_miles} miles of {self.postal_code}"
         )
+
+        for body in self._iter_pages():
+            locations = _index_locations(body.get("included") or [])
+            for animal in body.get("data", []):
+                pet = self._parse_animal(animal, locations)
+                if pet:
+                    yield pet
+
+    def _iter_pages(self) -> Iterator[dict]:
+        """Yield the decoded body of each result page, in order."""
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            page = 1
+            next_body = self._schedule_page(executor, page)
+            while next_body is not None:
+                body = next_body()
+                next_body = None
+                if self._has_more_pages(body, page):
+                    page += 1
+                    next_body = self._schedule_page(executor, page)
+                yield body
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_page(
+        self, executor: ThreadPoolExecutor | None, page: int
+    ) -> Callable[[], dict]:
+        """Return a callable producing the body of ``page``.
+
+        With an executor the request starts immediately in the background.
+        """
+        if executor is None:
+            return lambda: self._fetch_page(page)
+        return executor.submit(self._fetch_page, page).result
+
+    def _has_more_pages(self, body: dict, page: int) -> bool:
+        if self.max_pages is not None and page >= self.max_pages:
+            return False
+        if not body.get("data"):
+            return False
+        total_pages = body.get("meta", {}).get("pages")
+        return bool(total_pages) and page < total_pages
+
+    def _fetch_page(self, page: int) -> dict:
+        """Request a single page of search results."""
+        url = f"{self.BASE_URL}/available/{self.species}/haspic?{self._query_string(page)}"
         headers = {
             "Content-Type": "application/vnd.api+json",
             "Authorization": self._api_key,
         }
-        payload = json.dumps({
+        payload = {
             "data": {
                 "filterRadius": {
                     "miles": self.radius_miles,
                     "postalcode": self.postal_code,
-                }
+                },
             }
-        })
-
-
-        logger.info(
-            f"Fetching {self.species} from RescueGroups within {self.radius_miles} miles of {self.postal_code}"
+        }
+        filters = self._filters()
+        if filters:
+            payload["data"]["filters"] = filters
+
+        cache_key = ResponseCache.make_key(url, payload)
+        if self._cache:
+            body = self._cache.get(cache_key)
+            if body is not None:
+                logger.info(f"Serving RescueGroups page {page} from cache")
+                return body
+
+        # Searches are read-only, so any transient failure is safe to retry.
+        response = self._retry.call(
+            self._session.post, url, json=payload, headers=headers, idempotent=True
         )
-
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
         response.raise_for_status()
 
-        data = response.json().get("data", [])
-        print(data)
-        logger.info(f"Received {len(data)} pets from RescueGroups")
+        # Decode straight from the raw bytes, dropping attributes we never read.
+        body = self._decoder.decode_animals_response(response.content)
+        logger.info(f"Received {len(body.get('data', []))} pets from RescueGroups (page {page})")
+        if self._cache:
+            self._cache.set(cache_key, body)
+        return body
+
+    def _query_string(self, page: int) -> str:
+        params = []
+        if self.include:
+            params.append(f"include={','.join(self.include)}")
+        if self.fields is not None:
+            params.append(f"fields[animals]={','.join(self.fields)}")
+            if "locations" in self.include:
+                params.append(f"fields[locations]={','.join(LOCATION_ATTRIBUTES)}")
+        params += [f"sort={self.sort}", f"limit={self.limit}", f"page={page}"]
+        return "&".join(params)
+
+    def _filters(self) -> list[dict]:
+        """Server-side search filters, in the API's fieldName/operation/criteria form."""
+        filters = [
+            {"fieldName": f"animals.{name}", "operation": "equal", "criteria": list(values)}
+            for name, values in (
+                ("ageGroup", self.age_groups),
+                ("sizeGroup", self.size_groups),
+                ("sex", self.sexes),
+            )
+            if values
+        ]
+        updated_since = self._updated_cutoff()
+        if updated_since:
+            filters.append({
+                "fieldName": "animals.updatedDate",
+                "operation": "greaterthan",
+                "criteria": _format_timestamp(updated_since),
+            })
+        return filters
+
+    def _updated_cutoff(self) -> datetime | str | None:
+        """The later of updated_since and the start of the updated_within window."""
+        if self.updated_within is None:
+            return self.updated_since
+        # Rounded down to the hour so the request, and so the response cache
+        # key, stays the same for every fetch within that hour.
+        window_start = (datetime.now(timezone.utc) - self.updated_within).replace(
+            minute=0, second=0, microsecond=0
+        )
+        if not self.updated_since:
+            return window_start
+        return max(self.updated_since, window_start, key=_as_datetime)
 
-        for animal in data:
-            pet = self._parse_animal(animal)
-            if pet:
-                yield pet
+    def _parse_animal(
+        self, animal: dict, locations: Mapping[str, str] | None = None
+    ) -> AdoptablePet | None:
+        """
+        Parse a single animal record from the API response.
 
-    def _parse_animal(self, animal: dict) -> AdoptablePet | None:
-        """Parse a single animal record from the API response."""
+        `locations` maps included location ids to their "City, ST" labels.
+        """
         try:
             attrs = animal.get("attributes", {})
             animal_id = animal.get("id", "")
@@ -129,7 +281,7 @@ class SourceRescueGroups(PetSource):
                 name=name,
                 species=species,
                 breed=breed,
-                location=self.location_label,
+                location=self._get_location(animal, locations or {}),
                 description=description,
                 adoption_url=adoption_url,
                 image_url=image_url,
@@ -137,6 +289,8 @@ class SourceRescueGroups(PetSource):
                 sex=attrs.get("sex"),
                 size_group=attrs.get("sizeGroup"),
                 pet_id=animal_id,
+                updated_at=attrs.get("updatedDate"),
+                age_group=attrs.get("ageGroup"),
             )
         except Exception as e:
             logger.warning(f"Failed to parse animal {animal.get('id', 'unknown')}: {e}")
@@ -179,6 +333,15 @@ class SourceRescueGroups(PetSource):
 
         return text
 
+    def _get_location(self, animal: dict, locations: Mapping[str, str]) -> str:
+        """The animal's own location, falling back to the query's label."""
+        refs = ((animal.get("relationships") or {}).get("locations") or {}).get("data") or []
+        for ref in refs:
+            label = locations.get(ref.get("id"))
+            if label:
+                return label
+        return self.location_label or self.postal_code
+
     def _get_image_url(self, attrs: dict) -> str | None:
         """Get the best available image URL."""
         thumbnail = attrs.get("pictureThumbnailUrl")
@@ -186,3 +349,163 @@ class SourceRescueGroups(PetSource):
             # Request a larger image instead of the 100px thumbnail
             return re.sub(r"\?width=\d+", "?width=800", thumbnail)
         return None
+
+
+def _index_locations(included: Iterable[dict]) -> dict[str, str]:
+    """Map each included location's id to its "City, ST" label."""
+    labels = {}
+    for record in included:
+        if record.get("type") != "locations":
+            continue
+        attrs = record.get("attributes") or {}
+        city = (attrs.get("city") or "").strip()
+        state = (attrs.get("state") or "").strip()
+        if city:
+            labels[record.get("id")] = f"{city}, {state}" if state else city
+    return labels
+
+
+def _as_datetime(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _format_timestamp(value: datetime | str) -> str:
+    if isinstance(value, str):
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass(frozen=True)
+class RescueGroupsQuery:
+    """A single (species, postal code, radius) search."""
+
+    species: str = "dogs"  # "dogs" or "cats"
+    postal_code: str = "02108"
+    radius_miles: int = 50
+    location_label: str | None = "Boston, MA"  # Fallback for animals without a location
+
+
+# Readable fallback labels for postal codes given without one.
+POSTAL_CODE_LABELS = {"02108": "Boston, MA"}
+
+
+def product_queries(
+    species: Iterable[str],
+    postal_codes: Iterable[str] | Mapping[str, str],
+    radius_miles: int = 50,
+) -> list[RescueGroupsQuery]:
+    """
+    Build one query per (species, postal code) pair.
+
+    postal_codes may be a mapping of postal code to display label. Pets are
+    labelled with their shelter's city either way; the label is only used for
+    animals without one. Plain codes are labelled from POSTAL_CODE_LABELS,
+    or fall back to the code itself.
+    """
+    if isinstance(postal_codes, Mapping):
+        labels = dict(postal_codes)
+    else:
+        labels = {code: POSTAL_CODE_LABELS.get(code) for code in postal_codes}
+    return [
+        RescueGroupsQuery(
+            species=kind,
+            postal_code=code,
+            radius_miles=radius_miles,
+            location_label=label,
+        )
+        for kind in species
+        for code, label in labels.items()
+    ]
+
+
+class SourceRescueGroupsFanOut(PetSource):
+    """
+    Runs several RescueGroups searches concurrently and merges the results.
+
+    Each query is executed by its own SourceRescueGroups on a bounded worker
+    pool, so the whole fetch takes roughly as long as the slowest query.
+    Pets are yielded as each query completes and de-duplicated by pet_id,
+    since overlapping radii often return the same animal more than once.
+
+    A query that fails is logged and skipped; the error is only raised if
+    every query fails.
+    """
+
+    def __init__(
+        self,
+        queries: Iterable[RescueGroupsQuery],
+        api_key: str | None = None,
+        max_workers: int = 4,
+        session: requests.Session | None = None,
+        **source_kwargs,
+    ):
+        self.queries = list(queries)
+        self.max_workers = max_workers
+        self._sources = [
+            SourceRescueGroups(
+                api_key=api_key,
+                postal_code=query.postal_code,
+                radius_miles=query.radius_miles,
+                species=query.species,
+                location_label=query.location_label,
+                session=session,
+                **source_kwargs,
+            )
+            for query in self.queries
+        ]
+
+    @classmethod
+    def from_product(
+        cls,
+        species: Iterable[str] = ("dogs", "cats"),
+        postal_codes: Iterable[str] | Mapping[str, str] = ("02108",),
+        radius_miles: int = 50,
+        **kwargs,
+    ) -> "SourceRescueGroupsFanOut":
+        """
+        Build one query per (species, postal code) pair.
+
+        postal_codes may be a mapping of postal code to display label.
+        """
+        return cls(product_queries(species, postal_codes, radius_miles), **kwargs)
+
+    @property
+    def source_name(self) -> str:
+        return f"RescueGroups ({len(self.queries)} queries)"
+
+    def fetch_pets(self) -> Iterator[AdoptablePet]:
+        if not self._sources:
+            return
+
+        seen_ids = set()
+        errors = []
+        workers = min(self.max_workers, len(self._sources))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(lambda source: list(source.fetch_pets()), source): source
+                for source in self._sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    pets = future.result()
+                except Exception as exc:
+                    logger.warning(
+                        f"RescueGroups query for {source.species} near {source.postal_code} failed: {exc}"
+                    )
+                    errors.append(exc)
+                    continue
+
+                for pet in pets:
+                    if pet.pet_id:
+                        if pet.pet_id in seen_ids:
+                            continue
+                        seen_ids.add(pet.pet_id)
+                    yield pet
+
+        if len(errors) == len(self._sources):
+            raise errors[0]
@@ -0,0 +1,272 @@
+"""
+Local SQLite inventory of adoptable pets, exposed as a PetSource.
+
+Pets are stored one row each, keyed by the same identity PostedHistory uses.
+Rows can be tagged with the origin (e.g. a RescueGroups query) that last
+reported them, so a sync can remove pets an origin no longer lists without
+touching pets that another origin still does.
+
+Any PetSource can be copied in with materialize(). The columns pets are
+usually filtered on (species, location, size group, age group, sex, whether
+they have a photo and when they were last posted) are indexed, and query(),
+count(), counts() and sample() turn their criteria into a WHERE clause so
+the filtering happens in SQLite rather than in a Python loop.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import fields
+from typing import Collection, Iterable, Iterator, Mapping
+
+from abstractions import AdoptablePet, PetSource
+from posted_history import SECONDS_PER_DAY, PostedHistory
+
+logger = logging.getLogger(__name__)
+
+PET_COLUMNS = tuple(f.name for f in fields(AdoptablePet))
+# Columns that query() criteria may filter on by value.
+FILTER_COLUMNS = ("species", "location", "size_group", "age_group", "sex")
+INDEXED_COLUMNS = FILTER_COLUMNS + ("has_image", "last_posted_at")
+_ORDER_BY = {"rowid": "rowid", "updated_at": "updated_at DESC", "random": "RANDOM()"}
+
+
+class SourceSQLite(PetSource):
+    """
+    PetSource that serves pets from a local SQLite database.
+
+    fetch_pets() yields every stored pet, or only those matching `filters`
+    (query() keyword arguments, e.g. ``{"species": "dog", "has_image": True}``).
+    """
+
+    def __init__(self, path: str, name: str = "Local inventory", filters: Mapping | None = None):
+        self.path = path
+        self.name = name
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pets ("
+                " key TEXT PRIMARY KEY,"
+                + "".join(f" {column} TEXT," for column in PET_COLUMNS)
+                + " has_image INTEGER NOT NULL DEFAULT 0,"
+                " last_posted_at REAL,"
+                " synced_at REAL NOT NULL)"
+            )
+            self._add_missing_columns(conn)
+            for column in INDEXED_COLUMNS:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS pets_{column} ON pets ({column})")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pet_origins ("
+                " origin TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " PRIMARY KEY (origin, key))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                " name TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL)"
+            )
+        self.filters = dict(filters or {})
+
+    @property
+    def source_name(self) -> str:
+        return self.name
+
+    def fetch_pets(self) -> Iterator[AdoptablePet]:
+        yield from self.query(**self.filters)
+
+    def query(
+        self,
+        limit: int | None = None,
+        order_by: str = "rowid",
+        now: float | None = None,
+        **criteria,
+    ) -> Iterator[AdoptablePet]:
+        """
+        Yield the stored pets matching `criteria`.
+
+        Criteria:
+            species, location, size_group, age_group, sex: a value, or a
+                collection of accepted values.
+            has_image: True or False.
+            not_posted_within_days: skip pets posted more recently than this.
+
+        `order_by` is "rowid" (insertion order), "updated_at" (newest first)
+        or "random".
+        """
+        where, params = self._where(criteria, now)
+        order = _ORDER_BY[order_by]
+        sql = f"SELECT {', '.join(PET_COLUMNS)} FROM pets{where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            for row in conn.execute(sql, params):
+                yield AdoptablePet(*row)
+
+    def count(self, now: float | None = None, **criteria) -> int:
+        where, params = self._where(criteria, now)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM pets{where}", params).fetchone()[0]
+
+    def counts(self, column: str, now: float | None = None, **criteria) -> dict[str | None, int]:
+        """Number of matching pets per distinct value of `column`."""
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"Can't group by {column!r}; choose from {FILTER_COLUMNS}")
+        where, params = self._where(criteria, now)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT {column}, COUNT(*) FROM pets{where} GROUP BY {column}", params
+            )
+            return dict(rows.fetchall())
+
+    def sample(self, k: int = 1, now: float | None = None, **criteria) -> list[AdoptablePet]:
+        """Pick up to `k` matching pets uniformly at random."""
+        return list(self.query(limit=k, order_by="random", now=now, **criteria))
+
+    def materialize(self, source: PetSource, origin: str | None = None, batch_size: int = 500) -> int:
+        """Copy every pet from `source` into the store; returns how many were stored."""
+        stored = 0
+        batch = []
+        for pet in source.fetch_pets():
+            batch.append(pet)
+            if len(batch) >= batch_size:
+                stored += len(self.upsert(batch, origin=origin))
+                batch = []
+        if batch:
+            stored += len(self.upsert(batch, origin=origin))
+        return stored
+
+    def mark_posted(self, pet: AdoptablePet, now: float | None = None) -> None:
+        """Record that `pet` was just posted (see not_posted_within_days)."""
+        key = PostedHistory.key_for(pet)
+        if key is None:
+            return
+        posted_at = time.time() if now is None else now
+        with closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE pets SET last_posted_at = ? WHERE key = ?", (posted_at, key))
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM pets").fetchone()[0]
+
+    def upsert(self, pets: Iterable[AdoptablePet], origin: str | None = None) -> list[str]:
+        """
+        Insert or replace `pets`, optionally tagging them with `origin`.
+
+        Returns the keys of the stored pets. Pets without a pet_id or
+        adoption_url can't be identified across runs and are skipped.
+        """
+        now = time.time()
+        rows = []
+        for pet in pets:
+            key = PostedHistory.key_for(pet)
+            if key is None:
+                logger.warning(f"Skipping {pet.name}: no pet_id or adoption_url to key it by")
+                continue
+            rows.append((key, *(getattr(pet, column) for column in PET_COLUMNS), bool(pet.image_url), now))
+
+        columns = ("key", *PET_COLUMNS, "has_image", "synced_at")
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        with closing(self._connect()) as conn, conn:
+            # An upsert rather than INSERT OR REPLACE keeps last_posted_at.
+            conn.executemany(
+                f"INSERT INTO pets ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+                f" ON CONFLICT (key) DO UPDATE SET {updates}",
+                rows,
+            )
+            if origin is not None:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO pet_origins (origin, key) VALUES (?, ?)",
+                    [(origin, row[0]) for row in rows],
+                )
+        return [row[0] for row in rows]
+
+    def prune(self, origin: str, keep: Iterable[str]) -> int:
+        """
+        Forget the pets `origin` no longer reports, i.e. those not in `keep`.
+
+        A pet is only deleted once no other origin lists it. Returns the
+        number of pets deleted.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("CREATE TEMP TABLE keep (key TEXT PRIMARY KEY)")
+            conn.executemany("INSERT OR IGNORE INTO keep (key) VALUES (?)", ((key,) for key in keep))
+            dropped = [
+                key for (key,) in conn.execute(
+                    "SELECT key FROM pet_origins WHERE origin = ? AND key NOT IN (SELECT key FROM keep)",
+                    (origin,),
+                )
+            ]
+            conn.executemany(
+                "DELETE FROM pet_origins WHERE origin = ? AND key = ?",
+                [(origin, key) for key in dropped],
+            )
+            deleted = 0
+            for key in dropped:
+                deleted += conn.execute(
+                    "DELETE FROM pets WHERE key = ?"
+                    " AND NOT EXISTS (SELECT 1 FROM pet_origins WHERE pet_origins.key = pets.key)",
+                    (key,),
+                ).rowcount
+            conn.execute("DROP TABLE keep")
+        return deleted
+
+    def get_state(self, name: str) -> str | None:
+        """Return a stored sync value (e.g. a high-water mark)."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, name: str, value: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)", (name, value)
+            )
+
+    def _where(self, criteria: dict, now: float | None) -> tuple[str, list]:
+        clauses = []
+        params = []
+        for name, value in criteria.items():
+            if value is None:
+                continue
+            if name in FILTER_COLUMNS:
+                if isinstance(value, str) or not isinstance(value, Collection):
+                    clauses.append(f"{name} = ?")
+                    params.append(value)
+                else:
+                    clauses.append(f"{name} IN ({', '.join('?' * len(value))})")
+                    params.extend(value)
+            elif name == "has_image":
+                clauses.append("has_image = ?")
+                params.append(int(bool(value)))
+            elif name == "not_posted_within_days":
+                now = time.time() if now is None else now
+                clauses.append("(last_posted_at IS NULL OR last_posted_at < ?)")
+                params.append(now - value * SECONDS_PER_DAY)
+            else:
+                raise TypeError(f"Unknown pet criterion {name!r}")
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def _add_missing_columns(conn: sqlite3.Connection) -> None:
+        # Stores created before a column existed are upgraded in place.
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(pets)")}
+        for column in PET_COLUMNS:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE pets ADD COLUMN {column} TEXT")
+        if "last_posted_at" not in existing:
+            conn.execute("ALTER TABLE pets ADD COLUMN last_posted_at REAL")
+        if "has_image" not in existing:
+            conn.execute("ALTER TABLE pets ADD COLUMN has_image INTEGER NOT NULL DEFAULT 0")
+            conn.execute("UPDATE pets SET has_image = (COALESCE(image_url, '') != '')")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per call keeps the store safe to share
+        # between threads, like ResponseCache.
+        return sqlite3.connect(self.path, timeout=10)
@@ -0,0 +1,167 @@
+"""
+Incremental sync of RescueGroups listings into a local SourceSQLite store.
+
+Instead of re-downloading a random sample on every run, each query keeps a
+high-water mark of the newest ``updatedDate`` it has seen and only asks the
+API for animals updated after it. Animals that stop being listed (adopted or
+withdrawn) never show up in an incremental search, so every
+``full_sync_interval`` seconds a query is re-read in full and anything it no
+longer returns is pruned from the store.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping
+
+import requests
+
+from abstractions import AdoptablePet, PetSource
+from adoption_sources.rescue_groups import RescueGroupsQuery, SourceRescueGroups, _as_datetime, product_queries
+from adoption_sources.sqlite import SourceSQLite
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SyncResult:
+    upserted: int = 0
+    removed: int = 0
+    full_syncs: int = 0
+    failed: int = 0
+
+
+class RescueGroupsSync(PetSource):
+    """
+    Keeps a SourceSQLite inventory current with a set of RescueGroups queries.
+
+    fetch_pets() syncs and then serves the whole store. If every query fails
+    but the store already holds pets, the stale inventory is served instead.
+    Extra keyword arguments (e.g. ``age_groups``) go to each SourceRescueGroups;
+    an ``updated_since`` or ``updated_within`` there is a floor that both full
+    and incremental syncs respect.
+    """
+
+    def __init__(
+        self,
+        store: SourceSQLite,
+        queries: Iterable[RescueGroupsQuery],
+        api_key: str | None = None,
+        full_sync_interval: float = 24 * 60 * 60,
+        max_workers: int = 4,
+        session: requests.Session | None = None,
+        **source_kwargs,
+    ):
+        self.store = store
+        self.queries = list(queries)
+        self.full_sync_interval = full_sync_interval
+        self.max_workers = max_workers
+        self._api_key = api_key or os.environ.get("CUTEPETSBOSTON_RESCUEGROUPS_API_KEY")
+        self._session = session
+        self._source_kwargs = {"max_pages": None, **source_kwargs}
+
+    @classmethod
+    def from_product(
+        cls,
+        store: SourceSQLite,
+        species: Iterable[str] = ("dogs", "cats"),
+        postal_codes: Iterable[str] | Mapping[str, str] = ("02108",),
+        radius_miles: int = 50,
+        **kwargs,
+    ) -> "RescueGroupsSync":
+        return cls(store, product_queries(species, postal_codes, radius_miles), **kwargs)
+
+    @property
+    def source_name(self) -> str:
+        return f"RescueGroups inventory ({len(self.queries)} queries)"
+
+    def fetch_pets(self) -> Iterator[AdoptablePet]:
+        try:
+            self.sync()
+        except Exception as exc:
+            if not len(self.store):
+                raise
+            logger.warning(f"Inventory sync failed, serving stored pets: {exc}")
+        yield from self.store.fetch_pets()
+
+    def mark_posted(self, pet: AdoptablePet, now: float | None = None) -> None:
+        """Record in the store that `pet` was just posted."""
+        self.store.mark_posted(pet, now=now)
+
+    def sync(self, now: float | None = None) -> SyncResult:
+        """
+        Bring the store up to date with every query.
+
+        Raises:
+            Exception: The first query error, if every query failed.
+        """
+        now = time.time() if now is None else now
+        results = []
+        errors = []
+        workers = max(1, min(self.max_workers, len(self.queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._sync_query, query, now): query for query in self.queries}
+            for future in as_completed(futures):
+                query = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    logger.warning(
+                        f"RescueGroups sync for {query.species} near {query.postal_code} failed: {exc}"
+                    )
+                    errors.append(exc)
+
+        if errors and len(errors) == len(self.queries):
+            raise errors[0]
+        result = SyncResult(
+            upserted=sum(r.upserted for r in results),
+            removed=sum(r.removed for r in results),
+            full_syncs=sum(r.full_syncs for r in results),
+            failed=len(errors),
+        )
+        logger.info(f"Inventory sync: {result}")
+        return result
+
+    def _sync_query(self, query: RescueGroupsQuery, now: float) -> SyncResult:
+        origin = _origin(query)
+        high_water_mark = self.store.get_state(f"{origin}:updated_since")
+        last_full_sync = float(self.store.get_state(f"{origin}:last_full_sync") or 0)
+        full = high_water_mark is None or now - last_full_sync >= self.full_sync_interval
+        updated_since = None if full else high_water_mark
+        floor = self._source_kwargs.get("updated_since")
+        if floor is not None:
+            updated_since = floor if updated_since is None else max(updated_since, floor, key=_as_datetime)
+
+        source = SourceRescueGroups(
+            api_key=self._api_key,
+            postal_code=query.postal_code,
+            radius_miles=query.radius_miles,
+            species=query.species,
+            location_label=query.location_label,
+            session=self._session,
+            **{
+                **self._source_kwargs,
+                # A stable order keeps pages from overlapping while we walk them.
+                "sort": "animals.id" if full else "animals.updatedDate",
+                "updated_since": updated_since,
+            },
+        )
+        pets = list(source.fetch_pets())
+
+        keys = self.store.upsert(pets, origin=origin)
+        removed = self.store.prune(origin, keys) if full else 0
+
+        newest = max(
+            [pet.updated_at for pet in pets if pet.updated_at] + [high_water_mark or ""]
+        )
+        if newest:
+            self.store.set_state(f"{origin}:updated_since", newest)
+        if full:
+            self.store.set_state(f"{origin}:last_full_sync", repr(now))
+        return SyncResult(upserted=len(keys), removed=removed, full_syncs=int(full))
+
+
+def _origin(query: RescueGroupsQuery) -> str:
+    return f"rescuegroups:{query.species}:{query.postal_code}:{query.radius_miles}"
@@ -0,0 +1,57 @@
+"""
+Timing benchmark for decoding RescueGroups search responses.
+
+Builds a response body from the bundled sample animals and decodes it with
+plain json.loads (what response.json() does) and with each installed
+adoption_sources.decoding backend.
+
+Usage:
+    python benchmarks/bench_json.py [animals]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from adoption_sources.decoding import available_backends, get_decoder
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "sample_data.json")
+
+
+def make_response(count):
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        sample = json.load(f)
+    animals = []
+    for i in range(count):
+        animal = dict(sample[i % len(sample)], id=str(i))
+        animals.append(animal)
+    return json.dumps({"data": animals, "meta": {"count": count, "pages": 1}}).encode()
+
+
+def timed(label, fn, repeat=20):
+    best = min(_once(fn) for _ in range(repeat))
+    print(f"{label:<40}{best * 1000:>9.3f} ms")
+
+
+def _once(fn):
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    body = make_response(count)
+
+    print(f"{count:,} animals, {len(body) / 1024:,.0f} KiB")
+    timed("json.loads (full document)", lambda: json.loads(body))
+    for backend in available_backends():
+        decoder = get_decoder(backend)
+        timed(f"{backend} (trimmed animals)", lambda: decoder.decode_animals_response(body))
+
+
+if __name__ == "__main__":
+    main()
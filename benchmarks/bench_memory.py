@@ -0,0 +1,84 @@
+"""
+Memory benchmark for the abstractions data models.
+
+Compares the slotted AdoptablePet/Post/PostResult against equivalent plain
+@dataclass versions (with a per-instance __dict__) at 100k instances.
+
+Usage:
+    python benchmarks/bench_memory.py [count]
+"""
+
+import dataclasses
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from abstractions import AdoptablePet, Post, PostResult
+
+
+def _unslotted(cls):
+    """Rebuild a dataclass with the same fields but without __slots__."""
+    fields = [(f.name, f.type, f) for f in dataclasses.fields(cls)]
+    return dataclasses.make_dataclass(f"Plain{cls.__name__}", fields)
+
+
+def _pet_kwargs(i):
+    return dict(
+        name=f"Pet{i}",
+        species="dog" if i % 2 else "cat",
+        breed="Husky / Shepherd / Mixed",
+        location="Boston, MA",
+        description="",
+        adoption_url=f"https://www.rescuegroups.org/pet/adopt-pet{i}",
+        image_url=f"https://cdn.rescuegroups.org/{i}.jpg?width=800",
+        age_string="2 Years",
+        sex="Female",
+        size_group="Medium",
+        pet_id=str(i),
+    )
+
+
+def _post_kwargs(i):
+    return dict(text=f"Meet Pet{i}!", image_url=f"https://cdn.rescuegroups.org/{i}.jpg")
+
+
+def _result_kwargs(i):
+    return dict(success=True, post_id=str(i))
+
+
+def measure(cls, make_kwargs, count):
+    """Return bytes allocated per instance, excluding the shared field values."""
+    values = [make_kwargs(i) for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [cls(**kwargs) for kwargs in values]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Subtract the list that holds the instances.
+    allocated -= sys.getsizeof(instances)
+    return allocated / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Per-instance memory at {count:,} instances")
+    print(f"{'type':<14}{'plain':>12}{'slotted':>12}{'saving':>10}{'total':>12}")
+    for cls, make_kwargs in (
+        (AdoptablePet, _pet_kwargs),
+        (Post, _post_kwargs),
+        (PostResult, _result_kwargs),
+    ):
+        plain = measure(_unslotted(cls), make_kwargs, count)
+        slotted = measure(cls, make_kwargs, count)
+        print(
+            f"{cls.__name__:<14}{plain:>10.0f} B{slotted:>10.0f} B"
+            f"{(1 - slotted / plain):>10.0%}{(plain - slotted) * count / 1e6:>9.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
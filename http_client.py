@@ -0,0 +1,104 @@
+"""
+Shared HTTP client layer.
+
+Sources and posters receive a pooled ``requests.Session`` instead of calling
+the module-level ``requests`` helpers, so consecutive calls to the same host
+(e.g. createSession, uploadBlob and createRecord on bsky.social) reuse one
+keep-alive connection instead of paying a TCP+TLS handshake each time.
+
+Every request also passes through a per-host token-bucket RateLimiter (see
+rate_limit.py), so bursts stay within each API's quota.
+"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limit import RateLimiter, parse_rate_limits
+
+# Bluesky allows 3000 requests per 5 minutes per client, i.e. 10 per second.
+DEFAULT_RATE_LIMITS = {"bsky.social": (10.0, 50.0)}
+
+
+@dataclass
+class HttpClientConfig:
+    """Connection pool and timeout settings for a PooledSession."""
+
+    pool_connections: int = 10  # Number of per-host pools to keep around
+    pool_maxsize: int = 10  # Connections kept alive per host
+    host_pool_sizes: dict[str, int] = field(default_factory=dict)  # Per-host override
+    timeout: float | tuple[float, float] = (10, 30)  # (connect, read) seconds
+    # host -> (requests per second, burst); other hosts are not limited
+    rate_limits: dict[str, tuple[float, float]] = field(default_factory=lambda: dict(DEFAULT_RATE_LIMITS))
+    rate_limit_state_path: str | None = None  # Persist bucket levels between runs
+
+    @classmethod
+    def from_env(cls) -> "HttpClientConfig":
+        """
+        Build a config from environment variables.
+
+        CUTEPETSBOSTON_HTTP_POOL_SIZE sets the per-host pool size and
+        CUTEPETSBOSTON_HTTP_TIMEOUT the read timeout in seconds.
+        CUTEPETSBOSTON_RATE_LIMITS adds or overrides per-host limits as
+        ``host=rate[:burst],...``, and CUTEPETSBOSTON_RATE_LIMIT_FILE (or
+        CUTEPETSBOSTON_CACHE_DIR) persists them between runs.
+        """
+        config = cls()
+        pool_size = os.environ.get("CUTEPETSBOSTON_HTTP_POOL_SIZE")
+        if pool_size:
+            config.pool_maxsize = int(pool_size)
+        timeout = os.environ.get("CUTEPETSBOSTON_HTTP_TIMEOUT")
+        if timeout:
+            config.timeout = (config.timeout[0], float(timeout))
+        config.rate_limits.update(parse_rate_limits(os.environ.get("CUTEPETSBOSTON_RATE_LIMITS", "")))
+        config.rate_limit_state_path = os.environ.get("CUTEPETSBOSTON_RATE_LIMIT_FILE")
+        if not config.rate_limit_state_path and os.environ.get("CUTEPETSBOSTON_CACHE_DIR"):
+            config.rate_limit_state_path = os.path.join(
+                os.environ["CUTEPETSBOSTON_CACHE_DIR"], "rate_limits.json"
+            )
+        return config
+
+
+class PooledSession(requests.Session):
+    """A requests.Session with sized connection pools, a default timeout and rate limits."""
+
+    def __init__(self, config: HttpClientConfig | None = None):
+        super().__init__()
+        self.config = config or HttpClientConfig()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        for host, size in self.config.host_pool_sizes.items():
+            self.mount(
+                f"https://{host}/",
+                HTTPAdapter(pool_connections=1, pool_maxsize=size),
+            )
+        self.rate_limiter = RateLimiter(
+            self.config.rate_limits, path=self.config.rate_limit_state_path
+        )
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.config.timeout
+        self.rate_limiter.acquire(url)
+        return super().request(method, url, **kwargs)
+
+
+_default_session: PooledSession | None = None
+_default_session_lock = threading.Lock()
+
+
+def get_session() -> PooledSession:
+    """Return the process-wide shared session, creating it on first use."""
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = PooledSession(HttpClientConfig.from_env())
+        return _default_session
@@ -1,74 +1,622 @@
-import random
+import os
+import threading
+import time
+from concurrent.futures import Future
 
-def main():
-    sources = create_sources()
-    posters = create_posters(debug=False)
+# Sources that take longer than this are skipped for the run.
+SOURCE_TIMEOUT_SECONDS = 120
+# Shared deadline for every poster to finish publishing.
+POST_TIMEOUT_SECONDS = 120
+# How much longer a run waits for posts still going at the deadline, so one
+# that does go out is recorded rather than posted again next run.
+LATE_POST_TIMEOUT_SECONDS = 120
 
-    run(sources, posters)
+def main(argv=None):
+    import argparse
 
+    parser = argparse.ArgumentParser(description="Post an adoptable pet to social media.")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="stay running and post on the CUTEPETSBOSTON_SCHEDULE schedule",
+    )
+    args = parser.parse_args(argv)
 
-def create_posters(debug=False):
-    from social_posters import PosterDebug
+    from http_client import get_session
+
+    # One pooled session shared by every source and poster in the run.
+    session = get_session()
+    image_cache = create_image_cache(session=session)
+    sources = create_sources(session=session)
+    posters = create_posters(debug=False, session=session, image_cache=image_cache)
+
+    if args.daemon:
+        create_scheduler(sources, posters, history=create_history(), image_cache=image_cache).run_forever()
+    else:
+        run(sources, posters, history=create_history(), image_cache=image_cache)
+
+
+def create_scheduler(sources, posters, history=None, image_cache=None):
+    """
+    Build a PostScheduler that reuses `sources` and `posters` for every slot.
+
+    CUTEPETSBOSTON_SCHEDULE sets per-platform schedules (default every 4
+    hours) and CUTEPETSBOSTON_PREFETCH_MINUTES how long before a slot the
+    post is prepared (default 5). Prepared posts are queued on disk when a
+    post queue is configured (see create_post_queue). SIGTERM stops the
+    daemon cleanly.
+    """
+    import signal
+
+    from scheduler import PostScheduler, parse_schedules
+
+    def pick(reserved, poster):
+        selector = create_selector(history, exclude=reserved, posters=[poster])
+        stream_pets(sources, selector)
+        return selector.pick()
+
+    def on_published(poster, pet, result):
+        if result.success:
+            if history is not None:
+                history.record(pet)
+            _mark_posted(sources, pet)
+
+    scheduler = PostScheduler(
+        posters,
+        parse_schedules(os.environ.get("CUTEPETSBOSTON_SCHEDULE", "*=4h")),
+        pick_pet=pick,
+        download_image=lambda url: _download_shared_image(url, image_cache),
+        on_published=on_published,
+        prefetch_seconds=float(os.environ.get("CUTEPETSBOSTON_PREFETCH_MINUTES", 5)) * 60,
+        queue=create_post_queue(),
+        retry_seconds=float(os.environ.get("CUTEPETSBOSTON_POST_RETRY_MINUTES", 5)) * 60,
+    )
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
+    return scheduler
 
-    if debug:
-        return [PosterDebug()]
 
-    #from social_posters.instagram import PosterInstagram
-    from social_posters.bluesky import PosterBluesky
+def create_posters(debug=False, session=None, image_cache=None):
+    """
+    Build the posters named in CUTEPETSBOSTON_POSTERS (default "bluesky").
+
+    Only the modules of enabled platforms are imported.
+    """
+    from registry import POSTERS
+
+    if debug:
+        return [POSTERS.load("debug")()]
 
     posters = []
-    posters.append(PosterBluesky())
-    #posters.append(PosterInstagram())
+    for name in _env_list("CUTEPETSBOSTON_POSTERS", "bluesky"):
+        poster_class = POSTERS.load(name)
+        if name == "bluesky":
+            posters.extend(_create_bluesky_posters(poster_class, session, image_cache))
+        elif name == "debug":
+            posters.append(poster_class())
+        else:
+            posters.append(poster_class(session=session, image_cache=image_cache))
     return posters
 
 
-def create_sources():
-    from adoption_sources import SourceRescueGroups
+def _create_bluesky_posters(poster_class, session=None, image_cache=None):
+    """
+    One poster per account named in BLUESKY_ACCOUNTS, or a single poster
+    for BLUESKY_HANDLE when no accounts are listed.
+    """
+    from social_posters.bluesky_accounts import ACCOUNT_RATE_LIMIT, accounts_from_env
 
-    sources = []
+    session_store = create_bluesky_session_store()
+    accounts = accounts_from_env()
+    if not accounts:
+        return [poster_class(session=session, image_cache=image_cache, session_store=session_store)]
+
+    from rate_limit import TokenBucket
+
+    return [
+        poster_class(
+            session=session,
+            image_cache=image_cache,
+            session_store=session_store,
+            account=account,
+            rate_limit=TokenBucket(*ACCOUNT_RATE_LIMIT),
+        )
+        for account in accounts
+    ]
+
+
+def create_sources(session=None):
+    """Build the sources named in CUTEPETSBOSTON_SOURCES (default "rescuegroups")."""
+    from registry import SOURCES
 
-    sources.append(SourceRescueGroups())
+    sources = []
+    for name in _env_list("CUTEPETSBOSTON_SOURCES", "rescuegroups"):
+        source_class = SOURCES.load(name)
+        if name == "rescuegroups":
+            sources.append(
+                source_class.from_product(
+                    species=_env_list("CUTEPETSBOSTON_SPECIES", "dogs"),
+                    postal_codes=_env_list("CUTEPETSBOSTON_POSTAL_CODES", "02108"),
+                    session=session,
+                    cache=_create_response_cache(),
+                    **_rescue_groups_filters(),
+                )
+            )
+        elif name == "rescuegroups-sync":
+            sources.append(
+                source_class.from_product(
+                    create_inventory(),
+                    species=_env_list("CUTEPETSBOSTON_SPECIES", "dogs"),
+                    postal_codes=_env_list("CUTEPETSBOSTON_POSTAL_CODES", "02108"),
+                    full_sync_interval=float(os.environ.get("CUTEPETSBOSTON_FULL_SYNC_HOURS", 24)) * 3600,
+                    session=session,
+                    **_rescue_groups_filters(),
+                )
+            )
+        elif name == "sqlite":
+            # Serve the stored inventory without syncing it.
+            sources.append(create_inventory())
+        else:
+            sources.append(source_class())
 
     return sources
 
 
-def run(sources, posters):
-    pets = []
-    for source in sources:
-        try:
-            pets.extend(list(source.fetch_pets()))
-        except ValueError as exc:
-            raise SystemExit(str(exc)) from exc
+def create_inventory():
+    """Open the local pet inventory named by CUTEPETSBOSTON_INVENTORY_DB."""
+    path = os.environ.get("CUTEPETSBOSTON_INVENTORY_DB")
+    if not path and os.environ.get("CUTEPETSBOSTON_CACHE_DIR"):
+        path = os.path.join(os.environ["CUTEPETSBOSTON_CACHE_DIR"], "inventory.sqlite3")
+    if not path:
+        raise SystemExit("Set CUTEPETSBOSTON_INVENTORY_DB (or CUTEPETSBOSTON_CACHE_DIR) to use the inventory.")
+
+    from adoption_sources.sqlite import SourceSQLite
+
+    # Pets posted within the repost cooldown are skipped in SQL, using the
+    # last_posted_at that run() records after each post.
+    cooldown_days = float(os.environ.get("CUTEPETSBOSTON_REPOST_COOLDOWN_DAYS", 30))
+    return SourceSQLite(path, filters={"has_image": True, "not_posted_within_days": cooldown_days})
+
+
+def _rescue_groups_filters():
+    """Server-side RescueGroups search filters configured in the environment."""
+    filters = {
+        "age_groups": _env_list("CUTEPETSBOSTON_AGE_GROUPS", ""),
+        "size_groups": _env_list("CUTEPETSBOSTON_SIZE_GROUPS", ""),
+        "sexes": _env_list("CUTEPETSBOSTON_SEXES", ""),
+    }
+    updated_within = os.environ.get("CUTEPETSBOSTON_UPDATED_WITHIN_DAYS")
+    if updated_within:
+        from datetime import timedelta
+
+        # A window rather than a fixed cutoff, so a long-running daemon keeps
+        # measuring it back from each fetch.
+        filters["updated_within"] = timedelta(days=float(updated_within))
+    return filters
+
+
+def _create_response_cache():
+    cache_dir = os.environ.get("CUTEPETSBOSTON_CACHE_DIR")
+    if not cache_dir:
+        return None
+
+    from adoption_sources.cache import ResponseCache
+
+    return ResponseCache(
+        os.path.join(cache_dir, "rescuegroups.sqlite3"),
+        ttl_seconds=float(os.environ.get("CUTEPETSBOSTON_CACHE_TTL", 3600)),
+    )
+
+
+def _env_list(name, default):
+    return [item.strip() for item in os.environ.get(name, default).split(",") if item.strip()]
+
+
+def create_bluesky_session_store():
+    path = os.environ.get("BLUESKY_SESSION_FILE")
+    if not path and os.environ.get("CUTEPETSBOSTON_CACHE_DIR"):
+        path = os.path.join(os.environ["CUTEPETSBOSTON_CACHE_DIR"], "bluesky_sessions.json")
+    if not path:
+        return None
 
-    print("Fetched", len(pets), "records")
-    pet = pick_pet(pets)
-    if not pet:
+    from social_posters.bluesky_session import BlueskySessionStore
+
+    return BlueskySessionStore(path)
+
+
+def create_image_cache(session=None):
+    cache_dir = os.environ.get("CUTEPETSBOSTON_CACHE_DIR")
+    if not cache_dir:
+        return None
+
+    from social_posters.image_cache import ImageCache
+
+    return ImageCache(os.path.join(cache_dir, "images"), session=session)
+
+
+def create_post_queue():
+    path = os.environ.get("CUTEPETSBOSTON_POST_QUEUE_DB")
+    if not path and os.environ.get("CUTEPETSBOSTON_CACHE_DIR"):
+        path = os.path.join(os.environ["CUTEPETSBOSTON_CACHE_DIR"], "post_queue.sqlite3")
+    if not path:
+        return None
+
+    from post_queue import PostQueue
+
+    return PostQueue(path, max_attempts=int(os.environ.get("CUTEPETSBOSTON_POST_ATTEMPTS", 3)))
+
+
+def create_history():
+    path = os.environ.get("CUTEPETSBOSTON_HISTORY_FILE")
+    if not path:
+        return None
+
+    from posted_history import PostedHistory
+
+    return PostedHistory(
+        path,
+        cooldown_days=float(os.environ.get("CUTEPETSBOSTON_REPOST_COOLDOWN_DAYS", 30)),
+    )
+
+
+def create_selector(history=None, exclude=None, posters=None, k=1):
+    from pet_selection import ReservoirSelector, has_image, not_recently_posted, senior_boost
+
+    predicates = [has_image]
+    if history is not None:
+        predicates.append(not_recently_posted(history))
+    if exclude:
+        predicates.append(lambda pet: pet not in exclude)
+    if posters:
+        # Only pets that at least one poster's routing rules accept.
+        predicates.append(lambda pet: any(_accepts(poster, pet) for poster in posters))
+
+    weights = []
+    boost = os.environ.get("CUTEPETSBOSTON_SENIOR_BOOST")
+    if boost:
+        weights.append(senior_boost(float(boost)))
+
+    return ReservoirSelector(k=k, predicates=predicates, weights=weights)
+
+
+def run(sources, posters, history=None, image_cache=None):
+    from pet_selection import SelectorGroup
+
+    # Posters with different routing rules (e.g. regional accounts) each get their own pet.
+    groups = _routing_groups(posters)
+    selectors = SelectorGroup(create_selector(history, posters=group, k=len(groups)) for group in groups)
+    count = stream_pets(sources, selectors)
+
+    print("Fetched", count, "records")
+    pets = selectors.pick_distinct()
+    if not any(pets):
         print("No pets available to post.")
-        print(pets)
         return []
 
     if not posters:
         print("No social media credentials set; skipping post.")
         return []
 
-    results = []
+    late = []
+
+    def publish_group(group, pet):
+        group_late = []
+        results = publish_all(group, pet, image_cache=image_cache, late=group_late)
+        _report_results(group, results, pet, history, sources)
+        late.extend((poster, pet, future) for poster, future in group_late)
+        return results
+
+    futures = [
+        _start_thread(lambda group=group, pet=pet: publish_group(group, pet), "publish")
+        for group, pet in _assigned(groups, pets)
+    ]
+    results = [result for future in futures for result in future.result()]
+    _record_late_posts(late, history, sources)
+    return results
+
+
+async def run_async(sources, posters, history=None, image_cache=None):
+    """
+    Asyncio version of run.
+
+    Accepts AsyncPetSource/AsyncSocialPoster implementations as well as the
+    synchronous ones, which are wrapped to run on the default thread pool.
+    """
+    import asyncio
+
+    from abstractions import AsyncPetSource, AsyncPetSourceAdapter, AsyncSocialPoster, AsyncSocialPosterAdapter
+    from pet_selection import SelectorGroup
+
+    inventories = list(sources)
+    sources = [
+        source if isinstance(source, AsyncPetSource) else AsyncPetSourceAdapter(source)
+        for source in sources
+    ]
+    posters = [
+        poster if isinstance(poster, AsyncSocialPoster) else AsyncSocialPosterAdapter(poster)
+        for poster in posters
+    ]
+
+    groups = _routing_groups(posters)
+    selectors = SelectorGroup(create_selector(history, posters=group, k=len(groups)) for group in groups)
+    count = await stream_pets_async(sources, selectors)
+
+    print("Fetched", count, "records")
+    pets = selectors.pick_distinct()
+    if not any(pets):
+        print("No pets available to post.")
+        return []
+
+    if not posters:
+        print("No social media credentials set; skipping post.")
+        return []
+
+    async def publish_group(group, pet):
+        results = await publish_all_async(group, pet, image_cache=image_cache)
+        _report_results(group, results, pet, history, inventories)
+        return results
+
+    outcomes = await asyncio.gather(*(publish_group(group, pet) for group, pet in _assigned(groups, pets)))
+    return [result for results in outcomes for result in results]
+
+
+def _routing_groups(posters):
+    """Group posters by routing_key; each group shares one pet per run."""
+    groups = {}
     for poster in posters:
-        post = poster.format_post(pet)
-        result = poster.publish(post)
-        results.append(result)
+        groups.setdefault(getattr(poster, "routing_key", None), []).append(poster)
+    return list(groups.values()) or [[]]
+
+
+def _assigned(groups, pets):
+    """Yield (posters that accept `pet`, pet) for each group that got a pet."""
+    for group, pet in zip(groups, pets):
+        if pet is None:
+            print(f"No pets available for {', '.join(poster.platform_name for poster in group)}.")
+            continue
+        yield [poster for poster in group if _accepts(poster, pet)], pet
+
+
+def _accepts(poster, pet):
+    accepts = getattr(poster, "accepts", None)
+    return accepts is None or accepts(pet)
+
+
+def _report_results(posters, results, pet, history, sources=()):
+    for poster, result in zip(posters, results):
         if not result.success:
             print(f"{poster.platform_name} post failed: {result.error_message}")
         else:
             print(f"{poster.platform_name} post published.")
 
+    if any(result.success for result in results):
+        if history is not None:
+            history.record(pet)
+        _mark_posted(sources, pet)
+
+
+def _mark_posted(sources, pet):
+    """Record the post in any local inventory (SourceSQLite, RescueGroupsSync) among `sources`."""
+    for source in sources:
+        mark_posted = getattr(source, "mark_posted", None)
+        if mark_posted is not None:
+            mark_posted(pet)
+
+
+def publish_all(posters, pet, timeout=POST_TIMEOUT_SECONDS, image_cache=None, late=None):
+    """
+    Format and publish `pet` on every poster concurrently.
+
+    The image is downloaded once (or read from `image_cache`) and shared by
+    all posters that upload it.
+    Results are returned in poster order; posters still running when the
+    shared deadline passes get a failed PostResult. Their publish can't be
+    cancelled and may still go out, so if `late` is a list, a
+    ``(poster, future)`` pair for each of them is appended to it.
+    """
+    from abstractions import PostResult
+
+    image_data = None
+    if pet.image_url and any(getattr(poster, "wants_image_data", False) for poster in posters):
+        image_data = _download_shared_image(pet.image_url, image_cache)
+
+    futures = [
+        _start_thread(lambda poster=poster: _publish(poster, pet, image_data), poster.platform_name)
+        for poster in posters
+    ]
+    deadline = time.monotonic() + timeout
+
+    results = []
+    for poster, future in zip(posters, futures):
+        try:
+            results.append(future.result(timeout=max(0, deadline - time.monotonic())))
+        except TimeoutError:
+            results.append(PostResult(success=False, error_message=f"Timed out after {timeout}s."))
+            if late is not None:
+                late.append((poster, future))
     return results
 
 
-def pick_pet(pets):
-    with_images = [pet for pet in pets if pet.image_url]
-    if not with_images:
+def _record_late_posts(late, history, sources, timeout=LATE_POST_TIMEOUT_SECONDS):
+    """Wait for posts that outlived the deadline and record any that went out."""
+    deadline = time.monotonic() + timeout
+    for poster, pet, future in late:
+        try:
+            result = future.result(timeout=max(0, deadline - time.monotonic()))
+        except TimeoutError:
+            print(f"{poster.platform_name} post still hadn't finished {timeout}s after the deadline.")
+            continue
+        if result.success:
+            print(f"{poster.platform_name} post of {pet.name} finished after the deadline.")
+            _report_results([poster], [result], pet, history, sources)
+
+
+def _publish(poster, pet, image_data):
+    from abstractions import PostResult
+
+    try:
+        post = poster.format_post(pet)
+        if image_data is not None and post.image_url == pet.image_url:
+            post.image_data = image_data
+        return poster.publish(post)
+    except Exception as exc:
+        return PostResult(success=False, error_message=str(exc))
+
+
+async def publish_all_async(posters, pet, timeout=POST_TIMEOUT_SECONDS, image_cache=None):
+    """Asyncio version of publish_all for AsyncSocialPoster implementations."""
+    import asyncio
+
+    from abstractions import PostResult
+
+    image_data = None
+    if pet.image_url and any(poster.wants_image_data for poster in posters):
+        image_data = await asyncio.to_thread(_download_shared_image, pet.image_url, image_cache)
+
+    async def publish(poster):
+        try:
+            post = poster.format_post(pet)
+            if image_data is not None and post.image_url == pet.image_url:
+                post.image_data = image_data
+            return await poster.publish(post)
+        except Exception as exc:
+            return PostResult(success=False, error_message=str(exc))
+
+    tasks = [asyncio.ensure_future(publish(poster)) for poster in posters]
+    if tasks:
+        await asyncio.wait(tasks, timeout=timeout)
+
+    results = []
+    for task in tasks:
+        if task.done():
+            results.append(task.result())
+        else:
+            task.cancel()
+            results.append(PostResult(success=False, error_message=f"Timed out after {timeout}s."))
+    return results
+
+
+def _download_shared_image(image_url, image_cache=None):
+    from social_posters.images import download_image
+
+    try:
+        if image_cache is not None:
+            return image_cache.get(image_url)
+        return download_image(image_url)
+    except Exception as exc:
+        # Posters fall back to downloading the image themselves.
+        print(f"Could not pre-download image {image_url}: {exc}")
         return None
-    return random.choice(with_images)
+
+
+def stream_pets(sources, selector, timeout=SOURCE_TIMEOUT_SECONDS):
+    """
+    Feed every source's pets straight into `selector` without buffering them.
+
+    Each source runs on its own daemon thread and gets up to `timeout`
+    seconds. A source that fails or times out is reported and skipped; the
+    run only aborts if every source failed. Returns the number of pets
+    consumed.
+    """
+    from itertools import takewhile
+
+    # A timed-out source's thread keeps running; once the deadline has been
+    # handled it stops at its next pet instead of still feeding the selector.
+    closed = threading.Event()
+
+    def feed(source):
+        return selector.extend(takewhile(lambda pet: not closed.is_set(), source.fetch_pets()))
+
+    try:
+        return sum(_fetch_concurrently(sources, feed, timeout))
+    finally:
+        closed.set()
+
+
+async def stream_pets_async(sources, selector, timeout=SOURCE_TIMEOUT_SECONDS):
+    """
+    Asyncio version of stream_pets for AsyncPetSource implementations.
+
+    Every source is consumed concurrently on the running event loop.
+    """
+    import asyncio
+
+    async def drain(source):
+        count = 0
+        async for pet in source.fetch_pets():
+            selector.offer(pet)
+            count += 1
+        return count
+
+    outcomes = await asyncio.gather(
+        *(asyncio.wait_for(drain(source), timeout) for source in sources),
+        return_exceptions=True,
+    )
+
+    failures = []
+    for source, outcome in zip(sources, outcomes):
+        if isinstance(outcome, BaseException):
+            name = _source_name(source)
+            if isinstance(outcome, asyncio.TimeoutError):
+                print(f"{name} timed out after {timeout}s; skipping.")
+                failures.append(f"{name}: timed out")
+            else:
+                print(f"{name} failed: {outcome}")
+                failures.append(f"{name}: {outcome}")
+
+    if sources and len(failures) == len(sources):
+        raise SystemExit("All sources failed. " + "; ".join(failures))
+    return sum(outcome for outcome in outcomes if not isinstance(outcome, BaseException))
+
+
+def _fetch_concurrently(sources, fetch, timeout):
+    futures = [
+        _start_thread(lambda source=source: fetch(source), _source_name(source))
+        for source in sources
+    ]
+    deadline = time.monotonic() + timeout
+
+    results = []
+    failures = []
+    for source, future in zip(sources, futures):
+        name = _source_name(source)
+        try:
+            results.append(future.result(timeout=max(0, deadline - time.monotonic())))
+        except TimeoutError:
+            print(f"{name} timed out after {timeout}s; skipping.")
+            failures.append(f"{name}: timed out")
+        except Exception as exc:
+            print(f"{name} failed: {exc}")
+            failures.append(f"{name}: {exc}")
+
+    if sources and len(failures) == len(sources):
+        raise SystemExit("All sources failed. " + "; ".join(failures))
+    return results
+
+
+def _start_thread(fn, name):
+    # A plain daemon thread rather than an executor, so a hung source or
+    # poster can't keep the process alive once the run is over.
+    future = Future()
+
+    def target():
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=target, name=name, daemon=True).start()
+    return future
+
+
+def _source_name(source):
+    return getattr(source, "source_name", type(source).__name__)
+
+
+def pick_pet(pets, history=None):
+    selector = create_selector(history)
+    selector.extend(pets)
+    return selector.pick()
 
 
 if __name__ == "__main__":
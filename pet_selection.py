@@ -0,0 +1,145 @@
+"""
+Streaming pet selection.
+
+ReservoirSelector consumes pets one at a time straight from the sources'
+fetch_pets() generators and keeps only the k current winners, so choosing a
+pet takes O(k) memory no matter how many pets the sources yield.
+"""
+
+import heapq
+import itertools
+import math
+import random
+import re
+import threading
+from typing import Callable, Iterable
+
+from abstractions import AdoptablePet
+
+Predicate = Callable[[AdoptablePet], bool]
+Weight = Callable[[AdoptablePet], float]
+
+
+class ReservoirSelector:
+    """
+    Weighted reservoir sampling (Efraimidis-Spirakis A-Res) over a stream.
+
+    Each pet that passes every predicate gets a weight (the product of all
+    weight functions, 1.0 if none) and is kept with probability proportional
+    to it. Safe to feed from several threads at once.
+    """
+
+    def __init__(
+        self,
+        k: int = 1,
+        predicates: Iterable[Predicate] = (),
+        weights: Iterable[Weight] = (),
+        rng: random.Random | None = None,
+    ):
+        self.k = k
+        self.predicates = list(predicates)
+        self.weights = list(weights)
+        self.seen = 0
+        self.eligible = 0
+        self._rng = rng or random.Random()
+        self._heap: list[tuple[float, int, AdoptablePet]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def offer(self, pet: AdoptablePet) -> None:
+        """Consider one pet for the sample."""
+        with self._lock:
+            self.seen += 1
+            if not all(predicate(pet) for predicate in self.predicates):
+                return
+            weight = math.prod(weight(pet) for weight in self.weights)
+            if weight <= 0:
+                return
+            self.eligible += 1
+
+            # log(u) / w orders the same as u ** (1 / w) without underflow.
+            key = math.log(1.0 - self._rng.random()) / weight
+            entry = (key, next(self._counter), pet)
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+            elif key > self._heap[0][0]:
+                heapq.heapreplace(self._heap, entry)
+
+    def extend(self, pets: Iterable[AdoptablePet]) -> int:
+        """Offer every pet from `pets`, returning how many were consumed."""
+        count = 0
+        for pet in pets:
+            self.offer(pet)
+            count += 1
+        return count
+
+    def selected(self) -> list[AdoptablePet]:
+        """Return the sampled pets, strongest key first."""
+        with self._lock:
+            return [pet for _, _, pet in sorted(self._heap, reverse=True)]
+
+    def pick(self) -> AdoptablePet | None:
+        """Return a single sampled pet, or None if nothing was eligible."""
+        selected = self.selected()
+        return selected[0] if selected else None
+
+
+class SelectorGroup:
+    """
+    Feeds one stream of pets to several selectors, e.g. one per group of
+    posters with different routing rules.
+    """
+
+    def __init__(self, selectors: Iterable[ReservoirSelector]):
+        self.selectors = list(selectors)
+
+    def offer(self, pet: AdoptablePet) -> None:
+        for selector in self.selectors:
+            selector.offer(pet)
+
+    def extend(self, pets: Iterable[AdoptablePet]) -> int:
+        count = 0
+        for pet in pets:
+            self.offer(pet)
+            count += 1
+        return count
+
+    def pick_distinct(self) -> list[AdoptablePet | None]:
+        """
+        One pet per selector, in order, preferring pets no earlier selector got.
+
+        Give each selector ``k=len(selectors)`` so it has enough runners-up.
+        A selector only repeats a pet if it has no other eligible one.
+        """
+        picked = []
+        for selector in self.selectors:
+            selected = selector.selected()
+            fresh = (pet for pet in selected if pet not in picked)
+            picked.append(next(fresh, selected[0] if selected else None))
+        return picked
+
+
+# =============================================================================
+# Predicates and weights
+# =============================================================================
+
+
+def has_image(pet: AdoptablePet) -> bool:
+    return bool(pet.image_url)
+
+
+def not_recently_posted(history) -> Predicate:
+    """Exclude pets that `history` (a PostedHistory) says were posted recently."""
+    return lambda pet: not history.recently_posted(pet)
+
+
+def senior_boost(factor: float = 2.0, min_years: int = 8) -> Weight:
+    """Weight pets at least `min_years` old `factor` times more heavily."""
+
+    def weight(pet: AdoptablePet) -> float:
+        match = re.match(r"\s*(\d+)\s+Year", pet.age_string or "")
+        if match and int(match.group(1)) >= min_years:
+            return factor
+        return 1.0
+
+    return weight
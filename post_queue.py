@@ -0,0 +1,138 @@
+"""
+Durable queue of posts prepared ahead of publishing.
+
+A queued post holds its pet and whatever the poster's prepare() returned
+(for Bluesky, the rendered text and the already-uploaded image blob), so
+publishing it is a single API call. A publish that fails leaves the post in
+the queue to be retried later without formatting or uploading it again, for
+posters whose publish is safe to repeat.
+The queue is a SQLite file, so prepared posts survive a restart.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass
+
+from abstractions import AdoptablePet, PostResult
+
+PENDING = "pending"
+PUBLISHED = "published"
+FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedPost:
+    """A prepared post waiting to be published on `platform`."""
+
+    id: int | None
+    platform: str
+    pet: AdoptablePet
+    prepared: dict
+    prepared_at: float
+    attempts: int = 0
+
+
+class PostQueue:
+    """
+    Prepared posts stored in SQLite, oldest first per platform.
+
+    A post whose publish fails stays pending until it has been tried
+    `max_attempts` times; after that it is marked failed and skipped.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS posts ("
+                " id INTEGER PRIMARY KEY,"
+                " platform TEXT NOT NULL,"
+                " pet TEXT NOT NULL,"
+                " prepared TEXT NOT NULL,"
+                " prepared_at REAL NOT NULL,"
+                " status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " last_error TEXT,"
+                " post_url TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS posts_status ON posts (status, platform)")
+
+    def enqueue(
+        self, platform: str, pet: AdoptablePet, prepared: dict, now: float | None = None
+    ) -> QueuedPost:
+        prepared_at = time.time() if now is None else now
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "INSERT INTO posts (platform, pet, prepared, prepared_at, status) VALUES (?, ?, ?, ?, ?)",
+                (platform, json.dumps(asdict(pet)), json.dumps(prepared), prepared_at, PENDING),
+            )
+        return QueuedPost(cursor.lastrowid, platform, pet, prepared, prepared_at)
+
+    def next(self, platform: str) -> QueuedPost | None:
+        """The oldest pending post for `platform`, if any."""
+        pending = self.pending(platform, limit=1)
+        return pending[0] if pending else None
+
+    def pending(self, platform: str | None = None, limit: int | None = None) -> list[QueuedPost]:
+        sql = "SELECT id, platform, pet, prepared, prepared_at, attempts FROM posts WHERE status = ?"
+        params = [PENDING]
+        if platform is not None:
+            sql += " AND platform = ?"
+            params.append(platform)
+        sql += " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            return [
+                QueuedPost(id, platform, AdoptablePet(**json.loads(pet)), json.loads(prepared), prepared_at, attempts)
+                for id, platform, pet, prepared, prepared_at, attempts in conn.execute(sql, params)
+            ]
+
+    def replace(self, item: QueuedPost, prepared: dict, now: float | None = None) -> QueuedPost:
+        """Store a fresh prepare() result for `item`, e.g. after the old one expired."""
+        prepared_at = time.time() if now is None else now
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE posts SET prepared = ?, prepared_at = ? WHERE id = ?",
+                (json.dumps(prepared), prepared_at, item.id),
+            )
+        return QueuedPost(item.id, item.platform, item.pet, prepared, prepared_at, item.attempts)
+
+    def mark_published(self, item: QueuedPost, result: PostResult) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE posts SET status = ?, attempts = attempts + 1, post_url = ? WHERE id = ?",
+                (PUBLISHED, result.post_url, item.id),
+            )
+
+    def mark_failed(self, item: QueuedPost, error: str | None, retry: bool = True) -> bool:
+        """
+        Record a failed publish; returns True if the post will be retried.
+
+        Pass retry=False if the publish may have gone through anyway.
+        """
+        retry = retry and item.attempts + 1 < self.max_attempts
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE posts SET status = ?, attempts = attempts + 1, last_error = ? WHERE id = ?",
+                (PENDING if retry else FAILED, error, item.id),
+            )
+        return retry
+
+    def __len__(self) -> int:
+        """Number of pending posts."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM posts WHERE status = ?", (PENDING,)).fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per call, like SourceSQLite.
+        return sqlite3.connect(self.path, timeout=10)
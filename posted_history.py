@@ -0,0 +1,86 @@
+"""
+Persistent record of which pets have already been posted.
+
+History is an append-only JSON Lines file. It is read once into a dict keyed
+by pet, so checking a candidate is a constant-time lookup no matter how many
+posts have been made.
+"""
+
+import json
+import os
+import threading
+import time
+
+from abstractions import AdoptablePet
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class PostedHistory:
+    """
+    Tracks when each pet was last posted.
+
+    A pet counts as recently posted for `cooldown_days` after it was
+    recorded; after that it becomes eligible again.
+    """
+
+    def __init__(self, path: str, cooldown_days: float = 30):
+        self.path = path
+        self.cooldown_days = cooldown_days
+        self._lock = threading.Lock()
+        self._last_posted: dict[str, float] = {}
+        self._load()
+
+    @staticmethod
+    def key_for(pet: AdoptablePet) -> str | None:
+        """Return the identity used to recognise a pet across runs."""
+        if pet.pet_id:
+            return f"id:{pet.pet_id}"
+        if pet.adoption_url:
+            return f"url:{pet.adoption_url}"
+        return None
+
+    def last_posted(self, pet: AdoptablePet) -> float | None:
+        """Return the Unix time `pet` was last posted, if ever."""
+        key = self.key_for(pet)
+        return self._last_posted.get(key) if key else None
+
+    def recently_posted(self, pet: AdoptablePet, now: float | None = None) -> bool:
+        posted_at = self.last_posted(pet)
+        if posted_at is None:
+            return False
+        now = time.time() if now is None else now
+        return now - posted_at < self.cooldown_days * SECONDS_PER_DAY
+
+    def record(self, pet: AdoptablePet, now: float | None = None) -> None:
+        """Append a post of `pet` to the history."""
+        key = self.key_for(pet)
+        if not key:
+            return
+        posted_at = time.time() if now is None else now
+        line = json.dumps({"key": key, "posted_at": posted_at, "name": pet.name})
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._last_posted[key] = posted_at
+
+    def __len__(self) -> int:
+        return len(self._last_posted)
+
+    def _load(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Tolerate a torn final line from an interrupted write.
+                    continue
+                key = entry.get("key")
+                posted_at = entry.get("posted_at", 0)
+                if key and posted_at >= self._last_posted.get(key, 0):
+                    self._last_posted[key] = posted_at
@@ -0,0 +1,179 @@
+"""
+Client-side token-bucket rate limiting per API host.
+
+Every request through a PooledSession takes a token from its host's bucket.
+A bucket holds up to `burst` tokens and refills at `rate` tokens per second,
+so a fan-out of queries or posts runs at full speed up to the quota and is
+then paced, instead of tripping the server's limit and backing off on 429s.
+
+Buckets are thread-safe, so the async paths, which run their HTTP calls in
+worker threads, share them with everything else. Because the job is a
+short-lived scheduled run, bucket levels can be saved to a JSON file so
+that back-to-back runs share one budget. The file is written at most
+every `save_interval` seconds and at exit, and a save keeps the lower
+level of each bucket so overlapping runs don't hand each other a full
+budget.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from typing import Callable, Mapping
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `burst`; taking one may wait."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        tokens: float | None = None,
+        updated_at: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst if tokens is None else min(tokens, burst)
+        self._updated_at = clock() if updated_at is None else updated_at
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take `tokens` now and return how many seconds to wait before using them.
+
+        The balance may go negative, so concurrent callers queue up behind
+        each other instead of all waking at once when tokens return.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1, sleep: Callable[[float], None] = time.sleep) -> None:
+        wait = self.reserve(tokens)
+        if wait:
+            sleep(wait)
+
+    def state(self) -> dict:
+        with self._lock:
+            self._refill()
+            return {"tokens": self._tokens, "updated_at": self._updated_at}
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    One TokenBucket per configured host.
+
+    `limits` maps a host name to ``(rate per second, burst)``. Requests to
+    other hosts are not limited. With `path`, bucket levels are loaded from
+    that JSON file and saved back to it every `save_interval` seconds and
+    when the process exits.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, tuple[float, float]],
+        path: str | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+        save_interval: float = 30.0,
+    ):
+        self.path = path
+        self.save_interval = save_interval
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._saved_at = clock()
+        saved = self._read()
+        self._buckets = {
+            host: TokenBucket(
+                rate,
+                burst,
+                clock=clock,
+                **{k: v for k, v in saved.get(host, {}).items() if k in ("tokens", "updated_at")},
+            )
+            for host, (rate, burst) in limits.items()
+        }
+        if path:
+            atexit.register(_save_at_exit, weakref.ref(self))
+
+    def bucket_for(self, url: str) -> TokenBucket | None:
+        return self._buckets.get(urlsplit(url).hostname or url)
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to `url`'s host is within its rate limit."""
+        bucket = self.bucket_for(url)
+        if bucket is None:
+            return
+        wait = bucket.reserve()
+        if self._clock() - self._saved_at >= self.save_interval:
+            self.save()
+        if wait:
+            self._sleep(wait)
+
+    def _read(self) -> dict:
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Write bucket levels to `path`, keeping the lower of ours and the file's."""
+        if not self.path:
+            return
+        with self._lock:
+            self._saved_at = self._clock()
+            saved = self._read()
+            state = {}
+            for host, bucket in self._buckets.items():
+                state[host] = bucket.state()
+                other = saved.get(host)
+                if other:
+                    # Another run may have spent from the same budget since we loaded it.
+                    elapsed = max(0.0, state[host]["updated_at"] - other.get("updated_at", 0))
+                    tokens = min(bucket.burst, other.get("tokens", bucket.burst) + elapsed * bucket.rate)
+                    state[host]["tokens"] = min(state[host]["tokens"], tokens)
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+
+
+def _save_at_exit(ref: "weakref.ref[RateLimiter]") -> None:
+    limiter = ref()
+    if limiter is not None:
+        limiter.save()
+
+
+def parse_rate_limits(spec: str) -> dict[str, tuple[float, float]]:
+    """
+    Parse ``"host=rate[:burst],..."``, e.g. ``"bsky.social=10:50"``.
+
+    Burst defaults to one second's worth of requests.
+    """
+    limits = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        host, _, value = item.partition("=")
+        rate, _, burst = value.partition(":")
+        limits[host.strip()] = (float(rate), float(burst) if burst else max(1.0, float(rate)))
+    return limits
@@ -0,0 +1,56 @@
+"""
+Lazy registry of pet sources and social posters.
+
+Entries name a class by its import path, so a platform module (and its
+dependencies, e.g. instapy and Selenium for Instagram) is only imported
+when that platform is actually enabled for a run.
+"""
+
+import importlib
+
+
+class LazyRegistry:
+    """Maps short names to ``"module:attribute"`` paths imported on demand."""
+
+    def __init__(self, kind: str, entries: dict[str, str]):
+        self.kind = kind
+        self._entries = dict(entries)
+        self._loaded: dict[str, type] = {}
+
+    def names(self) -> list[str]:
+        return list(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def register(self, name: str, path: str) -> None:
+        self._entries[name] = path
+        self._loaded.pop(name, None)
+
+    def load(self, name: str) -> type:
+        """
+        Import and return the class registered as `name`.
+
+        Raises:
+            ValueError: If no such name is registered.
+        """
+        if name not in self._entries:
+            raise ValueError(f"Unknown {self.kind} {name!r}; choose from {self.names()}")
+        if name not in self._loaded:
+            module_name, _, attribute = self._entries[name].partition(":")
+            self._loaded[name] = getattr(importlib.import_module(module_name), attribute)
+        return self._loaded[name]
+
+
+SOURCES = LazyRegistry("source", {
+    "rescuegroups": "adoption_sources.rescue_groups:SourceRescueGroupsFanOut",
+    "rescuegroups-sync": "adoption_sources.sync:RescueGroupsSync",
+    "sqlite": "adoption_sources.sqlite:SourceSQLite",
+    "manual": "adoption_sources.manual:SourceManual",
+})
+
+POSTERS = LazyRegistry("poster", {
+    "bluesky": "social_posters.bluesky:PosterBluesky",
+    "instagram": "social_posters.instagram:PosterInstagram",
+    "debug": "social_posters.debug:PosterDebug",
+})
@@ -0,0 +1,137 @@
+"""
+Retry policy for HTTP calls made by sources and posters.
+
+Transient failures (timeouts, dropped connections, 429 and 5xx responses)
+are retried with capped exponential backoff and full jitter, or after the
+delay a server asks for in Retry-After. Retries are idempotency-aware: a
+call that isn't safe to repeat (e.g. Bluesky createRecord) is only retried
+when the request certainly never took effect, i.e. the connection could not
+be opened or the server rate-limited it with a 429.
+"""
+
+import email.utils
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How many times, and how long apart, to retry a failed HTTP call."""
+
+    max_retries: int = 3
+    backoff_base: float = 0.5  # First delay ceiling in seconds; doubles per retry
+    backoff_max: float = 30.0
+    max_retry_after: float = 60.0  # Give up rather than honour a longer Retry-After
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    jitter: bool = True
+    sleep: Callable[[float], None] = field(default=time.sleep, compare=False, repr=False)
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """
+        Build a policy from environment variables.
+
+        CUTEPETSBOSTON_HTTP_RETRIES sets the number of retries (0 disables
+        them) and CUTEPETSBOSTON_HTTP_BACKOFF the base delay in seconds.
+        """
+        kwargs = {}
+        retries = os.environ.get("CUTEPETSBOSTON_HTTP_RETRIES")
+        if retries:
+            kwargs["max_retries"] = int(retries)
+        backoff = os.environ.get("CUTEPETSBOSTON_HTTP_BACKOFF")
+        if backoff:
+            kwargs["backoff_base"] = float(backoff)
+        return cls(**kwargs)
+
+    def call(
+        self,
+        send: Callable[..., requests.Response],
+        *args,
+        idempotent: bool = False,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Call ``send(*args, **kwargs)``, retrying transient failures.
+
+        The last response is returned even if its status is still an error,
+        so callers keep using raise_for_status(); the last exception is
+        re-raised once retries run out.
+        """
+        attempt = 0
+        while True:
+            retries_left = attempt < self.max_retries
+            try:
+                response = send(*args, **kwargs)
+            except requests.RequestException as exc:
+                if not (retries_left and self._should_retry_error(exc, idempotent)):
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(f"HTTP request failed ({exc}); retrying in {delay:.1f}s")
+            else:
+                if not (retries_left and self._should_retry_response(response, idempotent)):
+                    return response
+                delay = self.retry_after(response)
+                if delay is None:
+                    delay = self.backoff(attempt)
+                elif delay > self.max_retry_after:
+                    return response
+                logger.warning(
+                    f"HTTP {response.status_code} from {getattr(response, 'url', 'server')};"
+                    f" retrying in {delay:.1f}s"
+                )
+                response.close()
+            self.sleep(delay)
+            attempt += 1
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt + 1``."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> float | None:
+        """Seconds to wait according to a Retry-After header, if present."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
+    def _should_retry_error(self, exc: requests.RequestException, idempotent: bool) -> bool:
+        if isinstance(exc, requests.ConnectTimeout):
+            # The connection was never established, so nothing was sent.
+            return True
+        return idempotent and isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+    def _should_retry_response(self, response: requests.Response, idempotent: bool) -> bool:
+        if response.status_code == 429:
+            return True
+        return idempotent and response.status_code in self.retry_statuses
+
+
+_default_policy: RetryPolicy | None = None
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the process-wide retry policy configured from the environment."""
+    global _default_policy
+    if _default_policy is None:
+        _default_policy = RetryPolicy.from_env()
+    return _default_policy
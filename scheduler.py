@@ -0,0 +1,281 @@
+"""
+Long-running posting scheduler used by ``python main.py --daemon``.
+
+Instead of a cron job that re-imports, re-authenticates and re-fetches for
+every post, the daemon keeps one process with warm HTTP sessions, caches and
+logins. Each poster has its own Schedule (an interval, optionally limited to
+a daily time window). A few minutes before a poster's slot the scheduler
+picks its next pet, downloads the image, formats the post, makes sure the
+poster is logged in and runs its prepare() step (for Bluesky, uploading the
+image), so at the slot itself only publish_prepared() is left to do. With a
+PostQueue, prepared posts are stored on disk and, for posters whose publish
+is idempotent, a failed publish is retried from the queue a few minutes
+later, as long as its prepared data (e.g. an uploaded Bluesky image) is
+still fresh enough to reuse.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from datetime import time as time_of_day
+from typing import Callable, Mapping, Sequence
+
+from abstractions import AdoptablePet, PostResult, SocialPoster
+from post_queue import PostQueue, QueuedPost
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """Post every `interval_seconds`, only inside the daily `window` if given."""
+
+    interval_seconds: float
+    window: tuple[time_of_day, time_of_day] | None = None  # Local (start, end)
+
+    @classmethod
+    def parse(cls, spec: str) -> "Schedule":
+        """Parse ``"<interval>[@HH:MM-HH:MM]"``, e.g. ``"4h@09:00-21:00"``."""
+        interval, _, window = spec.strip().partition("@")
+        if not window:
+            return cls(parse_duration(interval))
+        start, _, end = window.partition("-")
+        return cls(
+            parse_duration(interval),
+            (time_of_day.fromisoformat(start.strip()), time_of_day.fromisoformat(end.strip())),
+        )
+
+    def in_window(self, moment: datetime) -> bool:
+        if self.window is None:
+            return True
+        start, end = self.window
+        now = moment.time()
+        if start <= end:
+            return start <= now < end
+        return now >= start or now < end  # The window spans midnight.
+
+    def first_slot(self, now: float) -> float:
+        """The first slot at or after `now`."""
+        return self._align(now)
+
+    def next_slot(self, after: float) -> float:
+        """The slot following one at `after`."""
+        return self._align(after + self.interval_seconds)
+
+    def _align(self, timestamp: float) -> float:
+        moment = datetime.fromtimestamp(timestamp)
+        if self.in_window(moment):
+            return timestamp
+        start = datetime.combine(moment.date(), self.window[0])
+        if start <= moment:
+            start += timedelta(days=1)
+        return start.timestamp()
+
+
+def parse_duration(value: str) -> float:
+    """Parse ``"90"``, ``"30m"``, ``"4h"`` or ``"1d"`` into seconds."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", value)
+    if not match:
+        raise ValueError(f"Invalid duration {value!r}")
+    return float(match.group(1)) * _DURATION_UNITS[match.group(2) or "s"]
+
+
+def parse_schedules(spec: str) -> dict[str, Schedule]:
+    """
+    Parse ``"platform=schedule,..."`` into schedules keyed by lowercase name.
+
+    ``*`` sets the schedule for platforms not listed, e.g.
+    ``"*=4h@09:00-21:00,instagram=1d@12:00-13:00"``.
+    """
+    schedules = {}
+    for item in spec.split(","):
+        if item.strip():
+            name, _, schedule = item.partition("=")
+            schedules[name.strip().lower()] = Schedule.parse(schedule)
+    return schedules
+
+
+@dataclass
+class _Job:
+    poster: SocialPoster
+    schedule: Schedule
+    next_at: float
+    prepared: QueuedPost | None = field(default=None, repr=False)
+    retry_at: float | None = None  # When to retry a failed publish of `prepared`
+
+
+class PostScheduler:
+    """
+    Publishes to each poster on its own schedule, preparing posts ahead of time.
+
+    `pick_pet` is called with the pets already prepared for other posters
+    (so they can be excluded) and the poster to pick for, and returns the
+    next pet to post, or None. Posters whose slots fall due together
+    publish concurrently.
+    `download_image` returns the bytes for an image URL, or None. Prepared
+    posts are kept in `queue` if given, and only in memory otherwise. A
+    queued post whose publish fails is retried after `retry_seconds` while
+    its prepared data is still within the poster's prepared_max_age, and
+    otherwise at the next slot; posters without idempotent_publish are never
+    retried, since a publish that looked failed may have gone through.
+    """
+
+    def __init__(
+        self,
+        posters: Sequence[SocialPoster],
+        schedules: Mapping[str, Schedule],
+        pick_pet: Callable[[set, SocialPoster], AdoptablePet | None],
+        download_image: Callable[[str], bytes | None] = lambda url: None,
+        on_published: Callable[[SocialPoster, AdoptablePet, PostResult], None] | None = None,
+        prefetch_seconds: float = 300,
+        clock: Callable[[], float] = time.time,
+        queue: PostQueue | None = None,
+        retry_seconds: float = 300,
+    ):
+        self.prefetch_seconds = prefetch_seconds
+        self.retry_seconds = retry_seconds
+        self.queue = queue
+        self._pick_pet = pick_pet
+        self._download_image = download_image
+        self._on_published = on_published
+        self._clock = clock
+        self._stop = threading.Event()
+
+        now = clock()
+        self._jobs = []
+        for poster in posters:
+            schedule = schedules.get(poster.platform_name.lower()) or schedules.get("*")
+            if schedule is None:
+                print(f"No schedule for {poster.platform_name}; it won't post.")
+                continue
+            self._jobs.append(_Job(poster, schedule, schedule.first_slot(now)))
+
+    def run_forever(self) -> None:
+        """Run until stop() is called."""
+        while not self._stop.is_set():
+            self._stop.wait(self.run_pending())
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run_pending(self, now: float | None = None) -> float:
+        """Prepare and publish whatever is due; return seconds until the next event."""
+        now = self._clock() if now is None else now
+        # Preparing is sequential so that each pick sees the pets already reserved.
+        for job in self._jobs:
+            if job.prepared is None and now >= job.next_at - self.prefetch_seconds:
+                self._prepare(job, now)
+
+        due = [job for job in self._jobs if now >= min(job.next_at, job.retry_at or job.next_at)]
+        if len(due) > 1:
+            with ThreadPoolExecutor(max_workers=len(due)) as executor:
+                list(executor.map(lambda job: self._publish(job, now), due))
+        elif due:
+            self._publish(due[0], now)
+        for job in due:
+            if now >= job.next_at:
+                job.next_at = job.schedule.next_slot(max(now, job.next_at))
+
+        upcoming = []
+        for job in self._jobs:
+            upcoming.append(job.next_at)
+            if job.retry_at is not None:
+                upcoming.append(job.retry_at)
+            if job.prepared is None:
+                upcoming.append(job.next_at - self.prefetch_seconds)
+        upcoming = [at for at in upcoming if at > now]
+        return min(upcoming) - now if upcoming else 60.0
+
+    def next_slots(self) -> dict[str, float]:
+        return {job.poster.platform_name: job.next_at for job in self._jobs}
+
+    def _prepare(self, job: _Job, now: float) -> None:
+        platform = job.poster.platform_name
+        try:
+            # A post left over from a failed publish or an earlier run goes first.
+            item = self.queue.next(platform) if self.queue is not None else None
+            pet = item.pet if item else self._pick_pet(self._reserved_pets(job), job.poster)
+            if pet is None:
+                print(f"No pet available for {platform}.")
+                return
+            self._warm_up(job.poster)
+            if item:
+                item = self._refresh(job.poster, item, now)
+            elif self.queue is not None:
+                item = self.queue.enqueue(platform, pet, self._render(job.poster, pet), now=now)
+            else:
+                item = QueuedPost(None, platform, pet, self._render(job.poster, pet), now)
+        except (Exception, SystemExit) as exc:
+            # Fetching raises SystemExit when every source fails; try again at the slot.
+            print(f"Could not prepare {platform} post: {exc}")
+            return
+        job.prepared = item
+
+    def _publish(self, job: _Job, now: float) -> None:
+        job.retry_at = None
+        if job.prepared is None:
+            return
+        item = job.prepared
+        job.prepared = None
+        try:
+            item = self._refresh(job.poster, item, now)
+            result = job.poster.publish_prepared(item.prepared)
+        except Exception as exc:
+            result = PostResult(success=False, error_message=str(exc))
+
+        platform = job.poster.platform_name
+        queued = self.queue is not None and item.id is not None
+        if result.success:
+            print(f"{platform} post published: {item.pet.name}.")
+            if queued:
+                self.queue.mark_published(item, result)
+        else:
+            print(f"{platform} post failed: {result.error_message}")
+            retry = getattr(job.poster, "idempotent_publish", False)
+            if queued and self.queue.mark_failed(item, result.error_message, retry=retry):
+                self._schedule_retry(job, replace(item, attempts=item.attempts + 1), now)
+        if self._on_published:
+            self._on_published(job.poster, item.pet, result)
+
+    def _schedule_retry(self, job: _Job, item: QueuedPost, now: float) -> None:
+        retry_at = now + self.retry_seconds
+        next_slot = job.schedule.next_slot(max(now, job.next_at)) if now >= job.next_at else job.next_at
+        max_age = getattr(job.poster, "prepared_max_age", None)
+        if retry_at >= next_slot or (max_age is not None and retry_at - item.prepared_at > max_age):
+            # Too stale to reuse by then; the next slot takes it from the queue.
+            print(f"{job.poster.platform_name} post of {item.pet.name} will be retried at the next slot.")
+            return
+        print(f"{job.poster.platform_name} post of {item.pet.name} will be retried in {self.retry_seconds:.0f}s.")
+        job.prepared = item
+        job.retry_at = retry_at
+
+    def _reserved_pets(self, job: _Job) -> set[AdoptablePet]:
+        reserved = {other.prepared.pet for other in self._jobs if other is not job and other.prepared}
+        if self.queue is not None:
+            reserved.update(item.pet for item in self.queue.pending())
+        return reserved
+
+    def _render(self, poster: SocialPoster, pet: AdoptablePet) -> dict:
+        post = poster.format_post(pet)
+        if pet.image_url and getattr(poster, "wants_image_data", False):
+            post.image_data = self._download_image(pet.image_url)
+        return poster.prepare(post)
+
+    def _refresh(self, poster: SocialPoster, item: QueuedPost, now: float) -> QueuedPost:
+        """Prepare `item` again if its prepared data is too old to publish."""
+        max_age = getattr(poster, "prepared_max_age", None)
+        if max_age is None or now - item.prepared_at <= max_age:
+            return item
+        prepared = self._render(poster, item.pet)
+        if self.queue is not None and item.id is not None:
+            return self.queue.replace(item, prepared, now=now)
+        return QueuedPost(item.id, item.platform, item.pet, prepared, now, item.attempts)
+
+    @staticmethod
+    def _warm_up(poster: SocialPoster) -> None:
+        is_authenticated = getattr(poster, "is_authenticated", None)
+        if is_authenticated is not None and not is_authenticated():
+            poster.authenticate()
@@ -2,4 +2,20 @@
 
 from social_posters.debug import PosterDebug
 
+# Platform posters pull in their HTTP/browser dependencies, so they are only
+# imported when first accessed.
+_LAZY_POSTERS = {
+    "PosterBluesky": "social_posters.bluesky",
+    "PosterInstagram": "social_posters.instagram",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_POSTERS:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_POSTERS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["PosterBluesky", "PosterDebug", "PosterInstagram"]
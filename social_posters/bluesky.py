@@ -1,111 +1,255 @@
 from datetime import datetime
 from typing import Optional
 import os
+import random
+import time
 
 import requests
 
-from abstractions import Post, PostResult, SocialPoster
+from abstractions import AdoptablePet, Post, PostResult, SocialPoster
+from http_client import get_session
+from rate_limit import TokenBucket
+from retry import RetryPolicy, get_retry_policy
+from social_posters.bluesky_accounts import BlueskyAccount
+from social_posters.bluesky_session import BlueskySession, BlueskySessionStore
+from social_posters.image_cache import ImageCache
+from social_posters.images import download_image, prepare_image
+
+XRPC_URL = "https://bsky.social/xrpc"
+_TID_ALPHABET = "234567abcdefghijklmnopqrstuvwxyz"
 
 
 class PosterBluesky(SocialPoster):
-    def __init__(self):
-        # Handle environment variable validation internally
-        self.username = os.environ.get("BLUESKY_HANDLE") 
-        self.password = os.environ.get("BLUESKY_PASSWORD")
+    wants_image_data = True
+    # The PDS garbage-collects uploaded blobs that no record references.
+    prepared_max_age = 60 * 60
+    # Each prepared post carries its own record key, so creating it twice fails.
+    idempotent_publish = True
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        image_cache: ImageCache | None = None,
+        session_store: BlueskySessionStore | None = None,
+        retry: RetryPolicy | None = None,
+        account: BlueskyAccount | None = None,
+        rate_limit: TokenBucket | None = None,
+    ):
+        # Without an account, the single account comes from the environment.
+        self.account = account
+        if account:
+            self.username = account.handle
+            self.password = account.password
+        else:
+            self.username = os.environ.get("BLUESKY_HANDLE")
+            self.password = os.environ.get("BLUESKY_PASSWORD")
         self._access_token = None
         self._did = None  # Decentralized identifier from the Bluesky session.
+        self._auth: BlueskySession | None = None
         self._is_available = bool(self.username and self.password)
+        self._session = session or get_session()
+        self._image_cache = image_cache
+        self._session_store = session_store
+        self._retry = retry or get_retry_policy()
+        self._rate_limit = rate_limit  # Per-account limit on created records
 
     @property
     def platform_name(self) -> str:
-        return "Bluesky"
+        return f"Bluesky ({self.account.name})" if self.account else "Bluesky"
+
+    def accepts(self, pet: AdoptablePet) -> bool:
+        return self.account is None or self.account.accepts(pet)
+
+    @property
+    def routing_key(self):
+        return self.account.routing_key if self.account else None
 
     def authenticate(self) -> bool:
+        """
+        Authenticate, preferring a saved session over a password login.
+
+        A stored access token is reused while valid; an expired one is renewed
+        with refreshSession. createSession is only called when neither works.
+        """
+        stored = self._session_store.load(self.username) if self._session_store else None
+        if stored and stored.is_access_valid():
+            self._use_session(stored)
+            return True
+        if stored and stored.is_refresh_valid() and self._refresh_session(stored):
+            return True
+        return self._create_session()
+
+    def is_authenticated(self) -> bool:
+        return bool(self._access_token and self._did)
+
+    def _create_session(self) -> bool:
         try:
-            response = requests.post(
-                "https://bsky.social/xrpc/com.atproto.server.createSession",
+            # Logging in again only mints another session, so it's safe to repeat.
+            response = self._retry.call(
+                self._session.post,
+                f"{XRPC_URL}/com.atproto.server.createSession",
                 json={"identifier": self.username, "password": self.password},
-                timeout=20,
+                idempotent=True,
             )
             response.raise_for_status()
-            session = response.json()
-            self._access_token = session.get("accessJwt")
-            self._did = session.get("did")
-            return bool(self._access_token and self._did)
+            self._use_session(BlueskySession.from_response(response.json()), save=True)
+            return True
         except Exception:
-            self._access_token = None
-            self._did = None
+            self._clear_session()
             return False
 
-    def publish(self, post: Post) -> PostResult:
-        if not self._is_available:
-            return PostResult(
-                success=False,
-                error_message="Bluesky credentials not available."
+    def _refresh_session(self, stored: BlueskySession) -> bool:
+        try:
+            # Not idempotent: a refresh that went through rotates the refresh token.
+            response = self._retry.call(
+                self._session.post,
+                f"{XRPC_URL}/com.atproto.server.refreshSession",
+                headers={"Authorization": f"Bearer {stored.refresh_jwt}"},
             )
+            response.raise_for_status()
+            self._use_session(BlueskySession.from_response(response.json()), save=True)
+            return True
+        except Exception:
+            self._clear_session()
+            return False
+
+    def _use_session(self, auth: BlueskySession, save: bool = False) -> None:
+        self._auth = auth
+        self._access_token = auth.access_jwt
+        self._did = auth.did
+        if save and self._session_store:
+            self._session_store.save(self.username, auth)
 
-        if not self._access_token or not self._did:
-            if not self.authenticate():
-                return PostResult(
-                    success=False, error_message="Bluesky authentication failed."
-                )
+    def _clear_session(self) -> None:
+        self._auth = None
+        self._access_token = None
+        self._did = None
+        if self._session_store:
+            self._session_store.clear(self.username)
+
+    def _renew_session(self) -> bool:
+        """Get a fresh access token after the server rejected the current one."""
+        if self._auth and self._refresh_session(self._auth):
+            return True
+        return self._create_session()
 
-        headers = {"Authorization": f"Bearer {self._access_token}"}
-        image_blob = None
+    def _post_xrpc(self, method: str, idempotent: bool = False, **kwargs) -> requests.Response:
+        """
+        POST to an authenticated XRPC method, renewing an expired token once.
 
+        Transient failures are retried by the retry policy; pass
+        ``idempotent=True`` only for calls that are safe to repeat.
+        """
+        headers = kwargs.pop("headers", {})
+        for attempt in range(2):
+            response = self._retry.call(
+                self._session.post,
+                f"{XRPC_URL}/{method}",
+                headers={**headers, "Authorization": f"Bearer {self._access_token}"},
+                idempotent=idempotent,
+                **kwargs,
+            )
+            if attempt == 0 and _is_token_error(response) and self._renew_session():
+                continue
+            break
+        response.raise_for_status()
+        return response
+
+    def publish(self, post: Post) -> PostResult:
+        error = self._login_error()
+        if error:
+            return PostResult(success=False, error_message=error)
+        try:
+            prepared = self.prepare(post)
+        except Exception as exc:
+            return PostResult(success=False, error_message=str(exc))
+        return self.publish_prepared(prepared)
+
+    def prepare(self, post: Post) -> dict:
+        """
+        Render `post` and upload its image, returning the record to create.
+
+        The record references the uploaded blob, so publish_prepared() is a
+        single createRecord call. It also gets a fresh record key ("rkey"),
+        so publishing it again can't create a second post.
+        """
+        error = self._login_error()
+        if error:
+            raise RuntimeError(error)
+
+        record = {"text": self._format_text(post), "rkey": _new_tid()}
         if post.image_url:
-            try:
-                img_response = requests.get(post.image_url, timeout=20)
-                img_response.raise_for_status()
-                upload = requests.post(
-                    "https://bsky.social/xrpc/com.atproto.repo.uploadBlob",
-                    headers={**headers, "Content-Type": "image/jpeg"},
-                    data=img_response.content,
-                    timeout=30,
-                )
-                upload.raise_for_status()
-                image_blob = upload.json().get("blob")
-            except Exception as exc:
-                return PostResult(success=False, error_message=str(exc))
+            image_data = post.image_data
+            if image_data is None and self._image_cache:
+                image_data = self._image_cache.get(post.image_url)
+            elif image_data is None:
+                image_data = download_image(post.image_url, self._session, self._retry)
+            image = prepare_image(image_data)
+            # Blobs are content-addressed, so re-uploading is harmless.
+            upload = self._post_xrpc(
+                "com.atproto.repo.uploadBlob",
+                headers={"Content-Type": image.mime_type},
+                data=image.data,
+                idempotent=True,
+            )
+            image_blob = upload.json().get("blob")
+            if image_blob:
+                embedded_image = {
+                    "alt": post.alt_text or "Adoptable pet",
+                    "image": image_blob,
+                }
+                if image.aspect_ratio:
+                    embedded_image["aspectRatio"] = image.aspect_ratio
+                record["embed"] = {
+                    "$type": "app.bsky.embed.images",
+                    "images": [embedded_image],
+                }
+        return record
+
+    def publish_prepared(self, prepared: dict) -> PostResult:
+        error = self._login_error()
+        if error:
+            return PostResult(success=False, error_message=error)
 
+        prepared = dict(prepared)
+        rkey = prepared.pop("rkey", None)
         record = {
             "$type": "app.bsky.feed.post",
-            "text": self._format_text(post),
+            **prepared,
             "createdAt": datetime.utcnow().isoformat() + "Z",
         }
-
-        if image_blob:
-            record["embed"] = {
-                "$type": "app.bsky.embed.images",
-                "images": [
-                    {
-                        "alt": post.alt_text or "Adoptable pet",
-                        "image": image_blob,
-                    }
-                ],
-            }
-
+        body = {"repo": self._did, "collection": "app.bsky.feed.post", "record": record}
+        if rkey:
+            body["rkey"] = rkey
         try:
-            response = requests.post(
-                "https://bsky.social/xrpc/com.atproto.repo.createRecord",
-                headers=headers,
-                json={
-                    "repo": self._did,
-                    "collection": "app.bsky.feed.post",
-                    "record": record,
-                },
-                timeout=30,
-            )
-            response.raise_for_status()
+            if self._rate_limit:
+                self._rate_limit.acquire()
+            # Never blindly retried: a repeat could publish the post twice.
+            # A later publish of the same prepared post is safe, since the
+            # PDS rejects a second record with the same rkey.
+            response = self._post_xrpc("com.atproto.repo.createRecord", json=body)
             data = response.json()
             return PostResult(
                 success=True,
                 post_id=data.get("cid"),
                 post_url=data.get("uri"),
             )
+        except requests.HTTPError as exc:
+            if rkey and _is_duplicate_record(exc.response):
+                # An earlier attempt that looked failed had created it.
+                return PostResult(success=True, post_url=f"at://{self._did}/app.bsky.feed.post/{rkey}")
+            return PostResult(success=False, error_message=str(exc))
         except Exception as exc:
             return PostResult(success=False, error_message=str(exc))
 
+    def _login_error(self) -> str | None:
+        """Log in if needed; return why posting is impossible, if it is."""
+        if not self._is_available:
+            return "Bluesky credentials not available."
+        if not (self._access_token and self._did) and not self.authenticate():
+            return "Bluesky authentication failed."
+        return None
+
     def format_post(self, pet):
         from abstractions import Post
 
@@ -134,7 +278,8 @@ class PosterBluesky(SocialPoster):
             text += f"\n\nPet ID: {pet.pet_id}"
 
         species_tag = "DogsOfBluesky" if pet.species == "dog" else "CatsOfBluesky"
-        tags = ["AdoptDontShop", "Boston", species_tag]
+        region_tag = self.account.hashtag if self.account else "Boston"
+        tags = ["AdoptDontShop", region_tag, species_tag]
 
         return Post(
             text=text,
@@ -150,3 +295,29 @@ class PosterBluesky(SocialPoster):
             text = f"{text}\n\n{tags}"
         return text[:300]
 
+
+def _new_tid() -> str:
+    """A record key in the atproto TID format: microseconds plus a random clock id."""
+    value = (time.time_ns() // 1000) << 10 | random.getrandbits(10)
+    return "".join(_TID_ALPHABET[(value >> shift) & 31] for shift in range(60, -1, -5))
+
+
+def _is_duplicate_record(response: requests.Response | None) -> bool:
+    """True if createRecord failed because a record with its rkey already exists."""
+    if response is None or response.status_code not in (400, 409):
+        return False
+    try:
+        message = response.json().get("message") or ""
+    except ValueError:
+        return False
+    return "already exists" in message.lower()
+
+
+def _is_token_error(response: requests.Response) -> bool:
+    """True if an XRPC error response says the access token is expired or invalid."""
+    if response.status_code not in (400, 401):
+        return False
+    try:
+        return response.json().get("error") in ("ExpiredToken", "InvalidToken")
+    except ValueError:
+        return False
@@ -0,0 +1,106 @@
+"""
+Persistence for Bluesky (AT Protocol) login sessions.
+
+Saving the access/refresh tokens between runs lets PosterBluesky reuse a
+still-valid access token, or renew it with refreshSession, instead of calling
+createSession with the account password on every start.
+"""
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class BlueskySession:
+    """Tokens and identity returned by createSession / refreshSession."""
+
+    access_jwt: str
+    refresh_jwt: str
+    did: str
+    handle: str | None = None
+
+    @classmethod
+    def from_response(cls, data: dict) -> "BlueskySession":
+        return cls(
+            access_jwt=data["accessJwt"],
+            refresh_jwt=data["refreshJwt"],
+            did=data["did"],
+            handle=data.get("handle"),
+        )
+
+    def access_expires_at(self) -> float | None:
+        return _jwt_expiry(self.access_jwt)
+
+    def refresh_expires_at(self) -> float | None:
+        return _jwt_expiry(self.refresh_jwt)
+
+    def is_access_valid(self, margin_seconds: float = 60) -> bool:
+        """True if the access token won't expire within `margin_seconds`."""
+        expires_at = self.access_expires_at()
+        return expires_at is not None and expires_at - margin_seconds > time.time()
+
+    def is_refresh_valid(self, margin_seconds: float = 60) -> bool:
+        expires_at = self.refresh_expires_at()
+        # Treat an unreadable expiry as usable; the server will reject it if not.
+        return expires_at is None or expires_at - margin_seconds > time.time()
+
+
+class BlueskySessionStore:
+    """JSON file of sessions keyed by account handle, readable only by its owner."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, handle: str) -> BlueskySession | None:
+        data = self._read().get(handle)
+        if not data:
+            return None
+        try:
+            return BlueskySession(**data)
+        except TypeError:
+            return None
+
+    def save(self, handle: str, session: BlueskySession) -> None:
+        with self._lock:
+            sessions = self._read()
+            sessions[handle] = asdict(session)
+            self._write(sessions)
+
+    def clear(self, handle: str) -> None:
+        with self._lock:
+            sessions = self._read()
+            if sessions.pop(handle, None) is not None:
+                self._write(sessions)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, sessions: dict) -> None:
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(sessions, f)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.path)
+
+
+def _jwt_expiry(token: str) -> float | None:
+    """Read the `exp` claim of a JWT without verifying its signature."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
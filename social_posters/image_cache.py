@@ -0,0 +1,144 @@
+"""
+Content-addressed on-disk cache for pet images.
+
+Image bytes are stored once under their SHA-256 digest, and a small index
+maps each source URL to the digest. Retries, multiple platforms and reposts
+of the same animal therefore download a photo only once, and two URLs that
+serve identical bytes share one file. The cache is bounded by total size and
+evicts the least recently used images first, together with the URL entries
+that pointed at them.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+
+import requests
+
+from social_posters.images import download_image
+
+
+class ImageCache:
+    """Size-bounded LRU image cache keyed by URL and by content hash."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 200 * 1024 * 1024,
+        session: requests.Session | None = None,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._session = session
+        self._objects_dir = os.path.join(directory, "objects")
+        self._urls_dir = os.path.join(directory, "urls")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._urls_dir, exist_ok=True)
+
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # Held while evicting, and while reading an image, so a put() for
+        # another URL can't delete the file between lookup and read.
+        self._evict_lock = threading.Lock()
+
+    def get(self, url: str) -> bytes:
+        """Return the bytes for `url`, downloading them on a cache miss."""
+        with self._lock_for(url):
+            with self._evict_lock:
+                path = self._lookup(url)
+                if path is not None:
+                    with open(path, "rb") as f:
+                        return f.read()
+            data = download_image(url, self._session)
+            self.put(url, data)
+            return data
+
+    def path_for(self, url: str) -> str:
+        """Return a local file path holding the image for `url`."""
+        with self._lock_for(url):
+            path = self._lookup(url)
+            if path is None:
+                path = self.put(url, download_image(url, self._session))
+            return path
+
+    def put(self, url: str, data: bytes) -> str:
+        """Store `data` as the image for `url` and return its path."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        with self._evict_lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._write_atomic(path, data)
+            self._write_atomic(self._url_path(url), digest.encode("ascii"))
+            self._evict(keep=path)
+        return path
+
+    def contains(self, url: str) -> bool:
+        return self._lookup(url) is not None
+
+    def _lookup(self, url: str) -> str | None:
+        try:
+            with open(self._url_path(url), encoding="ascii") as f:
+                digest = f.read().strip()
+        except FileNotFoundError:
+            return None
+        path = self._object_path(digest)
+        try:
+            os.utime(path)  # Mark as recently used.
+        except FileNotFoundError:
+            # Evicted by another process; the URL entry is replaced on download.
+            return None
+        return path
+
+    def _evict(self, keep: str) -> None:
+        # Called with _evict_lock held.
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self._objects_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        evicted = set()
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.unlink(path)
+            evicted.add(os.path.basename(path))
+            total -= size
+        if evicted:
+            self._prune_urls(evicted)
+
+    def _prune_urls(self, digests: set[str]) -> None:
+        """Delete the URL entries that point at evicted images."""
+        for name in os.listdir(self._urls_dir):
+            path = os.path.join(self._urls_dir, name)
+            try:
+                with open(path, encoding="ascii") as f:
+                    if f.read().strip() not in digests:
+                        continue
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def _lock_for(self, url: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(url, threading.Lock())
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, digest[:2], digest)
+
+    def _url_path(self, url: str) -> str:
+        return os.path.join(self._urls_dir, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
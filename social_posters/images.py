@@ -0,0 +1,151 @@
+"""
+Helpers for fetching and preparing pet images shared by the social posters.
+
+prepare_image() re-encodes photos before upload: it detects the real format,
+downscales and recompresses until the file fits the platform's blob size
+limit, drops EXIF and other metadata, and reports the dimensions so posts
+can carry an aspect ratio. Re-encoding needs Pillow; without it images are
+passed through unchanged with their detected type and size.
+"""
+
+import io
+import struct
+from dataclasses import dataclass
+
+import requests
+
+from http_client import get_session
+from retry import RetryPolicy, get_retry_policy
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional.
+    Image = None
+    ImageOps = None
+
+BLUESKY_MAX_IMAGE_BYTES = 1_000_000
+MAX_IMAGE_DIMENSION = 2000
+JPEG_QUALITIES = (85, 75, 65, 55)
+
+
+@dataclass
+class PreparedImage:
+    """Image bytes ready for upload, with their MIME type and dimensions."""
+
+    data: bytes
+    mime_type: str
+    width: int | None = None
+    height: int | None = None
+
+    @property
+    def aspect_ratio(self) -> dict | None:
+        if not self.width or not self.height:
+            return None
+        return {"width": self.width, "height": self.height}
+
+
+def download_image(
+    image_url: str,
+    session: requests.Session | None = None,
+    retry: RetryPolicy | None = None,
+) -> bytes:
+    """Download an image and return its raw bytes."""
+    response = (retry or get_retry_policy()).call(
+        (session or get_session()).get, image_url, idempotent=True
+    )
+    response.raise_for_status()
+    return response.content
+
+
+def detect_mime_type(data: bytes) -> str | None:
+    """Identify an image format from its magic bytes."""
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def prepare_image(
+    data: bytes,
+    max_bytes: int = BLUESKY_MAX_IMAGE_BYTES,
+    max_dimension: int = MAX_IMAGE_DIMENSION,
+) -> PreparedImage:
+    """
+    Shrink an image to fit within `max_bytes` and `max_dimension` pixels.
+
+    The result is always a metadata-free JPEG when Pillow is installed and
+    the image can be decoded; otherwise the original bytes are returned.
+    """
+    mime_type = detect_mime_type(data) or "image/jpeg"
+    if Image is None:
+        width, height = probe_dimensions(data)
+        return PreparedImage(data, mime_type, width, height)
+
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            # Apply EXIF rotation before the metadata is thrown away.
+            image = ImageOps.exif_transpose(source)
+            image = _flatten(image)
+    except Exception:
+        width, height = probe_dimensions(data)
+        return PreparedImage(data, mime_type, width, height)
+
+    image.thumbnail((max_dimension, max_dimension))
+    while True:
+        for quality in JPEG_QUALITIES:
+            encoded = _encode_jpeg(image, quality)
+            if len(encoded) <= max_bytes:
+                return PreparedImage(encoded, "image/jpeg", image.width, image.height)
+        if min(image.size) <= 64:
+            return PreparedImage(encoded, "image/jpeg", image.width, image.height)
+        image = image.resize((image.width * 3 // 4, image.height * 3 // 4))
+
+
+def probe_dimensions(data: bytes) -> tuple[int | None, int | None]:
+    """Read width and height from PNG, GIF or JPEG headers without decoding."""
+    try:
+        if data.startswith(b"\x89PNG\r\n\x1a\n"):
+            return struct.unpack(">II", data[16:24])
+        if data[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", data[6:10])
+        if data.startswith(b"\xff\xd8"):
+            return _probe_jpeg_dimensions(data)
+    except struct.error:
+        pass
+    return None, None
+
+
+def _probe_jpeg_dimensions(data: bytes) -> tuple[int | None, int | None]:
+    offset = 2
+    while offset + 9 < len(data):
+        if data[offset] != 0xFF:
+            offset += 1
+            continue
+        marker = data[offset + 1]
+        # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC).
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", data[offset + 5:offset + 9])
+            return width, height
+        (length,) = struct.unpack(">H", data[offset + 2:offset + 4])
+        offset += 2 + length
+    return None, None
+
+
+def _flatten(image):
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def _encode_jpeg(image, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
@@ -4,18 +4,28 @@ from urllib.parse import urlparse
 from typing import Optional
 
 import requests
-from instapy import InstaPy
 
 from abstractions import Post, PostResult, SocialPoster
+from http_client import get_session
+from retry import get_retry_policy
+from social_posters.image_cache import ImageCache
 
 
 class PosterInstagram(SocialPoster):
-    def __init__(self):
+    wants_image_data = True
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        image_cache: ImageCache | None = None,
+    ):
         # Handle environment variable validation internally
         self.username = os.environ.get("INSTAGRAM_HANDLE")
         self.password = os.environ.get("INSTAGRAM_PASSWORD")
         self._session = None
         self._is_available = bool(self.username and self.password)
+        self._http = session or get_session()
+        self._image_cache = image_cache
 
     @property
     def platform_name(self) -> str:
@@ -23,6 +33,9 @@ class PosterInstagram(SocialPoster):
 
     def authenticate(self) -> bool:
         try:
+            # instapy drags in Selenium; only load it when actually logging in.
+            from instapy import InstaPy
+
             self._session = InstaPy(
                 username=self.username,
                 password=self.password,
@@ -54,8 +67,13 @@ class PosterInstagram(SocialPoster):
             )
 
         image_path = None
+        is_temporary = False
         try:
-            image_path = self._download_image(post.image_url)
+            if self._image_cache:
+                image_path = self._cached_image(post)
+            else:
+                image_path = self._download_image(post.image_url, post.image_data)
+                is_temporary = True
             caption = self._format_caption(post)
             self._session.upload_photo(image_path, caption=caption)
             return PostResult(success=True)
@@ -65,7 +83,7 @@ class PosterInstagram(SocialPoster):
             if self._session:
                 self._session.end()
                 self._session = None
-            if image_path and os.path.exists(image_path):
+            if is_temporary and image_path and os.path.exists(image_path):
                 os.unlink(image_path)
 
     def _format_caption(self, post: Post) -> str:
@@ -75,11 +93,21 @@ class PosterInstagram(SocialPoster):
             caption = f"{caption}\n\n{tags}"
         return caption[:2200]
 
-    def _download_image(self, image_url: str) -> str:
+    def _cached_image(self, post: Post) -> str:
+        if post.image_data is not None and not self._image_cache.contains(post.image_url):
+            return self._image_cache.put(post.image_url, post.image_data)
+        return self._image_cache.path_for(post.image_url)
+
+    def _download_image(self, image_url: str, image_data: bytes | None = None) -> str:
         parsed = urlparse(image_url)
         ext = os.path.splitext(parsed.path)[1] or ".jpg"
         with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-            response = requests.get(image_url, stream=True, timeout=20)
+            if image_data is not None:
+                tmp.write(image_data)
+                return tmp.name
+            response = get_retry_policy().call(
+                self._http.get, image_url, stream=True, idempotent=True
+            )
             response.raise_for_status()
             for chunk in response.iter_content(chunk_size=1024 * 128):
                 if chunk:
@@ -0,0 +1,121 @@
+import asyncio
+import time
+import unittest
+
+from abstractions import (
+    AdoptablePet,
+    AsyncPetSource,
+    AsyncPetSourceAdapter,
+    AsyncSocialPoster,
+    AsyncSocialPosterAdapter,
+    Post,
+    PostResult,
+)
+from main import run_async, stream_pets_async
+from pet_selection import ReservoirSelector
+from tests.test_main import FailingSource, FakePoster, FakeSource
+
+
+def _pet(name):
+    return AdoptablePet(
+        name=name,
+        species="dog",
+        breed="mutt",
+        location="Boston, MA",
+        image_url=f"https://example.com/{name}.jpg",
+    )
+
+
+class SlowAsyncSource(AsyncPetSource):
+    def __init__(self, pets, delay):
+        self.pets = pets
+        self.delay = delay
+
+    @property
+    def source_name(self):
+        return "SlowAsync"
+
+    async def fetch_pets(self):
+        for pet in self.pets:
+            await asyncio.sleep(self.delay)
+            yield pet
+
+
+class SlowAsyncPoster(AsyncSocialPoster):
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+        self.posts = []
+
+    @property
+    def platform_name(self):
+        return self.name
+
+    async def authenticate(self):
+        return True
+
+    async def publish(self, post):
+        await asyncio.sleep(self.delay)
+        self.posts.append(post)
+        return PostResult(success=True, post_id=self.name)
+
+    def format_post(self, pet):
+        return Post(text=f"Meet {pet.name}", image_url=pet.image_url)
+
+
+class AdapterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_source_adapter_streams_sync_pets(self):
+        source = AsyncPetSourceAdapter(FakeSource([_pet(f"Pet{i}") for i in range(60)]), batch_size=25)
+
+        names = [pet.name async for pet in source.fetch_pets()]
+
+        self.assertEqual(names, [f"Pet{i}" for i in range(60)])
+
+    async def test_source_adapter_propagates_errors(self):
+        with self.assertRaises(ValueError):
+            async for _ in AsyncPetSourceAdapter(FailingSource()).fetch_pets():
+                pass
+
+    async def test_poster_adapter_runs_sync_publish(self):
+        poster = FakePoster()
+        adapter = AsyncSocialPosterAdapter(poster)
+
+        result = await adapter.publish(adapter.format_post(_pet("Poppy")))
+
+        self.assertTrue(result.success)
+        self.assertTrue(poster.publish_called)
+        self.assertEqual(adapter.platform_name, "FakePoster")
+
+
+class RunAsyncTests(unittest.IsolatedAsyncioTestCase):
+    async def test_runs_sources_and_posters_concurrently(self):
+        sources = [SlowAsyncSource([_pet("Poppy")], 0.2), SlowAsyncSource([_pet("Rex")], 0.2)]
+        posters = [SlowAsyncPoster("first", 0.2), SlowAsyncPoster("second", 0.2)]
+
+        started = time.monotonic()
+        results = await run_async(sources, posters)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual([result.post_id for result in results], ["first", "second"])
+        self.assertLess(elapsed, 0.7)
+
+    async def test_mixes_sync_and_async_implementations(self):
+        poster = FakePoster()
+
+        results = await run_async([FakeSource([_pet("Poppy")]), FailingSource()], [poster])
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(poster.posts[0].text, "Meet Poppy")
+
+    async def test_slow_source_times_out(self):
+        selector = ReservoirSelector()
+        sources = [SlowAsyncSource([_pet("Slow")], 5), SlowAsyncSource([_pet("Fast")], 0)]
+
+        count = await stream_pets_async(sources, selector, timeout=0.1)
+
+        self.assertEqual(count, 1)
+        self.assertEqual(selector.pick().name, "Fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
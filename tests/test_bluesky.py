@@ -0,0 +1,278 @@
+import base64
+import json
+import os
+import stat
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from abstractions import Post
+from adoption_sources import SourceRescueGroups
+from social_posters.bluesky import PosterBluesky
+from social_posters.bluesky_accounts import BlueskyAccount, accounts_from_env
+from social_posters.bluesky_session import BlueskySession, BlueskySessionStore
+from tests.conftest import _pet
+from tests.test_data_utils import load_sample_data
+
+
+def _jwt(expires_in):
+    claims = json.dumps({"exp": int(time.time() + expires_in)}).encode()
+    payload = base64.urlsafe_b64encode(claims).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def _response(data, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = data
+    return response
+
+
+def _session_response(access_expires_in=7200, refresh_expires_in=86400):
+    return _response({
+        "accessJwt": _jwt(access_expires_in),
+        "refreshJwt": _jwt(refresh_expires_in),
+        "did": "did:plc:test",
+        "handle": "cutepets.bsky.social",
+    })
+
+
+class BlueskySessionStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sessions.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_is_private(self):
+        store = BlueskySessionStore(self.path)
+        session = BlueskySession(access_jwt=_jwt(60), refresh_jwt=_jwt(600), did="did:plc:x")
+
+        store.save("cutepets.bsky.social", session)
+
+        self.assertEqual(BlueskySessionStore(self.path).load("cutepets.bsky.social"), session)
+        self.assertIsNone(store.load("other.bsky.social"))
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_token_expiry(self):
+        self.assertTrue(BlueskySession(_jwt(3600), _jwt(3600), "did").is_access_valid())
+        self.assertFalse(BlueskySession(_jwt(30), _jwt(3600), "did").is_access_valid())
+        self.assertFalse(BlueskySession("not-a-jwt", "x", "did").is_access_valid())
+
+
+class PosterBlueskySessionTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = BlueskySessionStore(os.path.join(self.tmp.name, "sessions.json"))
+        self.http = Mock()
+        env = {"BLUESKY_HANDLE": "cutepets.bsky.social", "BLUESKY_PASSWORD": "secret"}
+        with patch.dict("os.environ", env):
+            self.poster = PosterBluesky(session=self.http, session_store=self.store)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _called_methods(self):
+        return [call.args[0].rsplit("/", 1)[1] for call in self.http.post.call_args_list]
+
+    def test_first_login_creates_and_saves_session(self):
+        self.http.post.return_value = _session_response()
+
+        self.assertTrue(self.poster.authenticate())
+
+        self.assertEqual(self._called_methods(), ["com.atproto.server.createSession"])
+        self.assertIsNotNone(self.store.load("cutepets.bsky.social"))
+
+    def test_valid_stored_session_skips_network(self):
+        self.store.save("cutepets.bsky.social", BlueskySession(_jwt(3600), _jwt(86400), "did:plc:x"))
+
+        self.assertTrue(self.poster.authenticate())
+
+        self.http.post.assert_not_called()
+        self.assertTrue(self.poster.is_authenticated())
+
+    def test_expired_access_token_is_refreshed(self):
+        stored = BlueskySession(_jwt(-10), _jwt(86400), "did:plc:x")
+        self.store.save("cutepets.bsky.social", stored)
+        self.http.post.return_value = _session_response()
+
+        self.assertTrue(self.poster.authenticate())
+
+        self.assertEqual(self._called_methods(), ["com.atproto.server.refreshSession"])
+        headers = self.http.post.call_args.kwargs["headers"]
+        self.assertEqual(headers["Authorization"], f"Bearer {stored.refresh_jwt}")
+        self.assertNotEqual(self.store.load("cutepets.bsky.social"), stored)
+
+    def test_failed_refresh_falls_back_to_password(self):
+        self.store.save("cutepets.bsky.social", BlueskySession(_jwt(-10), _jwt(86400), "did:plc:x"))
+        rejected = _response({"error": "ExpiredToken"}, status_code=400)
+        rejected.raise_for_status.side_effect = Exception("400")
+        self.http.post.side_effect = [rejected, _session_response()]
+
+        self.assertTrue(self.poster.authenticate())
+
+        self.assertEqual(
+            self._called_methods(),
+            ["com.atproto.server.refreshSession", "com.atproto.server.createSession"],
+        )
+
+    def test_publish_renews_token_rejected_by_server(self):
+        self.store.save("cutepets.bsky.social", BlueskySession(_jwt(3600), _jwt(86400), "did:plc:x"))
+        expired = _response({"error": "ExpiredToken"}, status_code=400)
+        created = _response({"uri": "at://post", "cid": "cid"})
+        self.http.post.side_effect = [expired, _session_response(), created]
+
+        result = self.poster.publish(Post(text="Hi"))
+
+        self.assertTrue(result.success)
+        self.assertEqual(
+            self._called_methods(),
+            [
+                "com.atproto.repo.createRecord",
+                "com.atproto.server.refreshSession",
+                "com.atproto.repo.createRecord",
+            ],
+        )
+
+    def test_prepared_post_publishes_with_a_single_create_record(self):
+        self.store.save("cutepets.bsky.social", BlueskySession(_jwt(3600), _jwt(86400), "did:plc:x"))
+        blob = {"$type": "blob", "ref": {"$link": "bafy"}, "mimeType": "image/png", "size": 4}
+        self.http.post.side_effect = [
+            _response({"blob": blob}),
+            _response({"uri": "at://post", "cid": "cid"}),
+        ]
+        post = Post(text="Hi", image_url="https://example.com/pet.png", alt_text="A pet")
+
+        with patch("social_posters.bluesky.prepare_image") as prepare_image:
+            prepare_image.return_value = Mock(data=b"png", mime_type="image/png", aspect_ratio=None)
+            post.image_data = b"png"
+            prepared = json.loads(json.dumps(self.poster.prepare(post)))
+
+        self.assertEqual(self._called_methods(), ["com.atproto.repo.uploadBlob"])
+        self.assertEqual(prepared["embed"]["images"][0]["image"], blob)
+
+        result = self.poster.publish_prepared(prepared)
+
+        self.assertTrue(result.success)
+        self.assertEqual(self._called_methods()[1:], ["com.atproto.repo.createRecord"])
+        record = self.http.post.call_args.kwargs["json"]["record"]
+        self.assertEqual(record["text"], "Hi")
+        self.assertEqual(record["embed"], prepared["embed"])
+        self.assertIn("createdAt", record)
+        self.assertNotIn("rkey", record)
+        self.assertEqual(self.http.post.call_args.kwargs["json"]["rkey"], prepared["rkey"])
+
+    def test_each_prepared_post_gets_its_own_record_key(self):
+        self.store.save("cutepets.bsky.social", BlueskySession(_jwt(3600), _jwt(86400), "did:plc:x"))
+
+        first, second = self.poster.prepare(Post(text="Hi")), self.poster.prepare(Post(text="Hi"))
+
+        self.assertRegex(first["rkey"], r"^[2-7a-j][2-7a-z]{12}$")
+        self.assertNotEqual(first["rkey"], second["rkey"])
+
+    def test_republishing_a_created_record_counts_as_success(self):
+        self.store.save("cutepets.bsky.social", BlueskySession(_jwt(3600), _jwt(86400), "did:plc:x"))
+        duplicate = _response({"error": "InvalidRequest", "message": "Record already exists"}, status_code=400)
+        duplicate.raise_for_status.side_effect = requests.HTTPError("400", response=duplicate)
+        self.http.post.return_value = duplicate
+
+        result = self.poster.publish_prepared({"text": "Hi", "rkey": "3kabcdefghijk"})
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.post_url, "at://did:plc:x/app.bsky.feed.post/3kabcdefghijk")
+
+
+class BlueskyAccountTests(unittest.TestCase):
+    def test_accounts_come_from_environment(self):
+        env = {
+            "BLUESKY_ACCOUNTS": "boston, worcester",
+            "BLUESKY_BOSTON_HANDLE": "boston.bsky.social",
+            "BLUESKY_BOSTON_PASSWORD": "one",
+            "BLUESKY_BOSTON_LOCATIONS": "Boston, Cambridge",
+            "BLUESKY_WORCESTER_HANDLE": "worcester.bsky.social",
+            "BLUESKY_WORCESTER_PASSWORD": "two",
+            "BLUESKY_WORCESTER_SPECIES": "cat",
+        }
+        with patch.dict("os.environ", env):
+            boston, worcester = accounts_from_env()
+
+        self.assertEqual(boston.handle, "boston.bsky.social")
+        self.assertEqual(boston.locations, ("Boston", "Cambridge"))
+        self.assertEqual(worcester.species, ("cat",))
+
+    def test_missing_password_is_an_error(self):
+        env = {"BLUESKY_ACCOUNTS": "boston", "BLUESKY_BOSTON_HANDLE": "boston.bsky.social"}
+        with patch.dict("os.environ", env), self.assertRaises(ValueError):
+            accounts_from_env()
+
+    def test_routing_rules(self):
+        account = BlueskyAccount("boston", "h", "p", locations=("Boston", "Cambridge"), species=("Dog",))
+
+        self.assertTrue(account.accepts(_pet("Rex", location="Cambridge, MA")))
+        self.assertFalse(account.accepts(_pet("Rex", location="Worcester, MA")))
+        self.assertFalse(account.accepts(_pet("Rex", species="cat", location="Boston, MA")))
+        self.assertTrue(BlueskyAccount("all", "h", "p").accepts(_pet("Rex", location="Worcester, MA")))
+
+    def test_routes_rescue_groups_pets_by_their_shelter_city(self):
+        doli, kathy, cylana = load_sample_data()
+        kathy["relationships"]["locations"]["data"] = [{"type": "locations", "id": "2"}]
+        del cylana["relationships"]
+        response = Mock()
+        response.content = json.dumps({
+            "data": [doli, kathy, cylana],
+            "included": [
+                {"type": "locations", "id": "1000008099", "attributes": {"city": "Worcester", "state": "MA"}},
+                {"type": "locations", "id": "2", "attributes": {"city": "Cambridge", "state": "MA"}},
+            ],
+        }).encode()
+        session = Mock()
+        session.post.return_value = response
+        pets = list(SourceRescueGroups(api_key="key", session=session).fetch_pets())
+        boston = BlueskyAccount("boston", "h", "p", locations=("Boston", "Cambridge"))
+        worcester = BlueskyAccount("worcester", "h", "p", locations=("Worcester",))
+
+        self.assertEqual([pet.name for pet in pets if boston.accepts(pet)], ["Kathy", "Cylana"])
+        self.assertEqual([pet.name for pet in pets if worcester.accepts(pet)], ["Doli"])
+
+
+class PosterBlueskyAccountTests(unittest.TestCase):
+    def setUp(self):
+        self.http = Mock()
+        self.account = BlueskyAccount("worcester", "worcester.bsky.social", "secret", locations=("Worcester",))
+        self.rate_limit = Mock()
+        self.poster = PosterBluesky(session=self.http, account=self.account, rate_limit=self.rate_limit)
+
+    def test_logs_in_as_the_account(self):
+        self.http.post.return_value = _session_response()
+
+        self.assertTrue(self.poster.authenticate())
+
+        login = self.http.post.call_args.kwargs["json"]
+        self.assertEqual(login, {"identifier": "worcester.bsky.social", "password": "secret"})
+        self.assertEqual(self.poster.platform_name, "Bluesky (worcester)")
+
+    def test_routes_pets_by_account_rules(self):
+        self.assertTrue(self.poster.accepts(_pet("Rex", location="Worcester, MA")))
+        self.assertFalse(self.poster.accepts(_pet("Rex", location="Boston, MA")))
+
+    def test_posts_are_tagged_with_the_account_region(self):
+        post = self.poster.format_post(_pet("Rex", location="Worcester, MA"))
+
+        self.assertIn("Worcester", post.tags)
+        self.assertNotIn("Boston", post.tags)
+        self.assertEqual(BlueskyAccount("north-shore", "h", "p").hashtag, "NorthShore")
+
+    def test_created_records_count_against_the_account_rate_limit(self):
+        self.http.post.side_effect = [_session_response(), _response({"uri": "at://post", "cid": "cid"})]
+
+        result = self.poster.publish(Post(text="Hi"))
+
+        self.assertTrue(result.success)
+        self.rate_limit.acquire.assert_called_once_with()
+
+if __name__ == "__main__":
+    unittest.main()
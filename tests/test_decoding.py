@@ -0,0 +1,80 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from adoption_sources.decoding import ANIMAL_ATTRIBUTES, available_backends, get_decoder
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "sample_data.json")
+
+
+def _load_fixture_bytes():
+    with open(FIXTURE_PATH, "rb") as f:
+        return f.read()
+
+
+class JsonDecoderTests(unittest.TestCase):
+    def setUp(self):
+        self.raw = _load_fixture_bytes()
+        self.response = json.dumps({"data": json.loads(self.raw), "meta": {"pages": 2}}).encode()
+
+    def test_json_backend_is_always_available(self):
+        self.assertIn("json", available_backends())
+        self.assertEqual(get_decoder("json").backend, "json")
+
+    def test_unknown_backend_raises(self):
+        with self.assertRaises(ValueError):
+            get_decoder("yaml")
+
+    def test_all_backends_trim_to_the_same_records(self):
+        expected = get_decoder("json").decode_animals_response(self.response)
+        self.assertEqual(expected["meta"], {"pages": 2})
+        self.assertEqual(len(expected["data"]), 3)
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                decoder = get_decoder(backend)
+                self.assertEqual(decoder.decode_animals_response(self.response), expected)
+                self.assertEqual(decoder.decode_animals(self.raw), expected["data"])
+
+    def test_unread_attributes_are_dropped(self):
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                animal = get_decoder(backend).decode_animals(self.raw)[0]
+                self.assertEqual(animal["id"], "10131543")
+                self.assertTrue(animal["attributes"]["name"].startswith("Doli"))
+                self.assertNotIn("activityLevel", animal["attributes"])
+                self.assertLessEqual(set(animal["attributes"]), set(ANIMAL_ATTRIBUTES))
+
+    def test_included_locations_are_kept_for_every_backend(self):
+        response = json.dumps({
+            "data": json.loads(self.raw),
+            "included": [
+                {"type": "locations", "id": "1000008099", "attributes": {"city": "Boston", "state": "MA", "lat": 42}},
+                {"type": "breeds", "id": "152", "attributes": {"name": "Husky"}},
+            ],
+        }).encode()
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                body = get_decoder(backend).decode_animals_response(response)
+                self.assertEqual(body["included"], [
+                    {"id": "1000008099", "type": "locations", "attributes": {"city": "Boston", "state": "MA"}},
+                ])
+                self.assertEqual(
+                    body["data"][0]["relationships"],
+                    {"locations": {"data": [{"type": "locations", "id": "1000008099"}]}},
+                )
+
+    def test_missing_and_null_attributes_are_kept_distinct(self):
+        data = b'[{"id": 7, "attributes": {"name": "Poppy", "breedString": null}}]'
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                (animal,) = get_decoder(backend).decode_animals(data)
+                self.assertEqual(animal["attributes"], {"name": "Poppy", "breedString": None})
+                self.assertEqual(animal["id"], 7)
+
+    def test_backend_can_be_chosen_from_environment(self):
+        with patch.dict("os.environ", {"CUTEPETSBOSTON_JSON_BACKEND": "json"}):
+            self.assertEqual(get_decoder().backend, "json")
+
+if __name__ == "__main__":
+    unittest.main()
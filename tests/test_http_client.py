@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from http_client import HttpClientConfig, PooledSession, get_session
+
+
+class PooledSessionTests(unittest.TestCase):
+    def test_applies_default_timeout(self):
+        session = PooledSession(HttpClientConfig(timeout=(1, 2)))
+
+        with patch("requests.Session.request", return_value=Mock()) as request:
+            session.get("https://example.com")
+
+        self.assertEqual(request.call_args.kwargs["timeout"], (1, 2))
+
+    def test_explicit_timeout_wins(self):
+        session = PooledSession(HttpClientConfig(timeout=(1, 2)))
+
+        with patch("requests.Session.request", return_value=Mock()) as request:
+            session.get("https://example.com", timeout=5)
+
+        self.assertEqual(request.call_args.kwargs["timeout"], 5)
+
+    def test_host_pool_sizes_mount_dedicated_adapter(self):
+        session = PooledSession(HttpClientConfig(host_pool_sizes={"bsky.social": 4}))
+
+        adapter = session.get_adapter("https://bsky.social/xrpc/x")
+
+        self.assertIsNot(adapter, session.get_adapter("https://example.com/"))
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_get_session_is_shared(self):
+        self.assertIs(get_session(), get_session())
+
+
+class SessionInjectionTests(unittest.TestCase):
+    def test_bluesky_publish_uses_injected_session(self):
+        from social_posters.bluesky import PosterBluesky
+        from abstractions import Post
+
+        session = Mock()
+        session.get.return_value.content = b"\xff\xd8\xff\xe0 image"
+        session.post.return_value.json.return_value = {
+            "accessJwt": "token",
+            "refreshJwt": "refresh",
+            "did": "did:plc:test",
+            "blob": {"ref": "blob"},
+        }
+        poster = PosterBluesky(session=session)
+        poster._is_available = True
+
+        result = poster.publish(Post(text="Hi", image_url="https://example.com/a.jpg"))
+
+        self.assertTrue(result.success)
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(session.post.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock
+
+from abstractions import AdoptablePet
+from main import publish_all
+from social_posters.image_cache import ImageCache
+
+
+def _session(payloads):
+    session = Mock()
+
+    def get(url, **kwargs):
+        response = Mock()
+        response.content = payloads[url]
+        return response
+
+    session.get.side_effect = get
+    return session
+
+
+class ImageCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_downloads_each_url_once(self):
+        session = _session({"https://example.com/a.jpg": b"aaa"})
+        cache = ImageCache(self.directory, session=session)
+
+        self.assertEqual(cache.get("https://example.com/a.jpg"), b"aaa")
+        self.assertEqual(cache.get("https://example.com/a.jpg"), b"aaa")
+
+        self.assertEqual(session.get.call_count, 1)
+
+    def test_cache_persists_across_instances(self):
+        session = _session({"https://example.com/a.jpg": b"aaa"})
+        ImageCache(self.directory, session=session).get("https://example.com/a.jpg")
+
+        cache = ImageCache(self.directory, session=session)
+
+        self.assertTrue(cache.contains("https://example.com/a.jpg"))
+        self.assertEqual(cache.get("https://example.com/a.jpg"), b"aaa")
+        self.assertEqual(session.get.call_count, 1)
+
+    def test_identical_content_is_stored_once(self):
+        session = _session({
+            "https://example.com/a.jpg?width=800": b"same",
+            "https://example.com/a.jpg?width=100": b"same",
+        })
+        cache = ImageCache(self.directory, session=session)
+
+        first = cache.path_for("https://example.com/a.jpg?width=800")
+        second = cache.path_for("https://example.com/a.jpg?width=100")
+
+        self.assertEqual(first, second)
+
+    def test_evicts_least_recently_used_over_budget(self):
+        session = _session({
+            "https://example.com/a.jpg": b"a" * 60,
+            "https://example.com/b.jpg": b"b" * 60,
+        })
+        cache = ImageCache(self.directory, max_bytes=100, session=session)
+
+        old = cache.path_for("https://example.com/a.jpg")
+        os.utime(old, (0, 0))
+        cache.get("https://example.com/b.jpg")
+
+        self.assertFalse(cache.contains("https://example.com/a.jpg"))
+        self.assertTrue(cache.contains("https://example.com/b.jpg"))
+        self.assertEqual(cache.get("https://example.com/a.jpg"), b"a" * 60)
+        self.assertEqual(session.get.call_count, 3)
+
+    def test_eviction_removes_the_url_entries_of_evicted_images(self):
+        session = _session({
+            "https://example.com/a.jpg": b"a" * 60,
+            "https://example.com/a.jpg?width=100": b"a" * 60,
+            "https://example.com/b.jpg": b"b" * 60,
+        })
+        cache = ImageCache(self.directory, max_bytes=100, session=session)
+
+        cache.get("https://example.com/a.jpg")
+        os.utime(cache.path_for("https://example.com/a.jpg?width=100"), (0, 0))
+        cache.get("https://example.com/b.jpg")
+
+        self.assertEqual(len(os.listdir(os.path.join(self.directory, "urls"))), 1)
+        self.assertTrue(cache.contains("https://example.com/b.jpg"))
+
+    def test_concurrent_requests_share_one_download(self):
+        release = threading.Event()
+        session = _session({"https://example.com/a.jpg": b"aaa"})
+        original = session.get.side_effect
+
+        def slow_get(url, **kwargs):
+            release.wait(1)
+            return original(url, **kwargs)
+
+        session.get.side_effect = slow_get
+        cache = ImageCache(self.directory, session=session)
+        threads = [
+            threading.Thread(target=cache.get, args=("https://example.com/a.jpg",))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(session.get.call_count, 1)
+
+    def test_publish_all_reads_shared_image_from_cache(self):
+        from tests.test_main import SlowPoster
+
+        url = "https://example.com/poppy.jpg"
+        cache = ImageCache(self.directory, session=_session({url: b"img"}))
+        pet = AdoptablePet(name="Poppy", species="dog", breed="mutt", location="Boston", image_url=url)
+        posters = [SlowPoster("first", 0), SlowPoster("second", 0)]
+
+        publish_all(posters, pet, image_cache=cache)
+        publish_all(posters, pet, image_cache=cache)
+
+        self.assertEqual(cache._session.get.call_count, 1)
+        self.assertEqual(posters[1].posts[1].image_data, b"img")
+
+
+if __name__ == "__main__":
+    unittest.main()
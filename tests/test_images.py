@@ -0,0 +1,98 @@
+import io
+import random
+import unittest
+from unittest.mock import patch
+
+from social_posters import images
+from social_posters.images import detect_mime_type, prepare_image, probe_dimensions
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def _encode(image, format, **kwargs):
+    buffer = io.BytesIO()
+    image.save(buffer, format=format, **kwargs)
+    return buffer.getvalue()
+
+
+def _noisy_image(width, height):
+    rng = random.Random(0)
+    image = Image.new("RGB", (width, height))
+    image.putdata([
+        (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        for _ in range(width * height)
+    ])
+    return image
+
+
+class DetectionTests(unittest.TestCase):
+    def test_detect_mime_type(self):
+        self.assertEqual(detect_mime_type(b"\xff\xd8\xff\xe0rest"), "image/jpeg")
+        self.assertEqual(detect_mime_type(b"\x89PNG\r\n\x1a\nrest"), "image/png")
+        self.assertEqual(detect_mime_type(b"GIF89arest"), "image/gif")
+        self.assertEqual(detect_mime_type(b"RIFF\x00\x00\x00\x00WEBPVP8 "), "image/webp")
+        self.assertIsNone(detect_mime_type(b"<html>"))
+
+    def test_passthrough_without_pillow(self):
+        data = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x03\x20\x00\x00\x02\x58"
+
+        with patch.object(images, "Image", None):
+            prepared = prepare_image(data)
+
+        self.assertEqual(prepared.data, data)
+        self.assertEqual(prepared.mime_type, "image/png")
+        self.assertEqual(prepared.aspect_ratio, {"width": 800, "height": 600})
+
+
+@unittest.skipIf(Image is None, "Pillow not installed")
+class PrepareImageTests(unittest.TestCase):
+    def test_probe_jpeg_dimensions(self):
+        data = _encode(Image.new("RGB", (320, 240)), "JPEG")
+
+        self.assertEqual(probe_dimensions(data), (320, 240))
+
+    def test_large_image_is_shrunk_under_limit(self):
+        data = _encode(_noisy_image(600, 450), "PNG")
+
+        prepared = prepare_image(data, max_bytes=40_000, max_dimension=500)
+
+        self.assertLessEqual(len(prepared.data), 40_000)
+        self.assertEqual(prepared.mime_type, "image/jpeg")
+        self.assertLessEqual(max(prepared.width, prepared.height), 500)
+        self.assertAlmostEqual(prepared.width / prepared.height, 4 / 3, places=1)
+
+    def test_metadata_is_stripped(self):
+        image = Image.new("RGB", (64, 48), (200, 100, 50))
+        exif = Image.Exif()
+        exif[0x010F] = "SecretCam"  # Make
+        data = _encode(image, "JPEG", exif=exif)
+
+        prepared = prepare_image(data)
+
+        self.assertNotIn(b"SecretCam", prepared.data)
+        with Image.open(io.BytesIO(prepared.data)) as result:
+            self.assertFalse(result.getexif())
+
+    def test_transparent_png_is_flattened(self):
+        data = _encode(Image.new("RGBA", (10, 10), (0, 0, 0, 0)), "PNG")
+
+        prepared = prepare_image(data)
+
+        with Image.open(io.BytesIO(prepared.data)) as result:
+            self.assertEqual(result.mode, "RGB")
+            self.assertGreater(result.getpixel((5, 5))[0], 240)
+
+    def test_undecodable_data_is_passed_through(self):
+        data = b"\xff\xd8\xff\xe0 not really a jpeg"
+
+        prepared = prepare_image(data)
+
+        self.assertEqual(prepared.data, data)
+        self.assertEqual(prepared.mime_type, "image/jpeg")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import requests
+
+from abstractions import AdoptablePet
+from adoption_sources import RescueGroupsQuery, RescueGroupsSync, SourceManual, SourceSQLite
+from retry import RetryPolicy
+
+
+def _pet(pet_id, name="Doli", updated_at=None):
+    return AdoptablePet(
+        name=name, species="dog", breed="Mixed", location="Boston, MA",
+        pet_id=pet_id, updated_at=updated_at,
+    )
+
+
+def _animal(animal_id, name, updated):
+    return {
+        "type": "animals",
+        "id": animal_id,
+        "attributes": {"name": name, "slug": name.lower(), "updatedDate": updated},
+    }
+
+
+class SourceSQLiteTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = SourceSQLite(os.path.join(self.tmpdir.name, "inventory.sqlite3"))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trips_pets(self):
+        pets = [_pet("1", "Doli", "2025-01-01T00:00:00Z"), _pet("2", "Kathy")]
+
+        self.store.upsert(pets)
+
+        self.assertEqual(list(self.store.fetch_pets()), pets)
+        self.assertEqual(len(self.store), 2)
+
+    def test_upsert_replaces_and_skips_unkeyed_pets(self):
+        self.store.upsert([_pet("1", "Doli")])
+        keys = self.store.upsert([_pet("1", "Doli Mae"), _pet(None, "Nobody")])
+
+        self.assertEqual(keys, ["id:1"])
+        self.assertEqual([pet.name for pet in self.store.fetch_pets()], ["Doli Mae"])
+
+    def test_prune_keeps_pets_another_origin_still_lists(self):
+        self.store.upsert([_pet("1"), _pet("2")], origin="north")
+        self.store.upsert([_pet("2")], origin="south")
+
+        removed = self.store.prune("north", keep=[])
+
+        self.assertEqual(removed, 1)
+        self.assertEqual([pet.pet_id for pet in self.store.fetch_pets()], ["2"])
+
+    def test_sync_state(self):
+        self.assertIsNone(self.store.get_state("mark"))
+        self.store.set_state("mark", "2025-01-01T00:00:00Z")
+        self.assertEqual(self.store.get_state("mark"), "2025-01-01T00:00:00Z")
+
+
+class SourceSQLiteQueryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "inventory.sqlite3")
+        self.store = SourceSQLite(self.path)
+        self.store.upsert([
+            AdoptablePet("Doli", "dog", "Husky", "Boston, MA", image_url="d.jpg",
+                         size_group="Large", age_group="Senior", pet_id="1"),
+            AdoptablePet("Kathy", "dog", "Terrier", "Boston, MA", image_url="k.jpg",
+                         size_group="Small", age_group="Adult", pet_id="2"),
+            AdoptablePet("Cylana", "cat", "Tabby", "Cambridge, MA",
+                         size_group="Small", age_group="Young", pet_id="3"),
+        ])
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _names(self, pets):
+        return [pet.name for pet in pets]
+
+    def test_query_filters_in_sql(self):
+        self.assertEqual(self._names(self.store.query(species="dog", size_group="Small")), ["Kathy"])
+        self.assertEqual(self._names(self.store.query(age_group=("Senior", "Young"))), ["Doli", "Cylana"])
+        self.assertEqual(self._names(self.store.query(has_image=False)), ["Cylana"])
+        self.assertEqual(self.store.count(location="Boston, MA", has_image=True), 2)
+
+    def test_unknown_criterion_raises(self):
+        with self.assertRaises(TypeError):
+            list(self.store.query(colour="black"))
+
+    def test_counts_and_sample(self):
+        self.assertEqual(self.store.counts("size_group"), {"Large": 1, "Small": 2})
+        self.assertEqual(self.store.counts("species", has_image=True), {"dog": 2})
+
+        sample = self.store.sample(2, species="dog")
+        self.assertEqual(sorted(self._names(sample)), ["Doli", "Kathy"])
+
+    def test_recently_posted_pets_are_excluded_and_survive_upserts(self):
+        doli = next(self.store.query(species="dog", size_group="Large"))
+        self.store.mark_posted(doli, now=1000)
+        self.store.upsert([doli])
+
+        recent = self.store.query(not_posted_within_days=1, now=1000 + 3600)
+        later = self.store.query(not_posted_within_days=1, now=1000 + 2 * 86400)
+
+        self.assertEqual(self._names(recent), ["Kathy", "Cylana"])
+        self.assertEqual(self._names(later), ["Doli", "Kathy", "Cylana"])
+
+    def test_filters_apply_to_fetch_pets(self):
+        source = SourceSQLite(self.path, filters={"species": "cat"})
+
+        self.assertEqual(self._names(source.fetch_pets()), ["Cylana"])
+
+    def test_filters_use_indexes(self):
+        with sqlite3.connect(self.path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM pets WHERE age_group = ?", ("Senior",)
+            ).fetchall()
+        self.assertIn("pets_age_group", str(plan))
+
+    def test_materialize_copies_any_source(self):
+        store = SourceSQLite(os.path.join(self.tmpdir.name, "manual.sqlite3"))
+
+        stored = store.materialize(SourceManual(), batch_size=2)
+
+        self.assertEqual(stored, 3)
+        self.assertEqual(store.counts("age_group"), {"Senior": 3})
+        self.assertEqual(store.count(species="dog", has_image=True), 3)
+
+    def test_upgrades_stores_created_without_new_columns(self):
+        path = os.path.join(self.tmpdir.name, "old.sqlite3")
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE pets (key TEXT PRIMARY KEY, name TEXT, species TEXT, breed TEXT,"
+                " location TEXT, image_url TEXT, pet_id TEXT, synced_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO pets VALUES ('id:9', 'Poppy', 'dog', 'Mixed', 'Boston, MA', 'p.jpg', '9', 0)"
+            )
+        conn.close()
+
+        store = SourceSQLite(path)
+
+        self.assertEqual(self._names(store.query(has_image=True)), ["Poppy"])
+
+
+class RescueGroupsSyncTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = SourceSQLite(os.path.join(self.tmpdir.name, "inventory.sqlite3"))
+        self.listed = [
+            _animal("1", "Doli", "2025-01-01T00:00:00Z"),
+            _animal("2", "Kathy", "2025-01-02T00:00:00Z"),
+        ]
+        self.requests = []
+        self.session = Mock()
+        self.session.post.side_effect = self._post
+        self.sync = RescueGroupsSync(
+            self.store, [RescueGroupsQuery()], api_key="key", session=self.session,
+            full_sync_interval=3600, retry=RetryPolicy(max_retries=0),
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _post(self, url, **kwargs):
+        filters = kwargs["json"]["data"].get("filters", [])
+        self.requests.append((url, filters))
+        since = next((f["criteria"] for f in filters if f["fieldName"] == "animals.updatedDate"), "")
+        animals = [a for a in self.listed if a["attributes"]["updatedDate"] > since]
+        response = Mock()
+        response.content = json.dumps({"data": animals, "meta": {"pages": 1}}).encode()
+        return response
+
+    def test_first_sync_is_full(self):
+        result = self.sync.sync(now=1000)
+
+        self.assertEqual((result.upserted, result.full_syncs), (2, 1))
+        url, filters = self.requests[0]
+        self.assertIn("sort=animals.id", url)
+        self.assertEqual(filters, [])
+
+    def test_later_syncs_only_fetch_updated_animals(self):
+        self.sync.sync(now=1000)
+        self.listed.append(_animal("3", "Cylana", "2025-01-03T00:00:00Z"))
+
+        result = self.sync.sync(now=1060)
+
+        url, filters = self.requests[-1]
+        self.assertIn("sort=animals.updatedDate", url)
+        self.assertEqual(filters[0]["criteria"], "2025-01-02T00:00:00Z")
+        self.assertEqual((result.upserted, result.full_syncs), (1, 0))
+        self.assertEqual(len(self.store), 3)
+
+    def test_full_resync_removes_delisted_animals(self):
+        self.sync.sync(now=1000)
+        del self.listed[0]
+
+        self.assertEqual(self.sync.sync(now=1060).removed, 0)
+        result = self.sync.sync(now=1000 + 3600)
+
+        self.assertEqual((result.full_syncs, result.removed), (1, 1))
+        self.assertEqual([pet.name for pet in self.store.fetch_pets()], ["Kathy"])
+
+    def test_configured_updated_since_is_a_floor_for_every_sync(self):
+        sync = RescueGroupsSync(
+            self.store, [RescueGroupsQuery()], api_key="key", session=self.session,
+            retry=RetryPolicy(max_retries=0),
+            updated_since=datetime(2025, 1, 1, 12, tzinfo=timezone.utc),
+        )
+
+        sync.sync(now=1000)
+        self.assertEqual(self.requests[-1][1][0]["criteria"], "2025-01-01T12:00:00Z")
+        self.assertEqual([pet.name for pet in self.store.fetch_pets()], ["Kathy"])
+
+        self.listed.append(_animal("3", "Cylana", "2025-01-03T00:00:00Z"))
+        sync.sync(now=1060)
+        self.assertEqual(self.requests[-1][1][0]["criteria"], "2025-01-02T00:00:00Z")
+
+    def test_serves_stored_pets_when_sync_fails(self):
+        self.sync.sync(now=1000)
+        self.session.post.side_effect = requests.ConnectionError("offline")
+
+        pets = list(self.sync.fetch_pets())
+
+        self.assertEqual([pet.name for pet in pets], ["Doli", "Kathy"])
+
+    def test_failure_with_empty_store_raises(self):
+        self.session.post.side_effect = requests.ConnectionError("offline")
+
+        with self.assertRaises(requests.ConnectionError):
+            list(self.sync.fetch_pets())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,15 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
+from datetime import timedelta
+from unittest.mock import Mock, patch
 
 from abstractions import AdoptablePet, Post, PostResult
-from main import create_posters, run
+from main import create_posters, create_sources, publish_all, run, stream_pets
+from pet_selection import ReservoirSelector
+from tests.conftest import _pet
 
 
 class FakeSource:
@@ -14,6 +22,24 @@ class FakeSource:
         return self.pets
 
 
+class FailingSource:
+    source_name = "Failing"
+
+    def fetch_pets(self):
+        raise ValueError("API key not configured")
+
+
+class BlockingSource:
+    source_name = "Blocking"
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def fetch_pets(self):
+        self.release.wait(5)
+        return []
+
+
 class FakePoster:
     platform_name = "FakePoster"
 
@@ -54,6 +80,185 @@ class RunFlowTests(unittest.TestCase):
         self.assertTrue(poster_two.publish_called)
         self.assertEqual(len(results), 2)
 
+    def test_each_routing_group_gets_its_own_pet(self):
+        class RegionalPoster(FakePoster):
+            def __init__(self, region):
+                super().__init__()
+                self.platform_name = f"Fake ({region})"
+                self.routing_key = region
+
+            def accepts(self, pet):
+                return self.routing_key in pet.location
+
+        boston = RegionalPoster("Boston")
+        worcester = RegionalPoster("Worcester")
+        everywhere = FakePoster()
+
+        results = run(
+            [FakeSource([
+                _pet("Rex", location="Worcester, MA", image_url="https://example.com/rex.jpg"),
+                _pet("Poppy", location="Boston, MA", image_url="https://example.com/poppy.jpg"),
+            ])],
+            [boston, worcester, everywhere],
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual([post.text for post in boston.posts], ["Meet Poppy"])
+        self.assertEqual([post.text for post in worcester.posts], ["Meet Rex"])
+        self.assertEqual(len(everywhere.posts), 1)
+
+    def test_posted_pets_are_marked_in_the_inventory(self):
+        from adoption_sources.sqlite import SourceSQLite
+
+        pet = AdoptablePet(
+            name="Poppy",
+            species="dog",
+            breed="mutt",
+            location="Boston, MA",
+            image_url="https://example.com/poppy.jpg",
+            pet_id="1",
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            inventory = SourceSQLite(
+                os.path.join(directory, "inventory.sqlite3"),
+                filters={"not_posted_within_days": 30},
+            )
+            inventory.upsert([pet])
+
+            run([inventory], [FakePoster()])
+
+            self.assertEqual(list(inventory.fetch_pets()), [])
+
+
+class SlowPoster(FakePoster):
+    wants_image_data = True
+
+    def __init__(self, name, delay):
+        super().__init__()
+        self.platform_name = name
+        self.delay = delay
+
+    def publish(self, post):
+        time.sleep(self.delay)
+        super().publish(post)
+        return PostResult(success=True, post_id=self.platform_name)
+
+
+class PublishAllTests(unittest.TestCase):
+    def setUp(self):
+        self.pet = AdoptablePet(
+            name="Poppy",
+            species="dog",
+            breed="mutt",
+            location="Boston, MA",
+            image_url="https://example.com/poppy.jpg",
+        )
+
+    def test_publishes_concurrently_and_keeps_order(self):
+        posters = [SlowPoster("first", 0.3), SlowPoster("second", 0.1)]
+
+        with patch("social_posters.images.download_image", return_value=b"img"):
+            started = time.monotonic()
+            results = publish_all(posters, self.pet)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual([result.post_id for result in results], ["first", "second"])
+        self.assertLess(elapsed, 0.39)
+
+    def test_image_downloaded_once_and_shared(self):
+        posters = [SlowPoster("first", 0), SlowPoster("second", 0)]
+
+        with patch("social_posters.images.download_image", return_value=b"img") as download:
+            publish_all(posters, self.pet)
+
+        download.assert_called_once_with(self.pet.image_url)
+        for poster in posters:
+            self.assertEqual(poster.posts[0].image_data, b"img")
+
+    def test_no_download_when_no_poster_wants_image(self):
+        with patch("social_posters.images.download_image") as download:
+            publish_all([FakePoster()], self.pet)
+
+        download.assert_not_called()
+
+    def test_deadline_and_errors_become_failed_results(self):
+        broken = FakePoster()
+        broken.publish = Mock(side_effect=RuntimeError("boom"))
+        posters = [SlowPoster("slow", 1), broken]
+
+        with patch("social_posters.images.download_image", return_value=b"img"):
+            results = publish_all(posters, self.pet, timeout=0.1)
+
+        self.assertFalse(results[0].success)
+        self.assertIn("Timed out", results[0].error_message)
+        self.assertFalse(results[1].success)
+        self.assertEqual(results[1].error_message, "boom")
+
+    def test_posts_that_finish_after_the_deadline_are_recorded(self):
+        from main import _record_late_posts
+
+        history = Mock()
+        late = []
+        with patch("social_posters.images.download_image", return_value=b"img"):
+            results = publish_all([SlowPoster("slow", 0.3)], self.pet, timeout=0.05, late=late)
+        self.assertFalse(results[0].success)
+
+        _record_late_posts([(poster, self.pet, future) for poster, future in late], history, [], timeout=5)
+
+        history.record.assert_called_once_with(self.pet)
+
+
+class StreamPetsTests(unittest.TestCase):
+    def _pet(self, name):
+        return AdoptablePet(name=name, species="dog", breed="mutt", location="Boston, MA")
+
+    def test_feeds_pets_from_all_sources_into_the_selector(self):
+        sources = [FakeSource([self._pet("Poppy")]), FakeSource([self._pet("Rex")])]
+        selector = ReservoirSelector(k=2)
+
+        count = stream_pets(sources, selector)
+
+        self.assertEqual(count, 2)
+        self.assertEqual({pet.name for pet in selector.selected()}, {"Poppy", "Rex"})
+
+    def test_failing_source_is_skipped(self):
+        selector = ReservoirSelector(k=2)
+
+        count = stream_pets([FailingSource(), FakeSource([self._pet("Poppy")])], selector)
+
+        self.assertEqual(count, 1)
+        self.assertEqual([pet.name for pet in selector.selected()], ["Poppy"])
+
+    def test_slow_source_does_not_block(self):
+        blocking = BlockingSource()
+        selector = ReservoirSelector(k=2)
+        started = time.monotonic()
+
+        stream_pets([blocking, FakeSource([self._pet("Poppy")])], selector, timeout=0.2)
+
+        blocking.release.set()
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([pet.name for pet in selector.selected()], ["Poppy"])
+
+    def test_timed_out_source_stops_feeding_the_selector(self):
+        class LateSource(BlockingSource):
+            def fetch_pets(self):
+                self.release.wait(5)
+                yield _pet("Late", image_url="https://example.com/late.jpg")
+
+        late = LateSource()
+        selector = ReservoirSelector(k=2)
+
+        stream_pets([late, FakeSource([self._pet("Poppy")])], selector, timeout=0.1)
+        late.release.set()
+        time.sleep(0.1)
+
+        self.assertEqual([pet.name for pet in selector.selected()], ["Poppy"])
+
+    def test_all_sources_failing_exits(self):
+        with self.assertRaises(SystemExit):
+            stream_pets([FailingSource()], ReservoirSelector())
+
 
 class CreatePostersTests(unittest.TestCase):
     def test_debug_returns_debug_poster(self):
@@ -62,6 +267,72 @@ class CreatePostersTests(unittest.TestCase):
         self.assertEqual(len(posters), 1)
         self.assertEqual(posters[0].platform_name, "Debug")
 
+    def test_enabled_posters_come_from_environment(self):
+        with patch.dict("os.environ", {"CUTEPETSBOSTON_POSTERS": "debug"}):
+            posters = create_posters(session=Mock())
+
+        self.assertEqual([poster.platform_name for poster in posters], ["Debug"])
+
+    def test_one_bluesky_poster_per_account(self):
+        env = {
+            "CUTEPETSBOSTON_POSTERS": "bluesky",
+            "BLUESKY_ACCOUNTS": "boston,worcester",
+            "BLUESKY_BOSTON_HANDLE": "boston.bsky.social",
+            "BLUESKY_BOSTON_PASSWORD": "one",
+            "BLUESKY_WORCESTER_HANDLE": "worcester.bsky.social",
+            "BLUESKY_WORCESTER_PASSWORD": "two",
+        }
+        with patch.dict("os.environ", env):
+            posters = create_posters(session=Mock())
+
+        self.assertEqual(
+            [poster.platform_name for poster in posters], ["Bluesky (boston)", "Bluesky (worcester)"]
+        )
+        self.assertEqual([poster.username for poster in posters], ["boston.bsky.social", "worcester.bsky.social"])
+
+    def test_unknown_poster_raises(self):
+        with patch.dict("os.environ", {"CUTEPETSBOSTON_POSTERS": "myspace"}):
+            with self.assertRaises(ValueError):
+                create_posters()
+
+
+class CreateSourcesTests(unittest.TestCase):
+    def test_fans_out_over_species_and_postal_codes(self):
+        env = {
+            "CUTEPETSBOSTON_SPECIES": "dogs, cats",
+            "CUTEPETSBOSTON_POSTAL_CODES": "02108,02139",
+        }
+        with patch.dict("os.environ", env):
+            sources = create_sources(session=Mock())
+
+        self.assertEqual(len(sources), 1)
+        self.assertEqual(len(sources[0].queries), 4)
+
+    def test_passes_server_side_filters(self):
+        env = {"CUTEPETSBOSTON_AGE_GROUPS": "Young,Senior", "CUTEPETSBOSTON_UPDATED_WITHIN_DAYS": "7"}
+        with patch.dict("os.environ", env):
+            (source,) = create_sources(session=Mock())
+
+        query = source._sources[0]
+        self.assertEqual(query.age_groups, ("Young", "Senior"))
+        self.assertEqual(query.sexes, ())
+        self.assertEqual(query.updated_within, timedelta(days=7))
+
+    def test_sqlite_source_serves_inventory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            env = {"CUTEPETSBOSTON_SOURCES": "sqlite", "CUTEPETSBOSTON_CACHE_DIR": directory}
+            with patch.dict("os.environ", env):
+                (source,) = create_sources()
+
+            self.assertEqual(source.path, os.path.join(directory, "inventory.sqlite3"))
+            self.assertEqual(source.filters, {"has_image": True, "not_posted_within_days": 30})
+
+    def test_manual_source_can_be_enabled(self):
+        with patch.dict("os.environ", {"CUTEPETSBOSTON_SOURCES": "manual"}):
+            sources = create_sources()
+
+        self.assertEqual([source.source_name for source in sources], ["Manual"])
+
 
 if __name__ == "__main__":
     unittest.main()
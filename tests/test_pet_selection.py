@@ -0,0 +1,80 @@
+import random
+import unittest
+from collections import Counter
+
+from abstractions import AdoptablePet
+from pet_selection import ReservoirSelector, SelectorGroup, has_image, senior_boost
+
+
+def _pet(name, image=True, age_string=None):
+    return AdoptablePet(
+        name=name,
+        species="dog",
+        breed="mutt",
+        location="Boston, MA",
+        image_url=f"https://example.com/{name}.jpg" if image else None,
+        age_string=age_string,
+    )
+
+
+class ReservoirSelectorTests(unittest.TestCase):
+    def test_empty_stream_picks_nothing(self):
+        self.assertIsNone(ReservoirSelector().pick())
+
+    def test_keeps_at_most_k_from_a_large_stream(self):
+        selector = ReservoirSelector(k=5, rng=random.Random(1))
+
+        consumed = selector.extend(_pet(f"Pet{i}") for i in range(100_000))
+
+        self.assertEqual(consumed, 100_000)
+        self.assertEqual(selector.seen, 100_000)
+        self.assertEqual(len(selector.selected()), 5)
+        self.assertEqual(len({pet.name for pet in selector.selected()}), 5)
+
+    def test_predicates_filter_candidates(self):
+        selector = ReservoirSelector(predicates=[has_image])
+
+        selector.extend([_pet("NoPhoto", image=False), _pet("Photo")])
+
+        self.assertEqual(selector.pick().name, "Photo")
+        self.assertEqual(selector.eligible, 1)
+
+    def test_sampling_is_roughly_uniform(self):
+        rng = random.Random(42)
+        pets = [_pet(name) for name in "ABCD"]
+        counts = Counter()
+        for _ in range(4000):
+            selector = ReservoirSelector(rng=rng)
+            selector.extend(pets)
+            counts[selector.pick().name] += 1
+
+        for name in "ABCD":
+            self.assertAlmostEqual(counts[name] / 4000, 0.25, delta=0.04)
+
+    def test_senior_boost_weights_selection(self):
+        rng = random.Random(7)
+        senior = _pet("Doli", age_string="11 Years 7 Months")
+        young = _pet("Pup", age_string="4 Months")
+        counts = Counter()
+        for _ in range(3000):
+            selector = ReservoirSelector(weights=[senior_boost(3.0)], rng=rng)
+            selector.extend([senior, young])
+            counts[selector.pick().name] += 1
+
+        self.assertAlmostEqual(counts["Doli"] / 3000, 0.75, delta=0.04)
+
+
+class SelectorGroupTests(unittest.TestCase):
+    def test_each_selector_gets_a_different_pet_when_it_can(self):
+        only_rex = ReservoirSelector(k=3, predicates=[lambda pet: pet.name == "Rex"])
+        anyone = ReservoirSelector(k=3)
+        also_rex = ReservoirSelector(k=3, predicates=[lambda pet: pet.name == "Rex"])
+        group = SelectorGroup([only_rex, anyone, also_rex])
+
+        self.assertEqual(group.extend([_pet("Rex"), _pet("Poppy")]), 2)
+
+        self.assertEqual([pet.name for pet in group.pick_distinct()], ["Rex", "Poppy", "Rex"])
+
+
+if __name__ == "__main__":
+    unittest.main()
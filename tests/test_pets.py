@@ -43,6 +43,25 @@ class TestAdoptablePet:
         assert pet1 == pet2
         assert pet1 != pet3
 
+    def test_adoptable_pet_is_slotted_and_hashable(self):
+        """Test AdoptablePet has no per-instance __dict__ and can be hashed."""
+        pet = _pet("Fluffy", pet_id="1")
+
+        assert not hasattr(pet, "__dict__")
+        assert len({pet, _pet("Fluffy", pet_id="1")}) == 1
+
+    def test_adoptable_pet_is_immutable(self):
+        """Test AdoptablePet fields cannot be reassigned."""
+        import dataclasses
+
+        pet = _pet("Fluffy")
+        try:
+            pet.name = "Spot"
+        except dataclasses.FrozenInstanceError:
+            pass
+        else:
+            raise AssertionError("AdoptablePet should be frozen")
+
     def test_adoptable_pet_string_representation(self):
         """Test string representation of AdoptablePet."""
         pet = _pet("Fluffy")
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from abstractions import AdoptablePet, PostResult
+from post_queue import PostQueue
+
+
+def _pet(name):
+    return AdoptablePet(
+        name=name,
+        species="dog",
+        breed="mutt",
+        location="Boston, MA",
+        pet_id=name.lower(),
+    )
+
+
+class PostQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "queue.sqlite3")
+        self.queue = PostQueue(self.path, max_attempts=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_posts_come_back_oldest_first_per_platform(self):
+        self.queue.enqueue("Bluesky", _pet("Poppy"), {"text": "Poppy"}, now=1)
+        self.queue.enqueue("Instagram", _pet("Rex"), {"text": "Rex"}, now=2)
+        self.queue.enqueue("Bluesky", _pet("Milo"), {"text": "Milo"}, now=3)
+
+        item = self.queue.next("Bluesky")
+
+        self.assertEqual(item.pet, _pet("Poppy"))
+        self.assertEqual(item.prepared, {"text": "Poppy"})
+        self.assertEqual(item.prepared_at, 1)
+        self.assertEqual(len(self.queue), 3)
+        self.assertIsNone(self.queue.next("Threads"))
+
+    def test_survives_reopening(self):
+        self.queue.enqueue("Bluesky", _pet("Poppy"), {"record": {"embed": {"blob": "ref"}}})
+
+        item = PostQueue(self.path).next("Bluesky")
+
+        self.assertEqual(item.prepared, {"record": {"embed": {"blob": "ref"}}})
+
+    def test_published_posts_leave_the_queue(self):
+        item = self.queue.enqueue("Bluesky", _pet("Poppy"), {"text": "Poppy"})
+
+        self.queue.mark_published(item, PostResult(success=True, post_url="at://post"))
+
+        self.assertIsNone(self.queue.next("Bluesky"))
+        self.assertEqual(len(self.queue), 0)
+
+    def test_failed_posts_are_retried_up_to_max_attempts(self):
+        item = self.queue.enqueue("Bluesky", _pet("Poppy"), {"text": "Poppy"})
+
+        self.assertTrue(self.queue.mark_failed(item, "server down"))
+        retry = self.queue.next("Bluesky")
+        self.assertEqual(retry.attempts, 1)
+
+        self.assertFalse(self.queue.mark_failed(retry, "server down"))
+        self.assertIsNone(self.queue.next("Bluesky"))
+
+    def test_failures_that_may_have_gone_through_are_not_retried(self):
+        item = self.queue.enqueue("Bluesky", _pet("Poppy"), {"text": "Poppy"})
+
+        self.assertFalse(self.queue.mark_failed(item, "read timed out", retry=False))
+        self.assertIsNone(self.queue.next("Bluesky"))
+
+    def test_replace_stores_a_fresh_preparation(self):
+        item = self.queue.enqueue("Bluesky", _pet("Poppy"), {"text": "old"}, now=1)
+
+        self.queue.replace(item, {"text": "new"}, now=5)
+
+        item = self.queue.next("Bluesky")
+        self.assertEqual((item.prepared, item.prepared_at), ({"text": "new"}, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from abstractions import AdoptablePet
+from main import pick_pet, run
+from tests.test_main import FakePoster, FakeSource
+from posted_history import SECONDS_PER_DAY, PostedHistory
+
+
+def _pet(name, pet_id=None, **kwargs):
+    return AdoptablePet(
+        name=name,
+        species="dog",
+        breed="mutt",
+        location="Boston, MA",
+        image_url=f"https://example.com/{name}.jpg",
+        pet_id=pet_id,
+        **kwargs,
+    )
+
+
+class PostedHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "history.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_recorded_pet_is_recent_until_cooldown_passes(self):
+        history = PostedHistory(self.path, cooldown_days=7)
+        pet = _pet("Poppy", pet_id="1")
+
+        history.record(pet, now=0)
+
+        self.assertTrue(history.recently_posted(pet, now=6 * SECONDS_PER_DAY))
+        self.assertFalse(history.recently_posted(pet, now=8 * SECONDS_PER_DAY))
+
+    def test_history_persists_between_instances(self):
+        PostedHistory(self.path).record(_pet("Poppy", pet_id="1"))
+
+        history = PostedHistory(self.path)
+
+        self.assertEqual(len(history), 1)
+        self.assertTrue(history.recently_posted(_pet("Renamed", pet_id="1")))
+        self.assertFalse(history.recently_posted(_pet("Poppy", pet_id="2")))
+
+    def test_falls_back_to_adoption_url(self):
+        history = PostedHistory(self.path)
+        pet = _pet("Poppy", adoption_url="https://www.rescuegroups.org/pet/poppy")
+
+        history.record(pet)
+
+        self.assertTrue(history.recently_posted(pet))
+
+    def test_ignores_torn_lines(self):
+        with open(self.path, "w") as f:
+            f.write('{"key": "id:1", "posted_at": 5}\n{"key": "id:2", "pos')
+
+        history = PostedHistory(self.path)
+
+        self.assertEqual(history.last_posted(_pet("Poppy", pet_id="1")), 5)
+        self.assertEqual(len(history), 1)
+
+    def test_pick_pet_skips_recently_posted(self):
+        history = PostedHistory(self.path)
+        posted, fresh = _pet("Poppy", pet_id="1"), _pet("Rex", pet_id="2")
+        history.record(posted)
+
+        for _ in range(20):
+            self.assertEqual(pick_pet([posted, fresh], history=history), fresh)
+        self.assertIsNone(pick_pet([posted], history=history))
+
+    def test_run_records_published_pet(self):
+        history = PostedHistory(self.path)
+        pet = _pet("Poppy", pet_id="1")
+
+        run([FakeSource([pet])], [FakePoster()], history=history)
+
+        self.assertTrue(history.recently_posted(pet))
+
+
+if __name__ == "__main__":
+    unittest.main()
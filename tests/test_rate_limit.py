@@ -0,0 +1,142 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from http_client import HttpClientConfig, PooledSession
+from rate_limit import RateLimiter, TokenBucket, parse_rate_limits
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_is_free_then_requests_are_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(waits, [0, 0, 0, 0.5, 1.0])
+
+    def test_refills_over_time_up_to_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 60
+
+        self.assertEqual(bucket.state()["tokens"], 2)
+
+    def test_concurrent_callers_each_get_their_own_slot(self):
+        bucket = TokenBucket(rate=10, burst=1, clock=FakeClock())
+        waits = []
+        lock = threading.Lock()
+
+        def take():
+            wait = bucket.reserve()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=take) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(round(w, 3) for w in waits), [0, 0.1, 0.2, 0.3, 0.4])
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_only_configured_hosts_are_limited(self):
+        sleeps = []
+        limiter = RateLimiter({"bsky.social": (1, 1)}, sleep=sleeps.append, clock=FakeClock())
+
+        for _ in range(2):
+            limiter.acquire("https://bsky.social/xrpc/com.atproto.repo.createRecord")
+            limiter.acquire("https://api.rescuegroups.org/v5/public/animals/search")
+
+        self.assertEqual(sleeps, [1.0])
+
+    def test_state_persists_between_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "limits.json")
+            clock = FakeClock()
+            first = RateLimiter({"bsky.social": (1, 2)}, path=path, clock=clock)
+            first.acquire("https://bsky.social/a")
+            first.acquire("https://bsky.social/b")
+            first.save()
+
+            sleeps = []
+            second = RateLimiter({"bsky.social": (1, 2)}, path=path, sleep=sleeps.append, clock=clock)
+            second.acquire("https://bsky.social/c")
+
+        self.assertEqual(sleeps, [1.0])
+
+    def test_state_is_saved_at_most_every_save_interval(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "limits.json")
+            clock = FakeClock()
+            limiter = RateLimiter({"bsky.social": (1, 5)}, path=path, clock=clock, save_interval=30)
+
+            limiter.acquire("https://bsky.social/a")
+            self.assertFalse(os.path.exists(path))
+
+            clock.now += 30
+            limiter.acquire("https://bsky.social/b")
+            self.assertTrue(os.path.exists(path))
+
+    def test_overlapping_runs_keep_the_lower_level(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "limits.json")
+            clock = FakeClock()
+            first = RateLimiter({"bsky.social": (1, 5)}, path=path, clock=clock, sleep=lambda _: None)
+            second = RateLimiter({"bsky.social": (1, 5)}, path=path, clock=clock, sleep=lambda _: None)
+            for _ in range(4):
+                first.acquire("https://bsky.social/a")
+            second.acquire("https://bsky.social/b")
+
+            first.save()
+            second.save()
+
+            sleeps = []
+            third = RateLimiter({"bsky.social": (1, 5)}, path=path, clock=clock, sleep=sleeps.append)
+            third.acquire("https://bsky.social/c")
+            third.acquire("https://bsky.social/d")
+
+        self.assertEqual(sleeps, [1.0])
+
+    def test_parse_rate_limits(self):
+        self.assertEqual(
+            parse_rate_limits("bsky.social=10:50, api.rescuegroups.org=0.5"),
+            {"bsky.social": (10.0, 50.0), "api.rescuegroups.org": (0.5, 1.0)},
+        )
+
+
+class PooledSessionRateLimitTests(unittest.TestCase):
+    def test_requests_pass_through_the_limiter(self):
+        session = PooledSession(HttpClientConfig(rate_limits={"example.com": (1, 1)}))
+        session.rate_limiter = Mock()
+
+        with patch("requests.Session.request", return_value=Mock()):
+            session.get("https://example.com/a")
+
+        session.rate_limiter.acquire.assert_called_once_with("https://example.com/a")
+
+    def test_env_overrides_limits(self):
+        with patch.dict("os.environ", {"CUTEPETSBOSTON_RATE_LIMITS": "api.rescuegroups.org=4:8"}):
+            config = HttpClientConfig.from_env()
+
+        self.assertEqual(config.rate_limits["api.rescuegroups.org"], (4.0, 8.0))
+        self.assertIn("bsky.social", config.rate_limits)
+
+
+if __name__ == "__main__":
+    unittest.main()
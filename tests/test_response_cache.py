@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from adoption_sources import SourceRescueGroups
+from adoption_sources.cache import ResponseCache
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache", "responses.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        cache = ResponseCache(self.path)
+        key = ResponseCache.make_key("url", {"radius": 50})
+
+        cache.set(key, {"data": [1, 2]})
+
+        self.assertEqual(cache.get(key), {"data": [1, 2]})
+        self.assertIsNone(cache.get(ResponseCache.make_key("url", {"radius": 25})))
+
+    def test_key_is_order_independent(self):
+        self.assertEqual(
+            ResponseCache.make_key({"a": 1, "b": 2}),
+            ResponseCache.make_key({"b": 2, "a": 1}),
+        )
+
+    def test_entries_expire(self):
+        cache = ResponseCache(self.path, ttl_seconds=60)
+        with patch("adoption_sources.cache.time.time", return_value=1000):
+            cache.set("key", {"data": []})
+        with patch("adoption_sources.cache.time.time", return_value=1061):
+            self.assertIsNone(cache.get("key"))
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(self.path, max_entries=2)
+        with patch("adoption_sources.cache.time.time", side_effect=[1, 2, 3, 4, 5, 6, 7]):
+            cache.set("a", {"n": 1})
+            cache.set("b", {"n": 2})
+            cache.get("a")
+            cache.set("c", {"n": 3})
+
+            self.assertEqual(cache.get("a"), {"n": 1})
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("c"), {"n": 3})
+
+    def test_source_serves_repeat_queries_from_cache(self):
+        session = Mock()
+        session.post.return_value.content = json.dumps({
+            "data": [{"id": "1", "attributes": {"name": "Doli"}}],
+            "meta": {"pages": 1},
+        }).encode()
+        cache = ResponseCache(self.path)
+
+        for _ in range(2):
+            source = SourceRescueGroups(api_key="key", session=session, cache=cache)
+            pets = list(source.fetch_pets())
+            self.assertEqual([pet.name for pet in pets], ["Doli"])
+
+        self.assertEqual(session.post.call_count, 1)
+
+        source = SourceRescueGroups(api_key="key", session=session, cache=cache, radius_miles=10)
+        list(source.fetch_pets())
+        self.assertEqual(session.post.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
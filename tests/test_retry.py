@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from retry import RetryPolicy
+
+
+def _response(status, headers=None):
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    return response
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        self.policy = RetryPolicy(max_retries=3, backoff_base=1, jitter=False, sleep=self.delays.append)
+
+    def test_retries_server_errors_with_exponential_backoff(self):
+        send = Mock(side_effect=[_response(503), _response(502), _response(200)])
+
+        response = self.policy.call(send, "https://example.com", idempotent=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.delays, [1, 2])
+        send.assert_called_with("https://example.com")
+
+    def test_returns_last_error_response_when_retries_run_out(self):
+        send = Mock(return_value=_response(500))
+
+        response = self.policy.call(send, idempotent=True)
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(send.call_count, 4)
+        self.assertEqual(self.delays, [1, 2, 4])
+
+    def test_honours_retry_after(self):
+        send = Mock(side_effect=[_response(429, {"Retry-After": "7"}), _response(200)])
+
+        self.policy.call(send)
+
+        self.assertEqual(self.delays, [7.0])
+
+    def test_gives_up_when_retry_after_is_too_long(self):
+        send = Mock(return_value=_response(429, {"Retry-After": "3600"}))
+
+        response = self.policy.call(send)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(send.call_count, 1)
+
+    def test_parses_http_date_retry_after(self):
+        response = _response(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        self.assertEqual(RetryPolicy.retry_after(response), 0.0)
+
+    def test_non_idempotent_calls_are_not_retried_after_ambiguous_failures(self):
+        send = Mock(side_effect=[_response(502)])
+        self.assertEqual(self.policy.call(send).status_code, 502)
+
+        send = Mock(side_effect=requests.ReadTimeout("slow"))
+        with self.assertRaises(requests.ReadTimeout):
+            self.policy.call(send)
+        self.assertEqual(send.call_count, 1)
+
+    def test_connect_timeouts_are_always_retried(self):
+        send = Mock(side_effect=[requests.ConnectTimeout("unreachable"), _response(200)])
+
+        response = self.policy.call(send)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(send.call_count, 2)
+
+    def test_jitter_stays_under_the_backoff_ceiling(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+        delays = [policy.backoff(attempt) for attempt in range(10) for _ in range(20)]
+
+        self.assertTrue(all(0 <= delay <= 5 for delay in delays))
+
+
+class BlueskyRetryTests(unittest.TestCase):
+    def _poster(self, session):
+        from social_posters.bluesky import PosterBluesky
+
+        poster = PosterBluesky(
+            session=session, retry=RetryPolicy(jitter=False, sleep=lambda delay: None)
+        )
+        poster._is_available = True
+        poster._access_token = "token"
+        poster._did = "did:plc:test"
+        return poster
+
+    def test_create_record_is_not_reposted_after_a_server_error(self):
+        from abstractions import Post
+
+        session = Mock()
+        session.post.return_value = _response(502)
+        session.post.return_value.raise_for_status.side_effect = requests.HTTPError("502")
+
+        result = self._poster(session).publish(Post(text="Hi"))
+
+        self.assertFalse(result.success)
+        self.assertEqual(session.post.call_count, 1)
+
+    def test_create_record_is_retried_when_rate_limited(self):
+        from abstractions import Post
+
+        ok = _response(200)
+        ok.json.return_value = {"uri": "at://post", "cid": "cid"}
+        session = Mock()
+        session.post.side_effect = [_response(429), ok]
+
+        result = self._poster(session).publish(Post(text="Hi"))
+
+        self.assertTrue(result.success)
+        self.assertEqual(session.post.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
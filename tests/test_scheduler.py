@@ -0,0 +1,306 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from datetime import time as time_of_day
+from unittest.mock import patch
+
+from abstractions import AdoptablePet, Post, PostResult, SocialPoster
+from main import create_scheduler
+from post_queue import PostQueue
+from scheduler import PostScheduler, Schedule, parse_duration, parse_schedules
+
+
+def _pet(name):
+    return AdoptablePet(
+        name=name,
+        species="dog",
+        breed="mutt",
+        location="Boston, MA",
+        image_url=f"https://example.com/{name.lower()}.jpg",
+        adoption_url=f"https://example.com/{name.lower()}",
+    )
+
+
+def _at(hour, minute=0, day=1):
+    return datetime(2026, 3, day, hour, minute).timestamp()
+
+
+class FakePoster(SocialPoster):
+    platform_name = "FakePoster"
+    wants_image_data = True
+    idempotent_publish = True
+
+    def __init__(self, platform_name="FakePoster", fail=False):
+        self.platform_name = platform_name
+        self.fail = fail
+        self.authenticated = False
+        self.published = []
+        self.prepared = []
+
+    def is_authenticated(self):
+        return self.authenticated
+
+    def authenticate(self):
+        self.authenticated = True
+        return True
+
+    def format_post(self, pet):
+        return Post(text=f"Meet {pet.name}", image_url=pet.image_url)
+
+    def prepare(self, post):
+        self.prepared.append(post)
+        return {"text": post.text, "image": post.image_data.decode() if post.image_data else None}
+
+    def publish_prepared(self, prepared):
+        return self.publish(Post(text=prepared["text"], image_url=prepared["image"]))
+
+    def publish(self, post):
+        if self.fail:
+            raise RuntimeError("server down")
+        self.published.append(post)
+        return PostResult(success=True)
+
+
+class PetPicker:
+    def __init__(self, pets):
+        self.pets = pets
+        self.reserved = []
+
+    def __call__(self, reserved, poster):
+        self.reserved.append(set(reserved))
+        return next((pet for pet in self.pets if pet not in reserved), None)
+
+
+class ScheduleTests(unittest.TestCase):
+    def test_parse_durations(self):
+        self.assertEqual(parse_duration("90"), 90)
+        self.assertEqual(parse_duration("30m"), 1800)
+        self.assertEqual(parse_duration("4h"), 4 * 3600)
+        self.assertEqual(parse_duration("1d"), 86400)
+        with self.assertRaises(ValueError):
+            parse_duration("soon")
+
+    def test_parse_schedules_with_default(self):
+        schedules = parse_schedules("*=4h@09:00-21:00, Instagram=1d")
+
+        self.assertEqual(
+            schedules["*"], Schedule(4 * 3600, (time_of_day(9), time_of_day(21)))
+        )
+        self.assertEqual(schedules["instagram"], Schedule(86400))
+
+    def test_slots_outside_the_window_move_to_its_next_start(self):
+        schedule = Schedule.parse("4h@09:00-21:00")
+
+        self.assertEqual(schedule.first_slot(_at(7)), _at(9))
+        self.assertEqual(schedule.first_slot(_at(10)), _at(10))
+        self.assertEqual(schedule.next_slot(_at(17)), _at(9, day=2))
+
+    def test_window_can_span_midnight(self):
+        schedule = Schedule.parse("2h@22:00-02:00")
+
+        self.assertTrue(schedule.in_window(datetime(2026, 3, 1, 23)))
+        self.assertTrue(schedule.in_window(datetime(2026, 3, 2, 1)))
+        self.assertFalse(schedule.in_window(datetime(2026, 3, 2, 12)))
+        self.assertEqual(schedule.next_slot(_at(1, day=2)), _at(22, day=2))
+
+
+class PostSchedulerTests(unittest.TestCase):
+    def _scheduler(self, posters, picker, spec="*=1h", **kwargs):
+        downloads = []
+
+        def download(url):
+            downloads.append(url)
+            return b"image"
+
+        scheduler = PostScheduler(
+            posters,
+            parse_schedules(spec),
+            pick_pet=picker,
+            download_image=download,
+            prefetch_seconds=300,
+            clock=lambda: _at(12),
+            **kwargs,
+        )
+        return scheduler, downloads
+
+    def test_prepares_ahead_of_the_slot_and_only_publishes_at_it(self):
+        poster = FakePoster()
+        picker = PetPicker([_pet("Poppy")])
+        scheduler, downloads = self._scheduler([poster], picker)
+        scheduler.run_pending(_at(12))  # First slot is immediate.
+        poster.published.clear()
+
+        wait = scheduler.run_pending(_at(12, 56))
+
+        self.assertEqual(downloads[-1], "https://example.com/poppy.jpg")
+        self.assertEqual(poster.published, [])
+        self.assertEqual(wait, 4 * 60)
+
+        scheduler.run_pending(_at(13))
+
+        self.assertEqual(len(poster.published), 1)
+        self.assertEqual(poster.published[0].image_url, "image")
+        self.assertEqual(scheduler.next_slots(), {"FakePoster": _at(14)})
+
+    def test_warms_up_the_login_while_preparing(self):
+        poster = FakePoster()
+        scheduler, _ = self._scheduler([poster], PetPicker([_pet("Poppy")]))
+
+        scheduler.run_pending(_at(12))
+
+        self.assertTrue(poster.authenticated)
+
+    def test_pets_prepared_for_one_poster_are_not_picked_for_another(self):
+        bluesky = FakePoster("Bluesky")
+        instagram = FakePoster("Instagram")
+        picker = PetPicker([_pet("Poppy"), _pet("Rex")])
+        scheduler, _ = self._scheduler(
+            [bluesky, instagram], picker, spec="bluesky=1h@13:00-14:00,instagram=1h@13:00-14:00"
+        )
+
+        scheduler.run_pending(_at(12, 56))
+
+        self.assertEqual(picker.reserved, [set(), {_pet("Poppy")}])
+        scheduler.run_pending(_at(13))
+        self.assertEqual(bluesky.published[0].text, "Meet Poppy")
+        self.assertEqual(instagram.published[0].text, "Meet Rex")
+
+    def test_failures_are_reported_and_the_schedule_goes_on(self):
+        poster = FakePoster(fail=True)
+        results = []
+        scheduler, _ = self._scheduler(
+            [poster],
+            PetPicker([_pet("Poppy")]),
+            on_published=lambda poster, pet, result: results.append(result),
+        )
+
+        scheduler.run_pending(_at(12))
+
+        self.assertFalse(results[0].success)
+        self.assertEqual(results[0].error_message, "server down")
+        self.assertEqual(scheduler.next_slots(), {"FakePoster": _at(13)})
+
+    def test_failed_preparation_is_retried_at_the_slot(self):
+        poster = FakePoster()
+        pets = [None, _pet("Poppy")]
+        scheduler, _ = self._scheduler([poster], lambda reserved, poster: pets.pop(0), spec="*=1h@13:00-14:00")
+
+        scheduler.run_pending(_at(12, 56))
+        self.assertEqual(poster.published, [])
+
+        scheduler.run_pending(_at(13))
+        self.assertEqual(poster.published[0].text, "Meet Poppy")
+
+    def test_posters_without_a_schedule_are_skipped(self):
+        poster = FakePoster("Bluesky")
+        scheduler, _ = self._scheduler([poster], PetPicker([]), spec="instagram=1h")
+
+        self.assertEqual(scheduler.next_slots(), {})
+
+    def test_failed_publish_is_retried_from_the_queue_without_preparing_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = PostQueue(os.path.join(tmp, "queue.sqlite3"))
+            poster = FakePoster(fail=True)
+            picker = PetPicker([_pet("Poppy"), _pet("Rex")])
+            scheduler, _ = self._scheduler([poster], picker, queue=queue)
+
+            scheduler.run_pending(_at(12))
+            poster.fail = False
+            scheduler.run_pending(_at(13))
+
+            self.assertEqual(len(picker.reserved), 1)
+            self.assertEqual(len(poster.prepared), 1)
+            self.assertEqual(poster.published[0].text, "Meet Poppy")
+            self.assertEqual(len(queue), 0)
+
+    def test_failed_publish_is_retried_shortly_while_still_fresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = PostQueue(os.path.join(tmp, "queue.sqlite3"))
+            poster = FakePoster(fail=True)
+            poster.prepared_max_age = 3600
+            scheduler, _ = self._scheduler([poster], PetPicker([_pet("Poppy")]), spec="*=4h", queue=queue)
+
+            wait = scheduler.run_pending(_at(12))
+            self.assertEqual(wait, 300)
+
+            poster.fail = False
+            scheduler.run_pending(_at(12, 5))
+
+            self.assertEqual(len(poster.prepared), 1)
+            self.assertEqual(poster.published[0].text, "Meet Poppy")
+            self.assertEqual(len(queue), 0)
+            self.assertEqual(scheduler.next_slots(), {"FakePoster": _at(16)})
+
+    def test_failed_publish_is_not_retried_unless_it_is_idempotent(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = PostQueue(os.path.join(tmp, "queue.sqlite3"))
+            poster = FakePoster(fail=True)
+            poster.idempotent_publish = False
+            picker = PetPicker([_pet("Poppy"), _pet("Rex")])
+            scheduler, _ = self._scheduler([poster], picker, queue=queue)
+
+            scheduler.run_pending(_at(12))
+            poster.fail = False
+            scheduler.run_pending(_at(13))
+
+            self.assertEqual(len(picker.reserved), 2)
+            self.assertEqual(len(poster.prepared), 2)
+            self.assertEqual(len(queue), 0)
+
+    def test_posts_queued_by_an_earlier_run_are_published_first(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = PostQueue(os.path.join(tmp, "queue.sqlite3"))
+            queue.enqueue("FakePoster", _pet("Rex"), {"text": "Meet Rex", "image": None}, now=_at(11, 30))
+            poster = FakePoster()
+            picker = PetPicker([_pet("Poppy")])
+            scheduler, _ = self._scheduler([poster], picker, queue=queue)
+
+            scheduler.run_pending(_at(12))
+
+            self.assertEqual(picker.reserved, [])
+            self.assertEqual(poster.prepared, [])
+            self.assertEqual(poster.published[0].text, "Meet Rex")
+
+    def test_expired_preparation_is_redone_before_publishing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = PostQueue(os.path.join(tmp, "queue.sqlite3"))
+            queue.enqueue("FakePoster", _pet("Rex"), {"text": "stale", "image": None}, now=_at(9))
+            poster = FakePoster()
+            poster.prepared_max_age = 3600
+            scheduler, _ = self._scheduler([poster], PetPicker([]), queue=queue)
+
+            scheduler.run_pending(_at(12))
+
+            self.assertEqual(poster.published[0].text, "Meet Rex")
+            self.assertEqual(poster.published[0].image_url, "image")
+
+    def test_create_scheduler_records_published_pets(self):
+        class Source:
+            source_name = "Fake"
+
+            def fetch_pets(self):
+                return [_pet("Poppy")]
+
+        class History:
+            recorded = []
+
+            def recently_posted(self, pet):
+                return False
+
+            def record(self, pet):
+                self.recorded.append(pet)
+
+        poster = FakePoster()
+        history = History()
+        with patch.dict("os.environ", {"CUTEPETSBOSTON_SCHEDULE": "*=1h"}):
+            scheduler = create_scheduler([Source()], [poster], history=history)
+
+        with patch("main._download_shared_image", return_value=b"image"):
+            scheduler.run_pending()
+
+        self.assertEqual(history.recorded, [_pet("Poppy")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,13 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 
-from adoption_sources import MANUAL_SOURCE_DATA, SourceManual
+from adoption_sources import MANUAL_SOURCE_DATA, SourceManual, load_manual_animals
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class SourceManualTests(unittest.TestCase):
@@ -16,6 +23,41 @@ class SourceManualTests(unittest.TestCase):
             self.assertTrue(pet.image_url)
             self.assertTrue(pet.adoption_url)
 
+    def test_manual_source_data_keeps_full_records(self):
+        self.assertEqual(MANUAL_SOURCE_DATA[0]["attributes"]["activityLevel"], "Moderately Active")
+
+    def test_importing_sources_does_not_load_manual_data(self):
+        code = "import sys, adoption_sources; print('adoption_sources.manual' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_loads_json_and_jsonl_files(self):
+        animals = [
+            {"id": "1", "attributes": {"name": "Poppy", "slug": "poppy", "activityLevel": "High"}},
+            {"id": "2", "attributes": {"name": "Rex"}},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "animals.json")
+            jsonl_path = os.path.join(directory, "animals.jsonl")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(animals, f)
+            with open(jsonl_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(json.dumps(animal) for animal in animals) + "\n\n")
+
+            from_json = load_manual_animals(json_path)
+            self.assertEqual(from_json, load_manual_animals(jsonl_path))
+            self.assertEqual([a["attributes"]["name"] for a in from_json], ["Poppy", "Rex"])
+            self.assertNotIn("activityLevel", from_json[0]["attributes"])
+
+            pets = list(SourceManual(path=jsonl_path).fetch_pets())
+            self.assertEqual(pets[0].adoption_url, "https://www.rescuegroups.org/pet/poppy")
+
+    def test_empty_file_has_no_animals(self):
+        with tempfile.NamedTemporaryFile(suffix=".jsonl") as f:
+            self.assertEqual(load_manual_animals(f.name), ())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,262 @@
+import json
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import requests
+
+from adoption_sources import RescueGroupsQuery, SourceRescueGroups, SourceRescueGroupsFanOut
+from tests.test_data_utils import load_sample_data
+
+
+def _animal(animal_id, name):
+    return {
+        "type": "animals",
+        "id": animal_id,
+        "attributes": {
+            "name": name,
+            "breedString": "Mixed",
+            "slug": f"adopt-{name.lower()}",
+            "pictureThumbnailUrl": f"https://cdn.example.com/{animal_id}.jpg?width=100",
+        },
+    }
+
+
+def _page(animals, pages):
+    response = Mock()
+    response.content = json.dumps({"data": animals, "meta": {"pages": pages}}).encode()
+    return response
+
+
+class SourceRescueGroupsPagingTests(unittest.TestCase):
+    def setUp(self):
+        self.pages = [
+            _page([_animal("1", "Doli"), _animal("2", "Kathy")], pages=3),
+            _page([_animal("3", "Cylana")], pages=3),
+            _page([_animal("4", "Poppy")], pages=3),
+        ]
+        self.session = Mock()
+        self.session.post.side_effect = self._post
+
+    def _post(self, url, **kwargs):
+        page = int(url.rsplit("&page=", 1)[1])
+        return self.pages[page - 1]
+
+    def test_default_reads_only_first_page(self):
+        source = SourceRescueGroups(api_key="key", session=self.session)
+
+        pets = list(source.fetch_pets())
+
+        self.assertEqual([pet.name for pet in pets], ["Doli", "Kathy"])
+        self.assertEqual(self.session.post.call_count, 1)
+
+    def test_walks_all_pages_lazily(self):
+        source = SourceRescueGroups(api_key="key", max_pages=None, session=self.session)
+
+        pets = source.fetch_pets()
+        self.assertEqual(next(pets).name, "Doli")
+        self.assertEqual(self.session.post.call_count, 1)
+        rest = [pet.name for pet in pets]
+
+        self.assertEqual(rest, ["Kathy", "Cylana", "Poppy"])
+        self.assertEqual(self.session.post.call_count, 3)
+
+    def test_prefetch_yields_same_pets_in_order(self):
+        source = SourceRescueGroups(api_key="key", max_pages=None, prefetch=True, session=self.session)
+
+        pets = [pet.pet_id for pet in source.fetch_pets()]
+
+        self.assertEqual(pets, ["1", "2", "3", "4"])
+        self.assertEqual(self.session.post.call_count, 3)
+
+    def test_stops_at_max_pages(self):
+        source = SourceRescueGroups(api_key="key", max_pages=2, session=self.session)
+
+        pets = list(source.fetch_pets())
+
+        self.assertEqual(len(pets), 3)
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_missing_api_key_raises(self):
+        source = SourceRescueGroups(api_key="key", session=self.session)
+        source._api_key = None
+
+        with self.assertRaises(ValueError):
+            list(source.fetch_pets())
+
+
+class SourceRescueGroupsRequestTests(unittest.TestCase):
+    def setUp(self):
+        self.session = Mock()
+        self.session.post.return_value = _page([_animal("1", "Doli")], pages=1)
+
+    def _request(self, **kwargs):
+        list(SourceRescueGroups(api_key="key", session=self.session, **kwargs).fetch_pets())
+        call = self.session.post.call_args
+        return call.args[0], call.kwargs["json"]
+
+    def test_requests_sparse_fieldsets_with_locations_included(self):
+        url, payload = self._request()
+
+        self.assertIn("fields[animals]=name,breedString,", url)
+        self.assertIn("include=locations", url)
+        self.assertIn("fields[locations]=city,state,postalcode", url)
+        self.assertEqual(payload, {"data": {"filterRadius": {"miles": 50, "postalcode": "02108"}}})
+
+    def test_all_fields_and_includes_can_be_requested(self):
+        url, _ = self._request(fields=None, include=("breeds", "locations"))
+
+        self.assertNotIn("fields[animals]", url)
+        self.assertIn("include=breeds,locations", url)
+
+    def test_transient_server_errors_are_retried(self):
+        unavailable = Mock(status_code=503, headers={"Retry-After": "0"})
+        self.session.post.side_effect = [unavailable, _page([_animal("1", "Doli")], pages=1)]
+
+        pets = list(SourceRescueGroups(api_key="key", session=self.session).fetch_pets())
+
+        self.assertEqual([pet.name for pet in pets], ["Doli"])
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_server_side_filters(self):
+        _, payload = self._request(
+            age_groups=("Senior",),
+            sexes=("Female",),
+            updated_since=datetime(2025, 3, 1, 7, 30, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(payload["data"]["filters"], [
+            {"fieldName": "animals.ageGroup", "operation": "equal", "criteria": ["Senior"]},
+            {"fieldName": "animals.sex", "operation": "equal", "criteria": ["Female"]},
+            {"fieldName": "animals.updatedDate", "operation": "greaterthan", "criteria": "2025-03-01T07:30:00Z"},
+        ])
+
+    def test_updated_within_is_measured_back_from_each_fetch(self):
+        source = SourceRescueGroups(api_key="key", session=self.session, updated_within=timedelta(days=7))
+
+        def criteria_at(now):
+            class FrozenDatetime(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return now
+
+            with patch("adoption_sources.rescue_groups.datetime", FrozenDatetime):
+                list(source.fetch_pets())
+            return self.session.post.call_args.kwargs["json"]["data"]["filters"][0]["criteria"]
+
+        self.assertEqual(criteria_at(datetime(2025, 3, 8, 7, 30, tzinfo=timezone.utc)), "2025-03-01T07:00:00Z")
+        self.assertEqual(criteria_at(datetime(2025, 3, 9, 7, 45, tzinfo=timezone.utc)), "2025-03-02T07:00:00Z")
+
+    def test_pets_are_located_by_their_included_location(self):
+        doli, kathy = load_sample_data()[:2]
+        del kathy["relationships"]
+        response = Mock()
+        response.content = json.dumps({
+            "data": [doli, kathy],
+            "included": [{
+                "type": "locations",
+                "id": doli["relationships"]["locations"]["data"][0]["id"],
+                "attributes": {"name": "Shelter", "city": "Worcester", "state": "MA", "postalcode": "01608"},
+            }],
+        }).encode()
+        self.session.post.return_value = response
+
+        pets = list(SourceRescueGroups(api_key="key", session=self.session).fetch_pets())
+
+        self.assertEqual([pet.location for pet in pets], ["Worcester, MA", "Boston, MA"])
+
+    def test_fixture_records_without_includes_use_the_label(self):
+        response = Mock()
+        response.content = json.dumps({"data": load_sample_data()}).encode()
+        self.session.post.return_value = response
+
+        pets = list(SourceRescueGroups(api_key="key", session=self.session).fetch_pets())
+
+        self.assertEqual({pet.location for pet in pets}, {"Boston, MA"})
+
+
+class SourceRescueGroupsFanOutTests(unittest.TestCase):
+    def _session(self, responses, delay=0.0):
+        """Session whose responses are keyed by species path segment."""
+
+        def post(url, **kwargs):
+            time.sleep(delay)
+            species = url.split("/available/", 1)[1].split("/", 1)[0]
+            result = responses[species]
+            if isinstance(result, Exception):
+                raise result
+            return _page(result, pages=1)
+
+        session = Mock()
+        session.post.side_effect = post
+        return session
+
+    def test_merges_and_dedupes_by_pet_id(self):
+        session = self._session({
+            "dogs": [_animal("1", "Doli"), _animal("2", "Kathy")],
+            "cats": [_animal("2", "Kathy"), _animal("3", "Cylana")],
+        })
+        source = SourceRescueGroupsFanOut.from_product(
+            species=("dogs", "cats"), api_key="key", session=session
+        )
+
+        pets = list(source.fetch_pets())
+
+        self.assertEqual(sorted(pet.pet_id for pet in pets), ["1", "2", "3"])
+        self.assertEqual(session.post.call_count, 2)
+
+    def test_queries_run_concurrently(self):
+        session = self._session({"dogs": [_animal("1", "Doli")]}, delay=0.2)
+        queries = [RescueGroupsQuery(postal_code=code) for code in ("02108", "02139", "01608", "02301")]
+        source = SourceRescueGroupsFanOut(queries, api_key="key", max_workers=4, session=session)
+
+        started = time.monotonic()
+        pets = list(source.fetch_pets())
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(len(pets), 1)
+        self.assertLess(elapsed, 0.6)
+
+    def test_failed_query_is_skipped(self):
+        session = self._session({
+            "dogs": [_animal("1", "Doli")],
+            "cats": requests.HTTPError("503"),
+        })
+        source = SourceRescueGroupsFanOut.from_product(
+            species=("dogs", "cats"), api_key="key", session=session
+        )
+
+        pets = list(source.fetch_pets())
+
+        self.assertEqual([pet.name for pet in pets], ["Doli"])
+
+    def test_all_queries_failing_raises(self):
+        source = SourceRescueGroupsFanOut.from_product(species=("dogs",), session=Mock())
+        source._sources[0]._api_key = None
+
+        with self.assertRaises(ValueError):
+            list(source.fetch_pets())
+
+    def test_postal_code_labels(self):
+        source = SourceRescueGroupsFanOut.from_product(
+            species=("cats",),
+            postal_codes={"02139": "Cambridge, MA"},
+            api_key="key",
+            session=Mock(),
+        )
+
+        self.assertEqual(source.queries, [
+            RescueGroupsQuery(species="cats", postal_code="02139", location_label="Cambridge, MA"),
+        ])
+
+    def test_plain_postal_codes_fall_back_to_a_readable_label(self):
+        source = SourceRescueGroupsFanOut.from_product(
+            species=("dogs",), postal_codes=["02108", "01608"], api_key="key", session=Mock()
+        )
+
+        self.assertEqual([query.location_label for query in source.queries], ["Boston, MA", None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from registry import POSTERS, SOURCES, LazyRegistry
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-start import budgets in milliseconds, as measured by -X importtime.
+# Override with CUTEPETSBOSTON_IMPORT_BUDGET_MS on unusually slow machines.
+MAIN_IMPORT_BUDGET_MS = 100
+PLATFORM_IMPORT_BUDGET_MS = 1000
+
+# Modules that must never be loaded just by starting up.
+HEAVY_MODULES = ("asyncio", "instapy", "selenium", "sqlite3", "requests", "PIL")
+
+
+def _import_profile(code):
+    """
+    Run `code` in a fresh interpreter; return (imported modules, total ms).
+
+    Modules the interpreter itself loads at startup (site, encodings, ...) are
+    reported by -X importtime too, so running ``pass`` first gives a baseline
+    that is excluded from the total.
+    """
+    baseline = _parse_importtime("pass")[0]
+    modules, top_level = _parse_importtime(code)
+    total_us = sum(cumulative for name, cumulative in top_level if name not in baseline)
+    return modules - baseline, total_us / 1000
+
+
+def _parse_importtime(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):
+            # Top-level entries' cumulative time includes everything below them.
+            top_level.append((name.strip(), int(cumulative)))
+    return modules, top_level
+
+
+def _budget(default):
+    return float(os.environ.get("CUTEPETSBOSTON_IMPORT_BUDGET_MS", default))
+
+
+class ImportTimeTests(unittest.TestCase):
+    def test_importing_main_is_cheap(self):
+        modules, total_ms = _import_profile("import main")
+
+        for heavy in HEAVY_MODULES:
+            self.assertNotIn(heavy, modules)
+        self.assertLess(total_ms, _budget(MAIN_IMPORT_BUDGET_MS))
+
+    def test_default_platforms_skip_unused_dependencies(self):
+        code = "import registry; registry.SOURCES.load('rescuegroups'); registry.POSTERS.load('bluesky')"
+        modules, total_ms = _import_profile(code)
+
+        for unused in ("instapy", "selenium", "asyncio", "adoption_sources.manual"):
+            self.assertNotIn(unused, modules)
+        self.assertLess(total_ms, _budget(PLATFORM_IMPORT_BUDGET_MS))
+
+
+class LazyRegistryTests(unittest.TestCase):
+    def test_loads_registered_classes(self):
+        from adoption_sources.rescue_groups import SourceRescueGroupsFanOut
+        from social_posters.debug import PosterDebug
+
+        self.assertIs(SOURCES.load("rescuegroups"), SourceRescueGroupsFanOut)
+        self.assertIs(POSTERS.load("debug"), PosterDebug)
+        self.assertIn("instagram", POSTERS)
+
+    def test_unknown_name_raises(self):
+        with self.assertRaises(ValueError):
+            POSTERS.load("myspace")
+
+    def test_register_adds_entries(self):
+        registry = LazyRegistry("thing", {})
+        registry.register("ordered", "collections:OrderedDict")
+
+        from collections import OrderedDict
+
+        self.assertIs(registry.load("ordered"), OrderedDict)
+        self.assertEqual(registry.names(), ["ordered"])
+
+
+if __name__ == "__main__":
+    unittest.main()